@@ -0,0 +1,44 @@
+import argparse
+
+from benchmarks.common import measure, print_row
+from src.interpreter.executor import ProgramExecutor
+from src.optimizer.cast_resolution import resolve_casts
+
+CASTS = """
+string describe(int value){{
+    return "value=" + value to string + ", half=" + (value to float / 2.0) to string;
+}}
+void main(){{
+    i = 0;
+    total = 0;
+    text = "";
+    while(i < {n}){{
+        text = describe(i);
+        total = total + (i to string) to int + (i % 2 == 0) to int + (i to float) to int;
+        i = i + 1;
+    }}
+    print(total, text);
+}}
+"""
+
+VARIANTS = {
+    "generic": (lambda: ProgramExecutor(quicken=False), None),
+    "quickened": (lambda: ProgramExecutor(), None),
+    "resolved": (lambda: ProgramExecutor(quicken=False), resolve_casts),
+    "both": (lambda: ProgramExecutor(), resolve_casts),
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cast-heavy benchmark: generic, quickened and statically resolved casts")
+    parser.add_argument("--iterations", type=int, nargs="*", default=[10_000, 50_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    for n in args.iterations:
+        for variant, (factory, prepare) in VARIANTS.items():
+            print_row(f"casts({n})", variant, *measure(CASTS.format(n=n), factory, args.repeat, prepare))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+import argparse
+
+from benchmarks.common import measure, print_row
+from src.interpreter.executor import ProgramExecutor
+from src.interpreter.stack_executor import StackExecutor
+
+GUARDED_LOOP = """
+int step(int value){{
+    return value % 7 + 1;
+}}
+void main(){{
+    total = 0;
+    try{{
+        i = 0;
+        while(i < {n}){{
+            total = total + step(i) * 2 - 1;
+            i = i + 1;
+        }}
+    }}catch(BasicException e){{
+        print(e.message);
+    }}
+    print(total);
+}}
+"""
+
+DEEP_THROWS = """
+int descend(int depth){{
+    if(depth == 0){{
+        throw BasicException("bottom");
+    }}
+    return descend(depth - 1) + 1;
+}}
+void main(){{
+    caught = 0;
+    i = 0;
+    while(i < {n}){{
+        try{{
+            descend(20);
+        }}catch(BasicException e){{
+            caught = caught + 1;
+        }}
+        i = i + 1;
+    }}
+    print(caught);
+}}
+"""
+
+VARIANTS = {
+    "guarded": (GUARDED_LOOP, 1),
+    "deep throws": (DEEP_THROWS, 100),
+}
+
+ENGINES = {
+    "tree": lambda: ProgramExecutor(),
+    "stack": lambda: StackExecutor(),
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Exceptions: loops guarded by try and throws unwinding deep calls")
+    parser.add_argument("--iterations", type=int, nargs="*", default=[100_000, 300_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    for n in args.iterations:
+        for engine, factory in ENGINES.items():
+            for variant, (code, divisor) in VARIANTS.items():
+                iterations = n // divisor
+                print_row(f"{variant}({iterations})", engine, *measure(code.format(n=iterations), factory, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+import argparse
+import contextlib
+import os
+import tempfile
+
+from benchmarks.common import measure, print_row
+from src.interpreter.executor import ProgramExecutor
+from src.interpreter.files import FileTable
+from src.interpreter.input_source import StreamInput
+
+LINE = "2024-01-01,sensor-17,23.5,ok\n"
+
+INPUT_LOOP = """
+void main(){{
+    count = 0;
+    total = 0;
+    while(count < {lines}){{
+        total = total + len(input());
+        count = count + 1;
+    }}
+    print(count, total);
+}}
+"""
+
+LINES_LOOP = """
+void main(){{
+    count = 0;
+    total = 0;
+    for (line in lines("{path}")){{
+        total = total + len(line);
+        count = count + 1;
+    }}
+    print(count, total);
+}}
+"""
+
+READ_LINE_LOOP = """
+void main(){{
+    count = 0;
+    total = 0;
+    file = open("{path}", "r");
+    while(!eof(file)){{
+        total = total + len(read_line(file));
+        count = count + 1;
+    }}
+    close(file);
+    print(count, total);
+}}
+"""
+
+
+def write_file(path: str, megabytes: int) -> int:
+    lines = (megabytes << 20) // len(LINE)
+    chunk = LINE * 10_000
+    with open(path, "w", newline="") as file:
+        for _ in range(lines // 10_000):
+            file.write(chunk)
+        file.write(LINE * (lines % 10_000))
+    return lines
+
+
+def variants(path: str, opened: contextlib.ExitStack) -> dict:
+    return {
+        "input": (INPUT_LOOP,
+                  lambda: ProgramExecutor(input_provider=StreamInput(opened.enter_context(open(path, "rb"))))),
+        "lines": (LINES_LOOP, lambda: ProgramExecutor()),
+        "lines-mmap": (LINES_LOOP, lambda: ProgramExecutor(files=FileTable(mapped=True))),
+        "read_line": (READ_LINE_LOOP, lambda: ProgramExecutor()),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="File throughput: input() from a stream, lines() and read_line()")
+    parser.add_argument("--megabytes", type=int, nargs="*", default=[64, 1024])
+    parser.add_argument("--repeat", type=int, default=1)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "input.csv")
+        for megabytes in args.megabytes:
+            lines = write_file(path, megabytes)
+            with contextlib.ExitStack() as opened:
+                for variant, (code, factory) in variants(path, opened).items():
+                    source = code.format(lines=lines, path=path.replace("\\", "\\\\"))
+                    seconds, output = measure(source, factory, args.repeat)
+                    throughput = f"{megabytes / seconds:.1f} MB/s {output}"
+                    print_row(f"file({megabytes} MB) {variant}", "tree", seconds, throughput)
+
+
+if __name__ == "__main__":
+    main()
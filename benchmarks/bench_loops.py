@@ -0,0 +1,55 @@
+import argparse
+
+from benchmarks.common import measure, print_row
+from src.interpreter.executor import ProgramExecutor
+from src.interpreter.stack_executor import StackExecutor
+from src.optimizer.counted_loops import rewrite_counted_loops
+
+WHILE_LOOP = """
+void main(){{
+    total = 0;
+    i = 0;
+    while(i < {n}){{
+        total = total + i % 7;
+        i = i + 1;
+    }}
+    print(total, i);
+}}
+"""
+
+FOR_RANGE = """
+void main(){{
+    total = 0;
+    for (i in 0..{n}){{
+        total = total + i % 7;
+    }}
+    print(total, i);
+}}
+"""
+
+VARIANTS = {
+    "while": (WHILE_LOOP, None),
+    "rewritten": (WHILE_LOOP, rewrite_counted_loops),
+    "range": (FOR_RANGE, None),
+}
+
+ENGINES = {
+    "tree": lambda: ProgramExecutor(),
+    "stack": lambda: StackExecutor(),
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Counted loops: while loops, rewritten while loops and for-range loops")
+    parser.add_argument("--iterations", type=int, nargs="*", default=[100_000, 500_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    for n in args.iterations:
+        for engine, factory in ENGINES.items():
+            for variant, (code, prepare) in VARIANTS.items():
+                print_row(f"loop({n}) {variant}", engine, *measure(code.format(n=n), factory, args.repeat, prepare))
+
+
+if __name__ == "__main__":
+    main()
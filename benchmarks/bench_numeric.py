@@ -0,0 +1,53 @@
+import argparse
+
+from benchmarks.common import measure, print_row
+from src.interpreter.executor import ProgramExecutor
+from src.interpreter.numeric import NUMERIC_MODES
+
+FLOATS = """
+void main(){{
+    i = 0;
+    x = 0.5;
+    total = 0.0;
+    while(i < {n}){{
+        x = x * 2.5 * (1.0 - x);
+        total = total + x * x - x / 4.0;
+        i = i + 1;
+    }}
+    print(total, x);
+}}
+"""
+
+INTEGERS = """
+void main(){{
+    i = 0;
+    total = 0;
+    while(i < {n}){{
+        total = (total + i * i - i / 3) % 1000003;
+        i = i + 1;
+    }}
+    print(total);
+}}
+"""
+
+PROGRAMS = {
+    "floats": FLOATS,
+    "integers": INTEGERS,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Arithmetic-heavy benchmark: strict and fast numeric modes")
+    parser.add_argument("--iterations", type=int, nargs="*", default=[20_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    for n in args.iterations:
+        for name, code in PROGRAMS.items():
+            for mode in NUMERIC_MODES:
+                print_row(f"{name}({n})", mode, *measure(code.format(n=n), lambda: ProgramExecutor(numeric_mode=mode),
+                                                         args.repeat))
+
+
+if __name__ == "__main__":
+    main()
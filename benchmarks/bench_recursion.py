@@ -0,0 +1,55 @@
+import argparse
+import sys
+
+from benchmarks.common import measure, print_row
+from src.interpreter.executor import ProgramExecutor
+from src.interpreter.stack_executor import StackExecutor
+
+FIBONACCI = """
+int fibonacci(int n){{
+    if(n<3){{
+        return 1;
+    }}
+    return fibonacci(n-2)+fibonacci(n-1);
+}}
+void main(){{
+    print(fibonacci({n}));
+}}
+"""
+
+COUNTDOWN = """
+int countdown(int n){{
+    if (n == 0){{
+        return 0;
+    }}
+    return countdown(n - 1) + 1;
+}}
+void main(){{
+    print(countdown({n}));
+}}
+"""
+
+ENGINES = {
+    "tree": lambda: ProgramExecutor(recursion_limit=1_000_000),
+    "stack": lambda: StackExecutor(recursion_limit=1_000_000),
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Recursion benchmark: tree-walking vs explicit-stack engine")
+    parser.add_argument("--fibonacci", type=int, nargs="*", default=[15, 20])
+    parser.add_argument("--countdown", type=int, nargs="*", default=[100, 500, 10_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    sys.setrecursionlimit(10_000)
+    for n in args.fibonacci:
+        for engine, factory in ENGINES.items():
+            print_row(f"fibonacci({n})", engine, *measure(FIBONACCI.format(n=n), factory, args.repeat))
+    for n in args.countdown:
+        for engine, factory in ENGINES.items():
+            print_row(f"countdown({n})", engine, *measure(COUNTDOWN.format(n=n), factory, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+import argparse
+
+from benchmarks.common import measure, print_row
+from src.interpreter.executor import ProgramExecutor
+
+APPENDS = """
+void main(){{
+    i = 0;
+    s = "";
+    while(i < {n}){{
+        s = s + (i % 10) to string;
+        i = i + 1;
+    }}
+    print(s == "");
+}}
+"""
+
+VARIANTS = {
+    "ropes": lambda: ProgramExecutor(ropes=True),
+    "strings": lambda: ProgramExecutor(ropes=False),
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="String accumulation benchmark: ropes and immutable strings")
+    parser.add_argument("--iterations", type=int, nargs="*", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--repeat", type=int, default=1)
+    args = parser.parse_args()
+
+    for n in args.iterations:
+        for variant, factory in VARIANTS.items():
+            print_row(f"appends({n})", variant, *measure(APPENDS.format(n=n), factory, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+import argparse
+
+from benchmarks.common import measure, print_row
+from src.interpreter.executor import ProgramExecutor
+
+SETUP = """
+void main(){{
+    a = array({n}, 3);
+    b = array({n}, 1);
+    {body}
+    print(sum(c));
+}}
+"""
+
+LOOP = """
+    c = array({n}, 0);
+    i = 0;
+    while(i < {n}){{
+        c[i] = a[i] * 2 + b[i];
+        i = i + 1;
+    }}
+"""
+
+VECTOR = """
+    c = a * 2 + b;
+"""
+
+VARIANTS = {
+    "loop": LOOP,
+    "vector": VECTOR,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Array arithmetic: interpreter loop and vector expression")
+    parser.add_argument("--iterations", type=int, nargs="*", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    for n in args.iterations:
+        for variant, body in VARIANTS.items():
+            code = SETUP.format(n=n, body=body.format(n=n))
+            print_row(f"a * 2 + b ({n})", variant, *measure(code, ProgramExecutor, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+import contextlib
+import io
+import time
+from typing import Callable, Optional
+
+from src.ast.core_structures import Program
+from src.interpreter.executor import ProgramExecutor
+from src.lexer.lexer import DefaultLexer
+from src.lexer.source import Source
+from src.parser.parser import Parser
+
+
+def parse_program(code: str):
+    return Parser(DefaultLexer(Source(io.StringIO(code)))).get_program()
+
+
+def measure(code: str,
+            executor_factory: Callable[[], ProgramExecutor],
+            repeat: int = 3,
+            prepare: Optional[Callable[[Program], object]] = None) -> tuple[float, str]:
+    best = float("inf")
+    output = ""
+    for _ in range(repeat):
+        program = parse_program(code)
+        if prepare is not None:
+            prepare(program)
+        executor = executor_factory()
+        buffer = io.StringIO()
+        start = time.perf_counter()
+        try:
+            with contextlib.redirect_stdout(buffer):
+                executor.execute(program)
+        except (RecursionError, Exception) as e:
+            return float("nan"), type(e).__name__
+        best = min(best, time.perf_counter() - start)
+        output = buffer.getvalue().strip()
+    return best, output
+
+
+def print_row(name: str, engine: str, seconds: float, output: str):
+    print(f"{name:<28} {engine:<8} {seconds:>10.4f}s  {output[:40]}")
@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING
+from typing import Optional, TYPE_CHECKING
 
 from src.ast.statemens import StatementBlock, Parameter, Attribute
 from dataclasses import dataclass
@@ -26,8 +26,8 @@ class Function(Node):
                 self.return_type == other.return_type and
                 self.statement_block == other.statement_block)
 
-    def accept(self, visitor: 'Visitor'):
-        visitor.visit_function(self)
+    def accept(self, visitor: 'Visitor', arguments: Optional[list] = None, call_position: Optional[Position] = None):
+        return visitor.visit_function(self, arguments, call_position)
 
 
 @dataclass
@@ -43,8 +43,8 @@ class CustomException(Node):
                 self.parameters == other.parameters and
                 self.attributes == other.attributes)
 
-    def accept(self, visitor: 'Visitor'):
-        visitor.visit_exception(self)
+    def accept(self, visitor: 'Visitor', arguments: Optional[list] = None, throw_position: Optional[Position] = None):
+        return visitor.visit_exception(self, arguments, throw_position)
 
 
 @dataclass
@@ -57,4 +57,4 @@ class Program(Node):
                 self.exceptions == other.exceptions)
 
     def accept(self, visitor: 'Visitor'):
-        visitor.visit_program(self)
+        return visitor.visit_program(self)
@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 from src.ast.position import Position
-from src.ast.types import Type
+from src.ast.types import Type, MapType
 from src.ast.node import Node
 
 if TYPE_CHECKING:
@@ -26,7 +26,7 @@ class OrExpression(Expression):
                 self.right == other.right)
 
     def accept(self, visitor: 'Visitor'):
-        visitor.visit_or_expression(self)
+        return visitor.visit_or_expression(self)
 
 
 @dataclass
@@ -39,7 +39,7 @@ class AndExpression(Expression):
                 self.right == other.right)
 
     def accept(self, visitor: 'Visitor'):
-        visitor.visit_and_expression(self)
+        return visitor.visit_and_expression(self)
 
 
 @dataclass
@@ -52,7 +52,7 @@ class CastedExpression(Expression):
                 self.to_type == other.to_type)
 
     def accept(self, visitor: 'Visitor'):
-        visitor.visit_casted_expression(self)
+        return visitor.visit_casted_expression(self)
 
 
 @dataclass
@@ -63,7 +63,7 @@ class NegatedExpression(Expression):
         return self.expression == other.expression
 
     def accept(self, visitor: 'Visitor'):
-        visitor.visit_negated_expression(self)
+        return visitor.visit_negated_expression(self)
 
 
 @dataclass
@@ -74,7 +74,7 @@ class UnaryMinusExpression(Expression):
         return self.expression == other.expression
 
     def accept(self, visitor: 'Visitor'):
-        visitor.visit_unary_minus_expression(self)
+        return visitor.visit_unary_minus_expression(self)
 
 
 @dataclass
@@ -91,37 +91,37 @@ class RelationalExpression(Expression):
 @dataclass
 class EqualsExpression(RelationalExpression):
     def accept(self, visitor: 'Visitor'):
-        visitor.visit_equals_expression(self)
+        return visitor.visit_equals_expression(self)
 
 
 @dataclass
 class NotEqualsExpression(RelationalExpression):
     def accept(self, visitor: 'Visitor'):
-        visitor.visit_not_equals_expression(self)
+        return visitor.visit_not_equals_expression(self)
 
 
 @dataclass
 class LessThanExpression(RelationalExpression):
     def accept(self, visitor: 'Visitor'):
-        visitor.visit_less_than_expression(self)
+        return visitor.visit_less_than_expression(self)
 
 
 @dataclass
 class LessThanOrEqualsExpression(RelationalExpression):
     def accept(self, visitor: 'Visitor'):
-        visitor.visit_less_than_or_equals_expression(self)
+        return visitor.visit_less_than_or_equals_expression(self)
 
 
 @dataclass
 class GreaterThanExpression(RelationalExpression):
     def accept(self, visitor: 'Visitor'):
-        visitor.visit_greater_than_expression(self)
+        return visitor.visit_greater_than_expression(self)
 
 
 @dataclass
 class GreaterThanOrEqualsExpression(RelationalExpression):
     def accept(self, visitor: 'Visitor'):
-        visitor.visit_greater_than_or_equals_expression(self)
+        return visitor.visit_greater_than_or_equals_expression(self)
 
 
 @dataclass
@@ -138,13 +138,13 @@ class AdditiveExpression(Expression):
 @dataclass
 class MinusExpression(AdditiveExpression):
     def accept(self, visitor: 'Visitor'):
-        visitor.visit_minus_expression(self)
+        return visitor.visit_minus_expression(self)
 
 
 @dataclass
 class PlusExpression(AdditiveExpression):
     def accept(self, visitor: 'Visitor'):
-        visitor.visit_plus_expression(self)
+        return visitor.visit_plus_expression(self)
 
 
 @dataclass
@@ -161,19 +161,62 @@ class MultiplicativeExpression(Expression):
 @dataclass
 class MultiplyExpression(MultiplicativeExpression):
     def accept(self, visitor: 'Visitor'):
-        visitor.visit_multiply_expression(self)
+        return visitor.visit_multiply_expression(self)
 
 
 @dataclass
 class DivideExpression(MultiplicativeExpression):
     def accept(self, visitor: 'Visitor'):
-        visitor.visit_divide_expression(self)
+        return visitor.visit_divide_expression(self)
 
 
 @dataclass
 class ModuloExpression(MultiplicativeExpression):
     def accept(self, visitor: 'Visitor'):
-        visitor.visit_modulo_expression(self)
+        return visitor.visit_modulo_expression(self)
+
+
+@dataclass
+class InvariantExpression(Expression):
+    expression: Expression
+    slot: int
+
+    def __eq__(self, other):
+        return (isinstance(other, InvariantExpression) and
+                self.expression == other.expression)
+
+    def accept(self, visitor: 'Visitor'):
+        return visitor.visit_invariant_expression(self)
+
+
+@dataclass
+class InlinedCall(Expression):
+    name: str
+    arguments: list[Expression]
+    body: Expression
+    return_type: Type
+
+    def __eq__(self, other):
+        return (isinstance(other, InlinedCall) and
+                self.name == other.name and
+                self.arguments == other.arguments and
+                self.body == other.body)
+
+    def accept(self, visitor: 'Visitor'):
+        return visitor.visit_inlined_call(self)
+
+
+@dataclass
+class InlinedParameter(Expression):
+    name: str
+    index: int
+
+    def __eq__(self, other):
+        return (isinstance(other, InlinedParameter) and
+                self.index == other.index)
+
+    def accept(self, visitor: 'Visitor'):
+        return visitor.visit_inlined_parameter(self)
 
 
 @dataclass
@@ -186,7 +229,20 @@ class AttributeCall(Expression):
                 self.attr_name == other.attr_name)
 
     def accept(self, visitor: 'Visitor'):
-        visitor.visit_attribute_call(self)
+        return visitor.visit_attribute_call(self)
+
+
+@dataclass
+class IndexExpression(Expression):
+    array: Expression
+    index: Expression
+
+    def __eq__(self, other):
+        return (self.array == other.array and
+                self.index == other.index)
+
+    def accept(self, visitor: 'Visitor'):
+        return visitor.visit_index_expression(self)
 
 
 @dataclass
@@ -197,7 +253,7 @@ class Variable(Expression):
         return self.name == other.name
 
     def accept(self, visitor: 'Visitor'):
-        visitor.visit_variable(self)
+        return visitor.visit_variable(self)
 
 
 @dataclass
@@ -208,7 +264,7 @@ class BoolLiteral(Expression):
         return self.value == other.value
 
     def accept(self, visitor: 'Visitor'):
-        visitor.visit_bool_literal(self)
+        return visitor.visit_bool_literal(self)
 
 
 @dataclass
@@ -219,7 +275,7 @@ class FloatLiteral(Expression):
         return self.value == other.value
 
     def accept(self, visitor: 'Visitor'):
-        visitor.visit_float_literal(self)
+        return visitor.visit_float_literal(self)
 
 
 @dataclass
@@ -230,7 +286,7 @@ class IntLiteral(Expression):
         return self.value == other.value
 
     def accept(self, visitor: 'Visitor'):
-        visitor.visit_int_literal(self)
+        return visitor.visit_int_literal(self)
 
 
 @dataclass
@@ -241,4 +297,17 @@ class StringLiteral(Expression):
         return self.value == other.value
 
     def accept(self, visitor: 'Visitor'):
-        visitor.visit_string_literal(self)
+        return visitor.visit_string_literal(self)
+
+
+@dataclass
+class MapLiteral(Expression):
+    map_type: MapType
+    entries: list[tuple[Expression, Expression]]
+
+    def __eq__(self, other):
+        return (self.map_type == other.map_type and
+                self.entries == other.entries)
+
+    def accept(self, visitor: 'Visitor'):
+        return visitor.visit_map_literal(self)
@@ -0,0 +1,88 @@
+from typing import TYPE_CHECKING
+
+from src.ast.expressions import *
+
+if TYPE_CHECKING:
+    from src.ast.visitor import Visitor
+
+
+class QuickenedArithmeticExpression(Expression):
+    def accept(self, visitor: 'Visitor'):
+        return visitor.visit_quickened_arithmetic(self)
+
+
+class QuickenedComparison(RelationalExpression):
+    def accept(self, visitor: 'Visitor'):
+        return visitor.visit_quickened_comparison(self)
+
+
+class QuickenedCastedExpression(CastedExpression):
+    def accept(self, visitor: 'Visitor'):
+        return visitor.visit_quickened_cast(self)
+
+
+class ResolvedCastedExpression(CastedExpression):
+    def accept(self, visitor: 'Visitor'):
+        return visitor.visit_resolved_cast(self)
+
+
+class QuickPlusExpression(QuickenedArithmeticExpression, PlusExpression):
+    pass
+
+
+class QuickMinusExpression(QuickenedArithmeticExpression, MinusExpression):
+    pass
+
+
+class QuickMultiplyExpression(QuickenedArithmeticExpression, MultiplyExpression):
+    pass
+
+
+class QuickDivideExpression(QuickenedArithmeticExpression, DivideExpression):
+    pass
+
+
+class QuickModuloExpression(QuickenedArithmeticExpression, ModuloExpression):
+    pass
+
+
+class QuickEqualsExpression(QuickenedComparison, EqualsExpression):
+    pass
+
+
+class QuickNotEqualsExpression(QuickenedComparison, NotEqualsExpression):
+    pass
+
+
+class QuickLessThanExpression(QuickenedComparison, LessThanExpression):
+    pass
+
+
+class QuickLessThanOrEqualsExpression(QuickenedComparison, LessThanOrEqualsExpression):
+    pass
+
+
+class QuickGreaterThanExpression(QuickenedComparison, GreaterThanExpression):
+    pass
+
+
+class QuickGreaterThanOrEqualsExpression(QuickenedComparison, GreaterThanOrEqualsExpression):
+    pass
+
+
+QUICKENED_NODES = {
+    PlusExpression: QuickPlusExpression,
+    MinusExpression: QuickMinusExpression,
+    MultiplyExpression: QuickMultiplyExpression,
+    DivideExpression: QuickDivideExpression,
+    ModuloExpression: QuickModuloExpression,
+    EqualsExpression: QuickEqualsExpression,
+    NotEqualsExpression: QuickNotEqualsExpression,
+    LessThanExpression: QuickLessThanExpression,
+    LessThanOrEqualsExpression: QuickLessThanOrEqualsExpression,
+    GreaterThanExpression: QuickGreaterThanExpression,
+    GreaterThanOrEqualsExpression: QuickGreaterThanOrEqualsExpression,
+    CastedExpression: QuickenedCastedExpression,
+}
+GENERIC_NODES = {quickened: generic for generic, quickened in QUICKENED_NODES.items()}
+GENERIC_NODES[ResolvedCastedExpression] = CastedExpression
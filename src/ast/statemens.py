@@ -1,4 +1,4 @@
-from typing import List, Tuple, Optional, TYPE_CHECKING
+from typing import Any, Dict, List, Tuple, Optional, TYPE_CHECKING
 
 from src.ast.expressions import Expression
 from src.ast.types import Type
@@ -21,12 +21,13 @@ class Statement(Node):
 @dataclass
 class StatementBlock(Node):
     statements: List[Statement]
+    needs_scope: bool = True
 
     def __eq__(self, other):
         return self.statements == other.statements
 
     def accept(self, visitor: 'Visitor'):
-        visitor.visit_statement_block(self)
+        return visitor.visit_statement_block(self)
 
 
 @dataclass
@@ -47,20 +48,54 @@ class IfStatement(Statement):
         )
 
     def accept(self, visitor: 'Visitor'):
-        visitor.visit_if_statement(self)
+        return visitor.visit_if_statement(self)
 
 
 @dataclass
 class WhileStatement(Statement):
     condition: Expression
     block: StatementBlock
+    invariant_slots: List[int] = field(default_factory=list)
 
     def __eq__(self, other):
         return (self.condition == other.condition and
                 self.block == other.block)
 
     def accept(self, visitor: 'Visitor'):
-        visitor.visit_while_statement(self)
+        return visitor.visit_while_statement(self)
+
+
+@dataclass
+class ForStatement(Statement):
+    variable: str
+    iterable: Expression
+    block: StatementBlock
+
+    def __eq__(self, other):
+        return (self.variable == other.variable and
+                self.iterable == other.iterable and
+                self.block == other.block)
+
+    def accept(self, visitor: 'Visitor'):
+        return visitor.visit_for_statement(self)
+
+
+@dataclass
+class ForRangeStatement(Statement):
+    variable: str
+    start: Expression
+    end: Expression
+    block: StatementBlock
+    invariant_slots: List[int] = field(default_factory=list)
+
+    def __eq__(self, other):
+        return (self.variable == other.variable and
+                self.start == other.start and
+                self.end == other.end and
+                self.block == other.block)
+
+    def accept(self, visitor: 'Visitor'):
+        return visitor.visit_for_range_statement(self)
 
 
 @dataclass
@@ -72,7 +107,7 @@ class BreakStatement(Statement):
         return "break"
 
     def accept(self, visitor: 'Visitor'):
-        visitor.visit_break_statement(self)
+        return visitor.visit_break_statement(self)
 
 
 @dataclass
@@ -84,7 +119,7 @@ class ContinueStatement(Statement):
         return "continue"
 
     def accept(self, visitor: 'Visitor'):
-        visitor.visit_continue_statement(self)
+        return visitor.visit_continue_statement(self)
 
 
 @dataclass
@@ -97,7 +132,22 @@ class AssignmentStatement(Statement):
                 self.name == other.name)
 
     def accept(self, visitor: 'Visitor'):
-        visitor.visit_assignment_statement(self)
+        return visitor.visit_assignment_statement(self)
+
+
+@dataclass
+class IndexAssignmentStatement(Statement):
+    name: str
+    index: Expression
+    expression: Expression
+
+    def __eq__(self, other):
+        return (self.name == other.name and
+                self.index == other.index and
+                self.expression == other.expression)
+
+    def accept(self, visitor: 'Visitor'):
+        return visitor.visit_index_assignment_statement(self)
 
 
 @dataclass
@@ -110,19 +160,20 @@ class FunctionCall(Expression, Statement):
                 self.arguments == other.arguments)
 
     def accept(self, visitor: 'Visitor'):
-        visitor.visit_function_call(self)
+        return visitor.visit_function_call(self)
 
 
 @dataclass
 class ReturnStatement(Statement):
     expression: Expression
+    tail_call: bool = False
 
     def __eq__(self, other):
         return (self.position == other.position and
                 self.expression == other.expression)
 
     def accept(self, visitor: 'Visitor'):
-        visitor.visit_return_statement(self)
+        return visitor.visit_return_statement(self)
 
 
 @dataclass
@@ -138,7 +189,7 @@ class Attribute:
                 self.expression == other.expression)
 
     def accept(self, visitor: 'Visitor'):
-        visitor.visit_attribute(self)
+        return visitor.visit_attribute(self)
 
 
 @dataclass
@@ -164,21 +215,22 @@ class CatchStatement(Statement):
                 self.block == other.block and
                 self.name == other.name)
 
-    def accept(self, visitor: 'Visitor'):
-        visitor.visit_catch_statement(self)
+    def accept(self, visitor: 'Visitor', exception: Optional[Any] = None):
+        return visitor.visit_catch_statement(self, exception)
 
 
 @dataclass
 class TryCatchStatement(Statement):
     try_block: StatementBlock
     catch_statements: List[CatchStatement]
+    catch_table: Dict[str, CatchStatement] = field(default_factory=dict)
 
     def __eq__(self, other):
         return (self.try_block == other.try_block and
                 self.catch_statements == other.catch_statements)
 
     def accept(self, visitor: 'Visitor'):
-        visitor.visit_try_catch_statement(self)
+        return visitor.visit_try_catch_statement(self)
 
 
 @dataclass
@@ -191,4 +243,4 @@ class ThrowStatement(Statement):
                 self.args == other.args)
 
     def accept(self, visitor: 'Visitor'):
-        visitor.visit_throw_statement(self)
+        return visitor.visit_throw_statement(self)
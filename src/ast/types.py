@@ -1,3 +1,4 @@
+from dataclasses import dataclass
 from enum import Enum, auto
 
 
@@ -7,12 +8,24 @@ class Type(Enum):
     BoolType = auto()
     StringType = auto()
     VoidType = auto()
+    IntArrayType = auto()
+    FloatArrayType = auto()
+    LineStreamType = auto()
 
     def __eq__(self, other):
-        return self.value == other.value
+        return isinstance(other, Type) and self.value == other.value
 
     def __hash__(self):
         return hash(self.value)
 
     def __str__(self):
         return self.name
+
+
+@dataclass(frozen=True)
+class MapType:
+    key_type: Type
+    value_type: Type
+
+    def __str__(self):
+        return f"map<{self.key_type}, {self.value_type}>"
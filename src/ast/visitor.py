@@ -1,13 +1,18 @@
 from abc import ABC, abstractmethod
+from typing import Any, Optional
 
 from src.ast.core_structures import Program, Function, CustomException
 from src.ast.expressions import OrExpression, AndExpression, CastedExpression, \
     AttributeCall, Variable, BoolLiteral, FloatLiteral, StringLiteral, \
     IntLiteral, GreaterThanExpression, EqualsExpression, NotEqualsExpression, LessThanExpression, \
     LessThanOrEqualsExpression, GreaterThanOrEqualsExpression, MinusExpression, PlusExpression, ModuloExpression, \
-    DivideExpression, MultiplyExpression, NegatedExpression, UnaryMinusExpression
+    DivideExpression, MultiplyExpression, NegatedExpression, UnaryMinusExpression, InvariantExpression, \
+    InlinedCall, InlinedParameter, IndexExpression, MapLiteral
+from src.ast.position import Position
+from src.ast.quickened import QuickenedArithmeticExpression, QuickenedComparison, QuickenedCastedExpression, \
+    ResolvedCastedExpression, GENERIC_NODES
 from src.ast.statemens import Statement, StatementBlock, Attribute, IfStatement, ReturnStatement, TryCatchStatement, \
-    CatchStatement, AssignmentStatement, \
+    CatchStatement, AssignmentStatement, IndexAssignmentStatement, ForStatement, ForRangeStatement, \
     BreakStatement, ContinueStatement, FunctionCall
 from src.interpreter.builtins import BuiltinFunction, BuiltinException
 
@@ -18,11 +23,13 @@ class Visitor(ABC):
         pass
 
     @abstractmethod
-    def visit_function(self, function: Function):
+    def visit_function(self, function: Function, arguments: Optional[list] = None,
+                       call_position: Optional[Position] = None):
         pass
 
     @abstractmethod
-    def visit_exception(self, exception: CustomException):
+    def visit_exception(self, exception: CustomException, arguments: Optional[list] = None,
+                        throw_position: Optional[Position] = None):
         pass
 
     @abstractmethod
@@ -46,13 +53,21 @@ class Visitor(ABC):
         pass
 
     @abstractmethod
-    def visit_catch_statement(self, catch_statement: CatchStatement):
+    def visit_catch_statement(self, catch_statement: CatchStatement, exception: Optional[Any] = None):
         pass
 
     @abstractmethod
     def visit_while_statement(self, statement: Statement):
         pass
 
+    @abstractmethod
+    def visit_for_statement(self, for_statement: ForStatement):
+        pass
+
+    @abstractmethod
+    def visit_for_range_statement(self, for_range_statement: ForRangeStatement):
+        pass
+
     @abstractmethod
     def visit_throw_statement(self, statement: Statement):
         pass
@@ -65,6 +80,10 @@ class Visitor(ABC):
     def visit_assignment_statement(self, assigment_statement: AssignmentStatement):
         pass
 
+    @abstractmethod
+    def visit_index_assignment_statement(self, index_assignment_statement: IndexAssignmentStatement):
+        pass
+
     @abstractmethod
     def visit_or_expression(self, or_expression: OrExpression):
         pass
@@ -85,10 +104,30 @@ class Visitor(ABC):
     def visit_unary_minus_expression(self, unary_minus_expression: UnaryMinusExpression):
         pass
 
+    @abstractmethod
+    def visit_invariant_expression(self, invariant_expression: InvariantExpression):
+        pass
+
+    @abstractmethod
+    def visit_inlined_call(self, inlined_call: InlinedCall):
+        pass
+
+    @abstractmethod
+    def visit_inlined_parameter(self, inlined_parameter: InlinedParameter):
+        pass
+
     @abstractmethod
     def visit_attribute_call(self, attribute_call: AttributeCall):
         pass
 
+    @abstractmethod
+    def visit_index_expression(self, index_expression: IndexExpression):
+        pass
+
+    @abstractmethod
+    def visit_map_literal(self, map_literal: MapLiteral):
+        pass
+
     @abstractmethod
     def visit_variable(self, variable: Variable):
         pass
@@ -162,9 +201,23 @@ class Visitor(ABC):
         pass
 
     @abstractmethod
-    def visit_builtin_function(self, builtin_function: BuiltinFunction):
+    def visit_builtin_function(self, builtin_function: BuiltinFunction, arguments: Optional[list] = None,
+                               call_position: Optional[Position] = None):
         pass
 
     @abstractmethod
-    def visit_builtin_exception(self, builtin_exception: BuiltinException):
+    def visit_builtin_exception(self, builtin_exception: BuiltinException, arguments: Optional[list] = None,
+                                throw_position: Optional[Position] = None):
         pass
+
+    def visit_quickened_arithmetic(self, expression: QuickenedArithmeticExpression):
+        return GENERIC_NODES[type(expression)].accept(expression, self)
+
+    def visit_quickened_comparison(self, expression: QuickenedComparison):
+        return GENERIC_NODES[type(expression)].accept(expression, self)
+
+    def visit_quickened_cast(self, expression: QuickenedCastedExpression):
+        return GENERIC_NODES[type(expression)].accept(expression, self)
+
+    def visit_resolved_cast(self, expression: ResolvedCastedExpression):
+        return GENERIC_NODES[type(expression)].accept(expression, self)
@@ -126,3 +126,33 @@ class ValueOverflowError(InterpreterError):
     def __init__(self, value: float | int, position: Position):
         message = f'Value {value} exceeds allowed maximum of {sys.maxsize} at {position}'
         super().__init__(message)
+
+
+class InvalidArgumentError(InterpreterError):
+    def __init__(self, name: str, reason: str, position: Position):
+        message = f'Invalid argument in call of "{name}": {reason} at {position}'
+        super().__init__(message)
+
+
+class IndexOutOfRangeError(InterpreterError):
+    def __init__(self, index: int, length: int, position: Position):
+        message = f'Index {index} out of range for array of length {length} at {position}'
+        super().__init__(message)
+
+
+class KeyNotFoundError(InterpreterError):
+    def __init__(self, key, position: Position):
+        message = f'Key {key} not found in map at {position}'
+        super().__init__(message)
+
+
+class ArrayLengthMismatchError(InterpreterError):
+    def __init__(self, left_length: int, right_length: int, position: Position):
+        message = f'Arrays of different lengths {left_length} and {right_length} used in expression at {position}'
+        super().__init__(message)
+
+
+class EvaluationStackOverflowError(InterpreterError):
+    def __init__(self, stack_limit: int):
+        message = f'Evaluation stack exceeded the limit of {stack_limit} frames'
+        super().__init__(message)
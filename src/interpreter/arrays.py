@@ -0,0 +1,48 @@
+from array import array
+
+
+class TypedArray(array):
+    element_typecode = ""
+    element_type = None
+
+    def __new__(cls, values=()):
+        return super().__new__(cls, cls.element_typecode, values)
+
+    def __str__(self):
+        return f"[{', '.join(map(str, self))}]"
+
+
+class IntArray(TypedArray):
+    element_typecode = "q"
+    element_type = int
+
+
+class FloatArray(TypedArray):
+    element_typecode = "d"
+    element_type = float
+
+
+def new_array(size: int, value: int | float) -> TypedArray:
+    if size < 0:
+        raise ValueError("size must not be negative")
+    result = ARRAY_OF[type(value)]((value,))
+    result *= size
+    return result
+
+
+def fill(values: TypedArray, value: int | float):
+    values[:] = type(values)((value,)) * len(values)
+
+
+def copy(values: TypedArray) -> TypedArray:
+    return type(values)(values)
+
+
+def sort(values: TypedArray):
+    values[:] = type(values)(sorted(values))
+
+
+ARRAY_OF = {
+    int: IntArray,
+    float: FloatArray,
+}
@@ -1,30 +1,41 @@
-from typing import Any, Callable, Type, TYPE_CHECKING
+from typing import Any, Callable, Optional, Type, TYPE_CHECKING
 from abc import ABC
 from dataclasses import dataclass
 from src.ast.node import Node
 from src.ast.position import Position
+from src.ast.types import Type as ValueType
 if TYPE_CHECKING:
     from src.ast.visitor import Visitor
 
 class BasicException:
+    __slots__ = ("name", "attributes", "position")
+
     def __init__(self, position: Position, message: str = "Exception raised") -> None:
         self.name = "BasicException"
-        self.attributes = [("position",position), ("message",message)]
+        self.position = position
+        self.attributes = {"message": message}
+
+    def attribute(self, name: str):
+        if name == "position":
+            return self.attributes.setdefault("position", self.position)
+        return self.attributes.get(name)
 
     def __str__(self):
-        return f"Base exception at {self.attributes[0]}: {self.attributes[1]}"
+        return f"Base exception at {self.position}: {self.attributes['message']}"
 
 @dataclass
 class BuiltinFunction(Node, ABC):
     handler: Callable
+    name: str = ""
+    signatures: Optional[dict[tuple[ValueType, ...], ValueType]] = None
 
-    def accept(self, visitor: 'Visitor'):
-        visitor.visit_builtin_function(self)
+    def accept(self, visitor: 'Visitor', arguments: Optional[list] = None, call_position: Optional[Position] = None):
+        return visitor.visit_builtin_function(self, arguments, call_position)
 
 
 @dataclass
 class BuiltinException(Node, ABC):
     exception_object: Type[Any]
 
-    def accept(self, visitor: 'Visitor'):
-        visitor.visit_builtin_exception(self)
+    def accept(self, visitor: 'Visitor', arguments: Optional[list] = None, throw_position: Optional[Position] = None):
+        return visitor.visit_builtin_exception(self, arguments, throw_position)
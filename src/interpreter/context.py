@@ -1,5 +1,6 @@
 from typing import Optional
 
+from src.interpreter.builtins import BasicException
 from src.interpreter.scope import Scope
 
 value_types = int|float|str|bool
@@ -8,6 +9,20 @@ class FunctionContext:
     def __init__(self, function_name: str):
         self.function_name = function_name
         self.scope_stack = [Scope()]
+        self.return_value = None
+        self.tail_call = None
+        self.caller_return_types = []
+        self.invariants = {}
+        self.caught = {}
+        self.inline_arguments = []
+
+    def reuse(self, function_name: str):
+        self.function_name = function_name
+        self.scope_stack = [Scope()]
+        self.return_value = None
+        self.tail_call = None
+        self.invariants = {}
+        self.caught = {}
 
     def push_scope(self):
         self.scope_stack.append(Scope())
@@ -32,14 +47,24 @@ class FunctionContext:
                 return scope.get_variable(name)
         return None
 
-    def get_attribute(self, exception_id: str, attribute_name: str) -> Optional[value_types]:
+    def variable_scope(self, name: str) -> Optional[dict]:
         for scope in reversed(self.scope_stack):
-            if scope.contains_attribute(exception_id, attribute_name):
-                return scope.get_attribute(exception_id, attribute_name)
+            if scope.contains(name):
+                return scope.variables
         return None
 
-    def add_attribute(self, exception_id: str, attribute_name: str, value: value_types) -> bool:
-        if self.scope_stack[-1].contains_attribute(exception_id, attribute_name):
-            return False
-        self.scope_stack[-1].add_attribute(exception_id, attribute_name, value)
-        return True
\ No newline at end of file
+    def get_attribute(self, exception_id: str, attribute_name: str) -> Optional[value_types]:
+        if (exception := self.caught.get(exception_id)) is None:
+            return None
+        return exception.attribute(attribute_name)
+
+    def bind_exception(self, exception_id: str, exception: BasicException) -> Optional[BasicException]:
+        shadowed = self.caught.get(exception_id)
+        self.caught[exception_id] = exception
+        return shadowed
+
+    def unbind_exception(self, exception_id: str, shadowed: Optional[BasicException]):
+        if shadowed is None:
+            self.caught.pop(exception_id, None)
+        else:
+            self.caught[exception_id] = shadowed
@@ -1,27 +1,37 @@
 import io
 from operator import eq, ne, lt, le, gt, ge, add, mul, sub, mod
-from typing import Callable
+from typing import Any, Callable, Iterable, Optional
 
 from src.ast.core_structures import Program, Function, CustomException
+from src.ast.node import Node
 from src.ast.expressions import *
+from src.ast.quickened import *
 from src.ast.statemens import *
 from src.ast.visitor import Visitor
 from src.errors.interpreter_errors import *
+from src.interpreter.arrays import TypedArray, IntArray, FloatArray
 from src.interpreter.builtins import BuiltinFunction, BuiltinException, BasicException
 from src.interpreter.context import FunctionContext
-from src.interpreter.runtime_exception import RuntimeUserException
+from src.interpreter.files import FileTable, LineStream
+from src.interpreter.input_source import InputProvider, ConsoleInput
+from src.interpreter.maps import TypedMap
+from src.interpreter.memo_cache import MemoCache
+from src.interpreter.numeric import create_numerics
+from src.interpreter.output import OutputSink, StreamSink
+from src.interpreter.rope import Rope
+from src.interpreter.plugins import PluginRegistry
+from src.interpreter.runtime_exception import RuntimeUserException, ThrownException
+from src.interpreter.stdlib import stdlib_functions
+from src.interpreter.value_types import VALUE_TO_TYPE_MAP, TYPE_TO_VALUE_MAP, CAST_FUNCTIONS
+from src.interpreter.vectorized import Vectorizer, is_vector
 from src.lexer.lexer import DefaultLexer
+from src.optimizer.catch_tables import build_catch_tables, BASE_EXCEPTION
+from src.optimizer.purity import find_pure_functions
+from src.optimizer.scopes import mark_scopes
+from src.optimizer.tail_calls import mark_tail_calls
 from src.lexer.source import Source
 from src.parser.parser import Parser
 
-VALUE_TO_TYPE_MAP = {
-    int: Type.IntType,
-    float: Type.FloatType,
-    bool: Type.BoolType,
-    str: Type.StringType
-}
-TYPE_TO_VALUE_MAP = {v: k for k, v in VALUE_TO_TYPE_MAP.items()}
-
 COMPARISON_OPERATORS = {
     'equals': eq,
     'not_equals': ne,
@@ -34,85 +44,176 @@ COMPARISON_OPERATORS = {
 
 class ProgramExecutor(Visitor):
 
-    def __init__(self, recursion_limit=30, number_precision=15):
+    def __init__(self, recursion_limit=30, number_precision=15, tail_calls=True, memo_cache: MemoCache = None,
+                 quicken=True, numeric_mode="strict", ropes=True, output: OutputSink = None,
+                 input_provider: InputProvider = None, plugins: PluginRegistry = None, files: FileTable = None):
         self.recursion_limit = recursion_limit
         self.number_precision = number_precision
+        self.numeric_mode = numeric_mode
+        self.numerics = create_numerics(numeric_mode, number_precision)
+        self.vectorizer = Vectorizer(self.numerics)
+        self.tail_calls = tail_calls
+        self.quicken = quicken
+        self.ropes = ropes
+        self.output = output or StreamSink()
+        self.input_provider = input_provider or ConsoleInput()
+        self.plugins = plugins or PluginRegistry()
+        self.files = files or FileTable()
+        self.memo_cache = memo_cache
+        self.pure_functions = set()
         self.break_flag = False
         self.continue_flag = False
         self.return_flag = False
-        self.exception_to_throw = None
-        self.catched = False
-        self.last_result = None
         self.functions = {}
         self.exceptions = {}
         self.context_stack = []
 
     def execute(self, program: Program):
-        program.accept(self)
-        if self.exception_to_throw:
-            print(f"\033[31m{self.exception_to_throw}\033[0m")
+        try:
+            program.accept(self)
+        except ThrownException as thrown:
+            self.output.write(f"\033[31m{thrown.exception}\033[0m\n")
+        finally:
+            self.files.close_all()
+            self.input_provider.close()
+            self.output.flush()
 
     def visit_program(self, program: Program):
         if program.functions.get("main") is None:
             raise MissingMainFunctionDeclaration()
 
-        self.functions["print"] = BuiltinFunction(self.builtin_print)
-        self.functions["input"] = BuiltinFunction(self.builtin_input)
+        self.functions["print"] = BuiltinFunction(self.builtin_print, "print")
+        self.functions["input"] = BuiltinFunction(self.builtin_input, "input")
+        self.functions.update(stdlib_functions())
+        self.functions.update(self.files.builtins())
 
         self.exceptions["BasicException"] = BuiltinException(BasicException)
 
+        self.functions.update(self.plugins.functions)
+        self.exceptions.update(self.plugins.exceptions)
+
         for function in program.functions.values():
             self.functions[function.name] = function
 
         for exception in program.exceptions.values():
             self.exceptions[exception.name] = exception
 
+        mark_scopes(program)
+        build_catch_tables(program, self.exceptions)
+        if self.tail_calls:
+            mark_tail_calls(program)
+
+        if self.memo_cache is not None:
+            self.pure_functions = find_pure_functions(program)
+
         main_call = FunctionCall(position=self.functions["main"].position,
                                  name="main",
                                  arguments=[])
-        main_call.accept(self)
+        self._run(main_call)
+
+    def _run(self, node: Node):
+        return node.accept(self)
+
+    def visit_function(self, function_def: Function, eval_arguments: list, call_position: Position):
+        memo_key = self._memo_key(function_def, eval_arguments)
+        if memo_key is not None:
+            hit, value = self.memo_cache.lookup(memo_key)
+            if hit:
+                return value
 
-    def visit_function(self, function_def: Function):
-        eval_arguments, call_position = self._consume_last_result()
+        context = self._enter_function(function_def, eval_arguments, call_position)
+        try:
+            function_def.statement_block.accept(self)
 
+            while context.tail_call is not None:
+                function_def = self._enter_tail_call(function_def, context)
+                function_def.statement_block.accept(self)
+        except RecursionError:
+            raise RecursionTooDeepError(call_position) from None
+
+        return self._memoize(memo_key, self._leave_function(function_def, context, call_position))
+
+    def _memo_key(self, function_def: Function, eval_arguments: list):
+        if self.memo_cache is None or function_def.name not in self.pure_functions:
+            return None
+        return function_def.name, tuple((type(value), value) for value in eval_arguments)
+
+    def _memoize(self, memo_key, return_value):
+        if memo_key is not None:
+            self.memo_cache.store(memo_key, return_value)
+        return return_value
+
+    def _enter_function(self, function_def: Function, eval_arguments: list, call_position: Position) -> FunctionContext:
         if len(eval_arguments) != len(function_def.parameters):
             raise WrongNumberOfArguments(function_def.name,
                                          len(eval_arguments),
                                          len(function_def.parameters),
                                          call_position)
 
-        call_context = FunctionContext(function_def.name)
-        self.context_stack.append(call_context)
-        context = self.context_stack[-1]
+        context = FunctionContext(function_def.name)
+        self.context_stack.append(context)
+        self._bind_parameters(function_def, context, eval_arguments)
+        return context
 
+    def _enter_tail_call(self, caller_def: Function, context: FunctionContext) -> Function:
+        if self.break_flag or self.continue_flag:
+            raise LoopControlOutsideLoopError("Break" if self.break_flag else "Continue")
+
+        function_def, eval_arguments, call_position = context.tail_call
+        if len(eval_arguments) != len(function_def.parameters):
+            raise WrongNumberOfArguments(function_def.name,
+                                         len(eval_arguments),
+                                         len(function_def.parameters),
+                                         call_position)
+
+        if caller_def.return_type not in context.caller_return_types:
+            context.caller_return_types.append(caller_def.return_type)
+
+        self.return_flag = False
+        context.reuse(function_def.name)
+        self._bind_parameters(function_def, context, eval_arguments)
+        return function_def
+
+    @staticmethod
+    def _bind_parameters(function_def: Function, context: FunctionContext, eval_arguments: list):
         for param, value in zip(function_def.parameters, eval_arguments):
             if not context.declare_variable(param.name, value):
                 raise VariableAlreadyDeclaredError(param.name, param.position)
 
-        function_def.statement_block.accept(self)
+    def _leave_function(self, function_def: Function, context: FunctionContext, call_position: Position):
         if self.break_flag or self.continue_flag:
             raise LoopControlOutsideLoopError("Break" if self.break_flag else "Continue")
 
-        if self.exception_to_throw:
-            self.context_stack.pop()
-            return
-
         if function_def.return_type != Type.VoidType and not self.return_flag:
             raise ReturnStatementMissingError(function_def.name)
 
+        return_value = context.return_value
         if self.return_flag:
-            if self.last_result is not None and function_def.return_type == Type.VoidType:
+            if return_value is not None and function_def.return_type == Type.VoidType:
                 raise ValueReturnInVoidFunctionError(function_def.name, call_position)
 
-            if (return_type := VALUE_TO_TYPE_MAP.get(type(self.last_result))) != function_def.return_type:
+            if (return_type := VALUE_TO_TYPE_MAP.get(type(return_value))) != function_def.return_type:
                 raise InvalidReturnedValueTypeException(return_type, function_def.return_type)
 
+        for caller_return_type in context.caller_return_types:
+            if (return_type := VALUE_TO_TYPE_MAP.get(type(return_value))) is None or return_type != caller_return_type:
+                raise InvalidReturnedValueTypeException(return_type, caller_return_type)
+
         self.context_stack.pop()
         self.return_flag = False
+        return return_value
+
+    def visit_exception(self, exception_def: CustomException, eval_arguments: list, throw_position: Position):
+        context = self._enter_exception(exception_def, eval_arguments, throw_position)
+
+        eval_attributes = {}
+        for attr in exception_def.attributes:
+            value = self._evaluate(attr)
+            self._add_attribute(exception_def, eval_attributes, attr.name, value, attr.position)
 
-    def visit_exception(self, exception_def: CustomException):
-        eval_arguments, throw_position = self._consume_last_result()
+        self._leave_exception(exception_def, context, eval_attributes, throw_position)
 
+    def _enter_exception(self, exception_def: CustomException, eval_arguments: list, throw_position: Position):
         context = self.context_stack[-1]
         context.push_scope()
 
@@ -120,7 +221,7 @@ class ProgramExecutor(Visitor):
             raise WrongNumberOfArguments(exception_def.name,
                                          len(eval_arguments),
                                          len(exception_def.parameters),
-                                         throw_position.position)
+                                         throw_position)
 
         for param, value in zip(exception_def.parameters, eval_arguments):
             value_type = type(value)
@@ -132,70 +233,56 @@ class ProgramExecutor(Visitor):
             if not context.declare_variable(param.name, value):
                 raise VariableAlreadyDeclaredError(param.name, param.position)
 
-        eval_attributes = []
-        for attr in exception_def.attributes:
-            attr.accept(self)
-            eval_attributes.append((attr.name, self._consume_last_result()))
+        return context
 
+    def _leave_exception(self,
+                         exception_def: CustomException,
+                         context: FunctionContext,
+                         eval_attributes: dict[str, Any],
+                         throw_position: Position):
         context.pop_scope()
-        eval_attributes.append(("position", throw_position))
-        self.exception_to_throw = RuntimeUserException(exception_def.name, eval_attributes)
+        if "position" in eval_attributes:
+            raise AttributeAlreadyDeclaredError("position", exception_def.name, throw_position)
+        raise ThrownException(RuntimeUserException(exception_def.name, eval_attributes, throw_position))
 
-    def visit_builtin_exception(self, builtin_exception: BuiltinException):
-        arguments, throw_position = self._consume_last_result()
-        arguments = [throw_position] + arguments
-        self.exception_to_throw = builtin_exception.exception_object(*arguments)
+    @staticmethod
+    def _add_attribute(exception_def: CustomException, attributes: dict[str, Any], name: str, value,
+                       position: Position):
+        if name in attributes:
+            raise AttributeAlreadyDeclaredError(name, exception_def.name, position)
+        attributes[name] = value
 
+    def visit_builtin_exception(self, builtin_exception: BuiltinException, arguments: list, throw_position: Position):
+        raise ThrownException(builtin_exception.exception_object(throw_position, *arguments))
 
     def visit_statement_block(self, statement_block: StatementBlock):
         context = self.context_stack[-1]
-        context.push_scope()
+        if statement_block.needs_scope:
+            context.push_scope()
 
         for statement in statement_block.statements:
             statement.accept(self)
 
-            if self.return_flag:
-                break
-
-            self.last_result = None
-
-            if self.break_flag or self.continue_flag or self.exception_to_throw:
+            if self.return_flag or self.break_flag or self.continue_flag:
                 break
 
-        context.pop_scope()
+        if statement_block.needs_scope:
+            context.pop_scope()
 
     def visit_attribute(self, attribute: Attribute):
-        attribute.expression.accept(self)
+        return attribute.expression.accept(self)
 
     def visit_if_statement(self, if_statement: IfStatement):
-        if_statement.condition.accept(self)
+        condition_value = self._evaluate(if_statement.condition)
 
-        if self.exception_to_throw:
-            return
-
-        condition_value = self._consume_last_result()
-        condition_value_type = type(condition_value)
-
-        if condition_value_type != bool:
-            raise WrongExpressionTypeError(condition_value_type, bool, if_statement.condition.position)
-
-        if condition_value:
+        if self._check_condition(condition_value, if_statement.condition):
             if_statement.if_block.accept(self)
             return
 
         for elif_condition, elif_block in if_statement.elif_statement:
-            elif_condition.accept(self)
-
-            if self.exception_to_throw:
-                return
-
-            elif_condition_value = self._consume_last_result()
-            elif_condition_value_type = type(elif_condition_value)
+            elif_condition_value = self._evaluate(elif_condition)
 
-            if elif_condition_value_type != bool:
-                raise WrongExpressionTypeError(elif_condition_value_type, bool, elif_condition.position)
-
-            if elif_condition_value:
+            if self._check_condition(elif_condition_value, elif_condition):
                 elif_block.accept(self)
                 return
 
@@ -203,191 +290,345 @@ class ProgramExecutor(Visitor):
             if_statement.else_block.accept(self)
 
     def visit_return_statement(self, return_statement: ReturnStatement):
+        if return_statement.tail_call and self.tail_calls:
+            return self._tail_call(return_statement.expression)
+
+        return_value = None
         if return_statement.expression is not None:
-            return_statement.expression.accept(self)
+            return_value = return_statement.expression.accept(self)
 
-            if self.exception_to_throw:
-                return
+        self._set_return_value(return_value)
 
-        self.return_flag = True
+    def _tail_call(self, function_call: FunctionCall):
+        eval_arguments = self._evaluate_arguments(function_call)
 
-    def visit_try_catch_statement(self, try_catch_statement: TryCatchStatement):
-        try_catch_statement.try_block.accept(self)
+        self._schedule_tail_call(function_call, eval_arguments)
 
-        if self.exception_to_throw:
-            for catch in try_catch_statement.catch_statements:
-                catch.accept(self)
-                if self.catched:
-                    self.catched = False
-                    break
+    def _schedule_tail_call(self, function_call: FunctionCall, eval_arguments: list):
+        function_def = self._resolve_function(function_call)
 
-    def visit_catch_statement(self, catch: CatchStatement):
-        exception = self.exception_to_throw
-        context = self.context_stack[-1]
+        if isinstance(function_def, Function):
+            self.context_stack[-1].tail_call = (function_def, eval_arguments, function_call.position)
+            self.return_flag = True
+            return
 
-        if  catch.exception == "BasicException" or catch.exception == exception.name:
-            context.push_scope()
+        self._check_call_depth(function_call)
+        self._set_return_value(function_def.accept(self, eval_arguments, function_call.position))
+
+    def _set_return_value(self, return_value):
+        self.context_stack[-1].return_value = return_value
+        self.return_flag = True
+
+    def visit_try_catch_statement(self, try_catch_statement: TryCatchStatement):
+        unwind_mark = self._unwind_mark()
+        try:
+            try_catch_statement.try_block.accept(self)
+            return
+        except ThrownException as thrown:
+            exception = thrown.exception
+            if (catch := self._select_catch(try_catch_statement, exception)) is None:
+                raise
 
-            for attr_name, value in exception.attributes:
-                if not context.add_attribute(catch.name, attr_name, value):
-                    raise AttributeAlreadyDeclaredError(attr_name, catch.name, catch.position)
+        self._unwind(unwind_mark)
+        catch.accept(self, exception)
 
-            self.exception_to_throw = None
+    def visit_catch_statement(self, catch: CatchStatement, exception: BasicException):
+        context = self.context_stack[-1]
+        shadowed = self._enter_catch(context, catch, exception)
+        try:
             catch.block.accept(self)
-            self.catched = True
+        finally:
+            self._leave_catch(context, catch, shadowed)
 
-            context.pop_scope()
-            self.last_result = None
+    def _unwind_mark(self) -> tuple[int, int, int]:
+        context = self.context_stack[-1]
+        return len(self.context_stack), len(context.scope_stack), len(context.inline_arguments)
 
-    def visit_while_statement(self, while_statement: WhileStatement):
-        while_statement.condition.accept(self)
+    def _unwind(self, unwind_mark: tuple[int, int, int]):
+        context_depth, scope_depth, inline_depth = unwind_mark
+        del self.context_stack[context_depth:]
+        context = self.context_stack[-1]
+        del context.scope_stack[scope_depth:]
+        del context.inline_arguments[inline_depth:]
+        self.return_flag = self.break_flag = self.continue_flag = False
 
-        if self.exception_to_throw:
-            return
+    @staticmethod
+    def _select_catch(try_catch_statement: TryCatchStatement, exception: BasicException) -> Optional[CatchStatement]:
+        catch_table = try_catch_statement.catch_table
+        return catch_table.get(exception.name) or catch_table.get(BASE_EXCEPTION)
 
-        condition_value = self._consume_last_result()
-        condition_value_type = type(condition_value)
+    @staticmethod
+    def _enter_catch(context: FunctionContext, catch: CatchStatement,
+                     exception: BasicException) -> Optional[BasicException]:
+        context.push_scope()
+        return context.bind_exception(catch.name, exception)
 
-        if condition_value_type != bool:
-            raise WrongExpressionTypeError(condition_value_type, bool, while_statement.condition.position)
+    @staticmethod
+    def _leave_catch(context: FunctionContext, catch: CatchStatement, shadowed: Optional[BasicException]):
+        context.unbind_exception(catch.name, shadowed)
+        context.pop_scope()
+
+    def visit_while_statement(self, while_statement: WhileStatement):
+        self._enter_loop(while_statement)
+        condition_value = self._evaluate(while_statement.condition)
 
-        while condition_value:
+        while self._check_condition(condition_value, while_statement.condition):
             while_statement.block.accept(self)
 
             if self.break_flag or self.return_flag:
                 self.break_flag = False
                 break
 
-            if self.continue_flag:
-                self.continue_flag = False
-                continue
+            self.continue_flag = False
 
-            if self.exception_to_throw:
+            condition_value = self._evaluate(while_statement.condition)
+
+    def visit_for_statement(self, for_statement: ForStatement):
+        iterable = self._evaluate(for_statement.iterable)
+
+        for value in self._iteration_values(for_statement, iterable):
+            self._bind_variable(for_statement.variable, value, for_statement.iterable.position, for_statement.position)
+            for_statement.block.accept(self)
+
+            if self.break_flag or self.return_flag:
+                self.break_flag = False
                 break
 
-            while_statement.condition.accept(self)
+            self.continue_flag = False
+
+    def visit_for_range_statement(self, for_range_statement: ForRangeStatement):
+        start = self._evaluate(for_range_statement.start)
+        end = self._evaluate(for_range_statement.end)
+        variables = self._enter_range(for_range_statement, start, end)
+        name = for_range_statement.variable
+        for value in range(start, end):
+            variables[name] = value
+            for_range_statement.block.accept(self)
 
-            if self.exception_to_throw:
+            if self.break_flag or self.return_flag:
+                self.break_flag = False
                 return
 
-            condition_value = self._consume_last_result()
+            self.continue_flag = False
 
-    def visit_throw_statement(self, throw_statement: ThrowStatement):
-        exception_name = throw_statement.name
+        variables[name] = max(start, end)
+
+    def _enter_range(self, for_range_statement: ForRangeStatement, start, end) -> dict:
+        if type(start) is not int:
+            raise WrongExpressionTypeError(type(start), int, for_range_statement.start.position)
+        if type(end) is not int:
+            raise WrongExpressionTypeError(type(end), int, for_range_statement.end.position)
+
+        self._enter_loop(for_range_statement)
+        self._bind_variable(for_range_statement.variable, start,
+                            for_range_statement.start.position, for_range_statement.position)
+        return self.context_stack[-1].variable_scope(for_range_statement.variable)
+
+    @staticmethod
+    def _iteration_values(for_statement: ForStatement, iterable) -> Iterable:
+        if type(iterable) is LineStream:
+            return iterable
+        if not isinstance(iterable, (TypedMap, TypedArray)):
+            raise WrongExpressionTypeError(type(iterable), [TypedMap, IntArray, FloatArray, LineStream],
+                                           for_statement.iterable.position)
+        return list(iterable)
+
+    def _enter_loop(self, loop_statement: WhileStatement | ForRangeStatement):
+        if loop_statement.invariant_slots:
+            invariants = self.context_stack[-1].invariants
+            for slot in loop_statement.invariant_slots:
+                invariants.pop(slot, None)
 
+    def visit_throw_statement(self, throw_statement: ThrowStatement):
         eval_arguments = []
         for argument in throw_statement.args:
-            argument.accept(self)
-
-            if self.exception_to_throw:
-                return
+            value = self._evaluate(argument)
 
-            eval_arguments.append(self._consume_last_result())
+            eval_arguments.append(value)
 
-        self.last_result = eval_arguments, throw_statement.position
+        exception_def = self._resolve_exception(throw_statement)
+        exception_def.accept(self, eval_arguments, throw_statement.position)
 
-        if exception_def := self.exceptions.get(exception_name):
-            exception_def.accept(self)
-        else:
-            raise UndefinedExceptionError(exception_name, throw_statement.position)
+    def _resolve_exception(self, throw_statement: ThrowStatement) -> CustomException | BuiltinException:
+        if (exception_def := self.exceptions.get(throw_statement.name)) is None:
+            raise UndefinedExceptionError(throw_statement.name, throw_statement.position)
+        return exception_def
 
     def visit_function_call(self, function_call: FunctionCall):
-        function_name = function_call.name
+        self._check_call_depth(function_call)
 
-        if len(self.context_stack) >= self.recursion_limit:
-            raise RecursionTooDeepError(function_call.position)
+        eval_arguments = self._evaluate_arguments(function_call)
 
+        function_def = self._resolve_function(function_call)
+        return function_def.accept(self, eval_arguments, function_call.position)
+
+    def _evaluate_arguments(self, function_call: FunctionCall | InlinedCall) -> list:
         eval_arguments = []
         for argument in function_call.arguments:
-            argument.accept(self)
+            value = self._evaluate(argument)
 
-            if self.exception_to_throw:
-                return
+            eval_arguments.append(value)
 
-            eval_arguments.append(self._consume_last_result())
+        return eval_arguments
 
-        self.last_result = eval_arguments, function_call.position
+    def _check_call_depth(self, function_call: FunctionCall):
+        if len(self.context_stack) >= self.recursion_limit:
+            raise RecursionTooDeepError(function_call.position)
 
-        if function_def := self.functions.get(function_name):
-            function_def.accept(self)
-        else:
-            raise UnknownFunctionCallError(function_name, function_call.position)
+    def _resolve_function(self, function_call: FunctionCall) -> Function | BuiltinFunction:
+        if (function_def := self.functions.get(function_call.name)) is None:
+            raise UnknownFunctionCallError(function_call.name, function_call.position)
+        return function_def
 
-    def visit_builtin_function(self, builtin_function: BuiltinFunction):
-        builtin_function.handler()
+    def visit_builtin_function(self, builtin_function: BuiltinFunction, arguments: list, call_position: Position):
+        observe = self.numerics.observe
+        arguments = [observe(argument, call_position) for argument in arguments]
+        if builtin_function.signatures is None:
+            return builtin_function.handler(*arguments)
 
-    def visit_assignment_statement(self, assigment_statement: AssignmentStatement):
-        assigment_statement.expression.accept(self)
+        self._check_builtin_arguments(builtin_function, arguments, call_position)
+        try:
+            result = builtin_function.handler(*arguments)
+        except (ValueError, ArithmeticError, OSError) as e:
+            raise InvalidArgumentError(builtin_function.name, str(e), call_position)
+
+        if type(result) is int or type(result) is float:
+            return self.numerics.normalize(result, call_position)
+        return result
 
-        if self.exception_to_throw:
+    @staticmethod
+    def _check_builtin_arguments(builtin_function: BuiltinFunction, arguments: list, call_position: Position):
+        argument_types = tuple(VALUE_TO_TYPE_MAP.get(type(argument)) for argument in arguments)
+        if argument_types in builtin_function.signatures:
             return
 
-        name = assigment_statement.name
-        value = self._consume_last_result()
+        arities = [len(parameter_types) for parameter_types in builtin_function.signatures]
+        if len(arguments) not in arities:
+            raise WrongNumberOfArguments(builtin_function.name, len(arguments), arities[0], call_position)
+
+        for index, argument in enumerate(arguments):
+            expected_types = [TYPE_TO_VALUE_MAP[parameter_types[index]]
+                              for parameter_types in builtin_function.signatures
+                              if len(parameter_types) == len(arguments)]
+            if type(argument) not in expected_types:
+                raise WrongExpressionTypeError(type(argument), expected_types, call_position)
+
+        raise WrongExpressionTypeError(type(arguments[-1]), TYPE_TO_VALUE_MAP[argument_types[0]], call_position)
+
+    def visit_assignment_statement(self, assigment_statement: AssignmentStatement):
+        if self.ropes and (appended := self._appended_expressions(assigment_statement)) and (
+                (rope := self._append_target(assigment_statement)) is not None):
+            parts = []
+            for plus_expression in appended:
+                value = self._evaluate(plus_expression.right)
+
+                parts.append(self._check_appended(plus_expression, value))
+
+            return self._append(assigment_statement, rope, parts)
+
+        value = self._evaluate(assigment_statement.expression)
+
+        self._assign(assigment_statement, value)
+
+    @staticmethod
+    def _appended_expressions(assigment_statement: AssignmentStatement) -> list[PlusExpression]:
+        if (appended := getattr(assigment_statement, "appended", None)) is None:
+            appended = []
+            expression = assigment_statement.expression
+            while isinstance(expression, PlusExpression):
+                appended.append(expression)
+                expression = expression.left
+            if not (isinstance(expression, Variable) and expression.name == assigment_statement.name):
+                appended = []
+            appended.reverse()
+            assigment_statement.appended = appended
+        return appended
+
+    def _append_target(self, assigment_statement: AssignmentStatement) -> str | Rope | None:
+        value = self.context_stack[-1].get_variable(assigment_statement.name)
+        return value if type(value) is str or type(value) is Rope else None
+
+    def _check_appended(self, plus_expression: PlusExpression, value) -> str:
+        if type(value) is not str:
+            self._check_operand(value, [int, float, str], plus_expression.right)
+            raise NotMatchingTypesInBinaryExpression(str, type(value), plus_expression.left.position)
+        return value
+
+    def _append(self, assigment_statement: AssignmentStatement, rope: str | Rope, parts: list[str]):
+        if type(rope) is Rope:
+            rope.append(parts)
+        else:
+            self.context_stack[-1].assign_value(assigment_statement.name, Rope([rope, *parts]))
+
+    def _assign(self, assigment_statement: AssignmentStatement, value):
+        self._bind_variable(assigment_statement.name, value,
+                            assigment_statement.expression.position, assigment_statement.position)
+
+    def _bind_variable(self, name: str, value, value_position: Position, position: Position):
         value_type = type(value)
 
         context = self.context_stack[-1]
         if (declared_variable := context.get_variable(name)) is not None:
-            variable_type = type(declared_variable)
+            variable_type = str if type(declared_variable) is Rope else type(declared_variable)
             if variable_type != value_type:
                 raise WrongExpressionTypeError(value_type,
                                                variable_type,
-                                               assigment_statement.expression.position)
+                                               value_position)
 
             context.assign_value(name, value)
         else:
             if not context.declare_variable(name, value):
-                raise VariableAlreadyDeclaredError(name, assigment_statement.position)
+                raise VariableAlreadyDeclaredError(name, position)
 
     def visit_or_expression(self, or_expression: OrExpression):
-        or_expression.left.accept(self)
+        left = self._evaluate(or_expression.left)
 
-        if self.exception_to_throw:
-            return
+        if self._assert_bool(left, or_expression.left.position):
+            return True
 
-        left = self._assert_bool(self._consume_last_result(), or_expression.left.position)
+        right = self._evaluate(or_expression.right)
 
-        if left:
-            self.last_result = True
-        else:
-            or_expression.right.accept(self)
-
-            if self.exception_to_throw:
-                return
-
-            right = self._assert_bool(self._consume_last_result(), or_expression.right.position)
-            self.last_result = right
+        return self._assert_bool(right, or_expression.right.position)
 
     def visit_and_expression(self, and_expression: AndExpression):
-        and_expression.left.accept(self)
+        left = self._evaluate(and_expression.left)
 
-        if self.exception_to_throw:
-            return
+        if not self._assert_bool(left, and_expression.left.position):
+            return False
 
-        left = self._assert_bool(self._consume_last_result(), and_expression.left.position)
+        right = self._evaluate(and_expression.right)
 
-        if not left:
-            self.last_result = False
-        else:
-            and_expression.right.accept(self)
+        return self._assert_bool(right, and_expression.right.position)
 
-            if self.exception_to_throw:
-                return
+    def visit_casted_expression(self, casted_expression: CastedExpression):
+        value = self._evaluate(casted_expression.expression)
 
-            right = self._assert_bool(self._consume_last_result(), and_expression.right.position)
+        value = self.numerics.observe(value, casted_expression.position)
+        result = self._cast_expression(value, casted_expression.to_type, casted_expression.position)
+        self._quicken(casted_expression, type(value), CAST_FUNCTIONS[(type(value), casted_expression.to_type)])
+        return result
 
-            self.last_result = right
+    def visit_resolved_cast(self, casted_expression: ResolvedCastedExpression):
+        value = self._evaluate(casted_expression.expression)
 
-    def visit_casted_expression(self, casted_expression: CastedExpression):
-        casted_expression.expression.accept(self)
+        if casted_expression.guard is float:
+            value = self.numerics.observe(value, casted_expression.position)
+        return casted_expression.operation(value)
 
-        if self.exception_to_throw:
-            return
+    def visit_quickened_cast(self, casted_expression: QuickenedCastedExpression):
+        value = self._evaluate(casted_expression.expression)
 
-        self._cast_expression(casted_expression.to_type, casted_expression.position)
+        if type(value) is casted_expression.guard:
+            if casted_expression.guard is float:
+                value = self.numerics.observe(value, casted_expression.position)
+            return casted_expression.operation(value)
+
+        self._deoptimize(casted_expression)
+        value = self.numerics.observe(value, casted_expression.position)
+        return self._cast_expression(value, casted_expression.to_type, casted_expression.position)
 
     def visit_negated_expression(self, negated_expression: NegatedExpression):
-        self._evaluate_unary_expression(
+        return self._evaluate_unary_expression(
             expression=negated_expression.expression,
             expected_types=bool,
             position=negated_expression.position,
@@ -395,13 +636,40 @@ class ProgramExecutor(Visitor):
         )
 
     def visit_unary_minus_expression(self, unary_minus_expression: UnaryMinusExpression):
-        self._evaluate_unary_expression(
+        return self._evaluate_unary_expression(
             expression=unary_minus_expression.expression,
-            expected_types=[int, float],
+            expected_types=[int, float, IntArray, FloatArray],
             position=unary_minus_expression.position,
-            operator_fn=lambda v: -v
+            operator_fn=lambda v: self.vectorizer.negate(v) if is_vector(v) else -v
         )
 
+    def visit_invariant_expression(self, invariant_expression: InvariantExpression):
+        invariants = self.context_stack[-1].invariants
+        if (value := invariants.get(invariant_expression.slot)) is None:
+            value = self._evaluate(invariant_expression.expression)
+            if not is_vector(value):
+                invariants[invariant_expression.slot] = value
+        return value
+
+    def visit_inlined_call(self, inlined_call: InlinedCall):
+        eval_arguments = self._evaluate_arguments(inlined_call)
+
+        inline_arguments = self.context_stack[-1].inline_arguments
+        inline_arguments.append(eval_arguments)
+        return_value = inlined_call.body.accept(self)
+        inline_arguments.pop()
+
+        return self._check_inlined_return(inlined_call, return_value)
+
+    @staticmethod
+    def _check_inlined_return(inlined_call: InlinedCall, return_value):
+        if (return_type := VALUE_TO_TYPE_MAP.get(type(return_value))) != inlined_call.return_type:
+            raise InvalidReturnedValueTypeException(return_type, inlined_call.return_type)
+        return return_value
+
+    def visit_inlined_parameter(self, inlined_parameter: InlinedParameter):
+        return self.context_stack[-1].inline_arguments[-1][inlined_parameter.index]
+
     def visit_attribute_call(self, attribute_call: AttributeCall):
         context = self.context_stack[-1]
         attr_name = attribute_call.attr_name
@@ -410,29 +678,103 @@ class ProgramExecutor(Visitor):
         if (attribute := context.get_attribute(var_name, attr_name)) is None:
             raise UndefinedAttributeError(attribute_call.attr_name, var_name, attribute_call.position)
 
-        self.last_result = attribute
+        return attribute
+
+    def visit_index_expression(self, index_expression: IndexExpression):
+        collection = self._evaluate(index_expression.array)
+
+        index = self._evaluate(index_expression.index)
+
+        return self._load_element(index_expression, collection, index)
+
+    def _load_element(self, index_expression: IndexExpression, collection, index):
+        if isinstance(collection, TypedMap):
+            key = self._map_key(collection, index_expression.index, index)
+            if key not in collection:
+                raise KeyNotFoundError(key, index_expression.index.position)
+            return collection[key]
+
+        self._check_index(index_expression.array, collection, index_expression.index, index)
+        return collection[index]
+
+    def visit_index_assignment_statement(self, index_assignment_statement: IndexAssignmentStatement):
+        index = self._evaluate(index_assignment_statement.index)
+
+        value = self._evaluate(index_assignment_statement.expression)
+
+        self._store_element(index_assignment_statement, index, value)
+
+    def _store_element(self, index_assignment_statement: IndexAssignmentStatement, index, value):
+        name = index_assignment_statement.name
+        if (collection := self.context_stack[-1].get_variable(name)) is None:
+            raise UndefinedVariableError(name, index_assignment_statement.position)
+
+        expression = index_assignment_statement.expression
+        if isinstance(collection, TypedMap):
+            self._put_entry(collection, index_assignment_statement.index, index, expression, value)
+            return
+
+        self._check_index(index_assignment_statement, collection, index_assignment_statement.index, index)
+        if type(value) is not collection.element_type:
+            raise WrongExpressionTypeError(type(value), collection.element_type, expression.position)
+
+        collection[index] = self.numerics.observe(value, expression.position)
+
+    def visit_map_literal(self, map_literal: MapLiteral):
+        values = TYPE_TO_VALUE_MAP[map_literal.map_type]()
+        for key_expression, value_expression in map_literal.entries:
+            key = self._evaluate(key_expression)
+
+            value = self._evaluate(value_expression)
+
+            self._put_entry(values, key_expression, key, value_expression, value)
+
+        return values
+
+    def _put_entry(self, values: TypedMap, key_expression: Expression, key, value_expression: Expression, value):
+        key = self._map_key(values, key_expression, key)
+        if type(value) is not values.value_type:
+            raise WrongExpressionTypeError(type(value), values.value_type, value_expression.position)
+
+        values[key] = self.numerics.observe(value, value_expression.position)
+
+    def _map_key(self, values: TypedMap, key_expression: Expression, key):
+        if type(key) is not values.key_type:
+            raise WrongExpressionTypeError(type(key), values.key_type, key_expression.position)
+        return self.numerics.observe(key, key_expression.position)
+
+    @staticmethod
+    def _check_index(array_node: Node, array, index_expression: Expression, index):
+        if not isinstance(array, TypedArray):
+            raise WrongExpressionTypeError(type(array), [IntArray, FloatArray, TypedMap], array_node.position)
+        if type(index) is not int:
+            raise WrongExpressionTypeError(type(index), int, index_expression.position)
+        if not 0 <= index < len(array):
+            raise IndexOutOfRangeError(index, len(array), index_expression.position)
 
     def visit_variable(self, variable: Variable):
         context = self.context_stack[-1]
         if (variable_value := context.get_variable(variable.name)) is None:
             raise UndefinedVariableError(variable.name, variable.position)
 
-        self.last_result = variable_value
+        if type(variable_value) is Rope:
+            return variable_value.flatten()
+        return variable_value
 
     def visit_bool_literal(self, bool_literal: BoolLiteral):
-        self.last_result = True if bool_literal.value == "true" else False
+        return True if bool_literal.value == "true" else False
 
     def visit_float_literal(self, float_literal: FloatLiteral):
-        self.last_result = float_literal.value
+        return float_literal.value
 
     def visit_string_literal(self, string_literal: StringLiteral):
-        self.last_result = string_literal.value
+        return string_literal.value
 
     def visit_int_literal(self, int_literal: IntLiteral):
-        self.last_result = int_literal.value
+        return int_literal.value
 
     def visit_multiply_expression(self, multiply_expression: MultiplyExpression):
-        self._evaluate_arithmetic_expression(
+        return self._evaluate_arithmetic_expression(
             expression=multiply_expression,
             operator_func=mul,
             allowed_types=[int, float]
@@ -440,50 +782,59 @@ class ProgramExecutor(Visitor):
 
     def visit_divide_expression(self, divide_expression: DivideExpression):
         safe_divide_with_position = lambda x, y: self._safe_divide(x, y, divide_expression.position)
-        self._evaluate_arithmetic_expression(
+        return self._evaluate_arithmetic_expression(
             expression=divide_expression,
             operator_func=safe_divide_with_position,
             allowed_types=[int, float]
         )
 
     def visit_modulo_expression(self, modulo_expression: ModuloExpression):
-        self._evaluate_arithmetic_expression(
+        return self._evaluate_arithmetic_expression(
             expression=modulo_expression,
             operator_func=mod,
             allowed_types=[int, float]
         )
 
     def visit_plus_expression(self, plus_expression: PlusExpression):
-        self._evaluate_arithmetic_expression(
+        return self._evaluate_arithmetic_expression(
             expression=plus_expression,
             operator_func=add,
             allowed_types=[int, float, str]
         )
 
     def visit_minus_expression(self, minus_expression: MinusExpression):
-        self._evaluate_arithmetic_expression(
+        return self._evaluate_arithmetic_expression(
             expression=minus_expression,
             operator_func=sub,
             allowed_types=[int, float]
         )
 
     def visit_equals_expression(self, expression: EqualsExpression):
-        self._visit_binary_comparison(expression, COMPARISON_OPERATORS['equals'])
+        return self._visit_binary_comparison(expression, COMPARISON_OPERATORS['equals'])
 
     def visit_not_equals_expression(self, expression: NotEqualsExpression):
-        self._visit_binary_comparison(expression, COMPARISON_OPERATORS['not_equals'])
+        return self._visit_binary_comparison(expression, COMPARISON_OPERATORS['not_equals'])
 
     def visit_less_than_expression(self, expression: LessThanExpression):
-        self._visit_binary_comparison(expression, COMPARISON_OPERATORS['less_than'])
+        return self._visit_binary_comparison(expression, COMPARISON_OPERATORS['less_than'])
 
     def visit_less_than_or_equals_expression(self, expression: LessThanOrEqualsExpression):
-        self._visit_binary_comparison(expression, COMPARISON_OPERATORS['less_than_or_equals'])
+        return self._visit_binary_comparison(expression, COMPARISON_OPERATORS['less_than_or_equals'])
 
     def visit_greater_than_expression(self, expression: GreaterThanExpression):
-        self._visit_binary_comparison(expression, COMPARISON_OPERATORS['greater_than'])
+        return self._visit_binary_comparison(expression, COMPARISON_OPERATORS['greater_than'])
 
     def visit_greater_than_or_equals_expression(self, expression: GreaterThanOrEqualsExpression):
-        self._visit_binary_comparison(expression, COMPARISON_OPERATORS['greater_than_or_equals'])
+        return self._visit_binary_comparison(expression, COMPARISON_OPERATORS['greater_than_or_equals'])
+
+    def _evaluate(self, expression: Expression | Attribute):
+        return self._required(expression.accept(self))
+
+    def _required(self, value):
+        if value is None:
+            raise VoidFunctionUsedAsValueError()
+
+        return value
 
     def _evaluate_unary_expression(
             self,
@@ -492,36 +843,54 @@ class ProgramExecutor(Visitor):
             position: Position,
             operator_fn: Callable
     ):
-        expression.accept(self)
+        value = self._evaluate(expression)
 
-        if self.exception_to_throw:
-            return
+        return self._apply_unary(value, expected_types, position, operator_fn)
 
-        value = self._consume_last_result()
+    def _apply_unary(self, value, expected_types: list[type] | type, position: Position, operator_fn: Callable):
         self._check_type(value, expected_types, position)
-        self.last_result = operator_fn(value)
+        return operator_fn(value)
 
     def _visit_binary_comparison(self, expr, op_func):
-        expr.left.accept(self)
+        left = self._evaluate(expr.left)
 
-        if self.exception_to_throw:
-            return
+        right = self._evaluate(expr.right)
 
-        left = self._consume_last_result()
-        left_type = type(left)
+        result = self._compare_observed(expr, op_func, left, right)
+        self._quicken(expr, type(left), op_func)
+        return result
 
-        expr.right.accept(self)
+    def visit_quickened_comparison(self, expr: QuickenedComparison):
+        left = self._evaluate(expr.left)
 
-        if self.exception_to_throw:
-            return
+        right = self._evaluate(expr.right)
+
+        guard = expr.guard
+        if type(left) is guard and type(right) is guard:
+            if guard is float:
+                return expr.operation(self.numerics.observe(left, expr.left.position),
+                                      self.numerics.observe(right, expr.right.position))
+            return expr.operation(left, right)
+
+        self._deoptimize(expr)
+        return self._compare_observed(expr, expr.operation, left, right)
 
-        right = self._consume_last_result()
+    def _compare_observed(self, expr: RelationalExpression, op_func: Callable, left, right) -> bool:
+        left = self.numerics.observe(left, expr.left.position)
+        right = self.numerics.observe(right, expr.right.position)
+        if is_vector(left) or is_vector(right):
+            return self.vectorizer.compare(expr, left, right)
+        return self._compare(expr, op_func, left, right)
+
+    @staticmethod
+    def _compare(expr: RelationalExpression, op_func: Callable, left, right) -> bool:
+        left_type = type(left)
         right_type = type(right)
 
         if left_type != right_type:
-            raise NotMatchingTypesInBinaryExpression(left_type, right_type)
+            raise NotMatchingTypesInBinaryExpression(left_type, right_type, expr.position)
 
-        self.last_result = op_func(left, right)
+        return op_func(left, right)
 
     def visit_break_statement(self, break_statement: BreakStatement):
         self.break_flag = True
@@ -529,12 +898,11 @@ class ProgramExecutor(Visitor):
     def visit_continue_statement(self, continue_statement: ContinueStatement):
         self.continue_flag = True
 
-    def _consume_last_result(self):
-        if self.last_result is None:
-            raise VoidFunctionUsedAsValueError()
-
-        value = self.last_result
-        self.last_result = None
+    @staticmethod
+    def _check_condition(value, condition: Expression) -> bool:
+        value_type = type(value)
+        if value_type != bool:
+            raise WrongExpressionTypeError(value_type, bool, condition.position)
         return value
 
     @staticmethod
@@ -557,78 +925,28 @@ class ProgramExecutor(Visitor):
                 raise WrongExpressionTypeError(value_type, expected_types, position)
         return value
 
-    @staticmethod
-    def _safe_divide(x: int | float, y: int | float, position: Position) -> int | float:
-        if y == 0:
+    def _safe_divide(self, x: int | float, y: int | float, position: Position) -> int | float:
+        if self.numerics.observe(y, position) == 0:
             raise DivisionByZeroError(position)
         x_type = type(x)
         return x // y if x_type == int else x / y
 
-    def _cast_expression(self, to_type: Type, position: Position):
-        value = self._consume_last_result()
+    @staticmethod
+    def _cast_expression(value: int | float | bool | str, to_type: Type, position: Position):
         origin_type = type(value)
 
-        cast_map = {
-            int: self._cast_int,
-            float: self._cast_float,
-            bool: self._cast_boolean,
-            str: self._cast_string,
-        }
-
-        cast_func = cast_map.get(origin_type)
-        if not cast_func:
+        if (cast_func := CAST_FUNCTIONS.get((origin_type, to_type))) is None:
             raise WrongExpressionTypeError(origin_type,
                                            [int, float, str, bool],
                                            position)
 
-        self.last_result = cast_func(to_type, value)
+        return cast_func(value)
 
     @staticmethod
     def _check_numeric_type(value_type: Type):
         if value_type not in (Type.IntType, Type.FloatType):
             raise WrongExpressionTypeError(value_type)
 
-    @staticmethod
-    def _cast_int(to_type: Type, value: int):
-        cast_map = {
-            Type.IntType: lambda v: v,
-            Type.FloatType: float,
-            Type.BoolType: lambda v: v != 0,
-            Type.StringType: str,
-        }
-        return cast_map[to_type](value)
-
-    @staticmethod
-    def _cast_float(to_type: Type, value: float):
-        cast_map = {
-            Type.IntType: int,
-            Type.FloatType: lambda v: v,
-            Type.BoolType: lambda v: v != 0.0,
-            Type.StringType: str,
-        }
-        return cast_map[to_type](value)
-
-    @staticmethod
-    def _cast_boolean(to_type: Type, value: bool):
-        cast_map = {
-            Type.IntType: lambda v: 1 if v else 0,
-            Type.FloatType: lambda v: 1.0 if v else 0.0,
-            Type.BoolType: lambda v: v,
-            Type.StringType: lambda v: "true" if v else "false",
-        }
-
-        return cast_map[to_type](value)
-
-    @staticmethod
-    def _cast_string(to_type: Type, value: str):
-        cast_map = {
-            Type.IntType: int,
-            Type.FloatType: float,
-            Type.BoolType: lambda v: v != '',
-            Type.StringType: lambda v: v,
-        }
-        return cast_map[to_type](value)
-
     def _evaluate_arithmetic_expression(
             self,
             expression: Expression,
@@ -638,47 +956,79 @@ class ProgramExecutor(Visitor):
         left_expr = expression.left
         right_expr = expression.right
 
-        left_expr.accept(self)
+        left = self._evaluate(left_expr)
 
-        if self.exception_to_throw:
-            return
+        self._check_operand(left, allowed_types, left_expr)
 
-        left = self._consume_last_result()
-        left_type = type(left)
-        if left_type not in allowed_types:
-            raise WrongExpressionTypeError(left_type, allowed_types, left_expr.position)
+        right = self._evaluate(right_expr)
 
-        right_expr.accept(self)
+        self._check_operand(right, allowed_types, right_expr)
 
-        if self.exception_to_throw:
-            return
+        result = self._apply_arithmetic(expression, operator_func, left, right)
+        self._quicken(expression, type(left), operator_func, allowed_types=allowed_types)
+        return result
 
-        right = self._consume_last_result()
-        right_type = type(right)
-        if right_type not in allowed_types:
-            raise WrongExpressionTypeError(right_type, allowed_types, right_expr.position)
+    def visit_quickened_arithmetic(self, expression: QuickenedArithmeticExpression):
+        left = self._evaluate(expression.left)
 
+        right = self._evaluate(expression.right)
+
+        guard = expression.guard
+        if type(left) is guard and type(right) is guard:
+            result = expression.operation(left, right)
+            if guard is str:
+                return result
+            return self.numerics.normalize(result, expression.position)
+
+        self._deoptimize(expression)
+        self._check_operand(left, expression.allowed_types, expression.left)
+        self._check_operand(right, expression.allowed_types, expression.right)
+        return self._apply_arithmetic(expression, expression.operation, left, right)
+
+    def _quicken(self, expression: Expression, guard: type, operation: Callable, **attributes):
+        quickened_class = QUICKENED_NODES.get(type(expression))
+        if (self.quicken and quickened_class is not None and not issubclass(guard, TypedArray) and
+                not getattr(expression, "deoptimized", False)):
+            expression.guard = guard
+            expression.operation = operation
+            expression.__dict__.update(attributes)
+            expression.__class__ = quickened_class
+
+    @staticmethod
+    def _deoptimize(expression: Expression):
+        expression.__class__ = GENERIC_NODES[type(expression)]
+        expression.deoptimized = True
+
+    @staticmethod
+    def _check_operand(value, allowed_types: list[type], expression: Expression):
+        value_type = type(value)
+        if value_type not in allowed_types and not is_vector(value):
+            raise WrongExpressionTypeError(value_type, allowed_types, expression.position)
+
+    def _apply_arithmetic(self, expression: Expression, operator_func: Callable, left, right):
+        if is_vector(left) or is_vector(right):
+            return self.vectorizer.arithmetic(expression, left, right)
+
+        left_type = type(left)
+        right_type = type(right)
         if left_type != right_type:
-            raise NotMatchingTypesInBinaryExpression(left_type, right_type, left_expr.position)
+            raise NotMatchingTypesInBinaryExpression(left_type, right_type, expression.left.position)
 
         result = operator_func(left, right)
         result_type = type(result)
 
         if result_type != bool and result_type != str:
-            if abs(result) >= sys.maxsize:
-                raise ValueOverflowError(result, expression.position)
-
-            result = round(result, self.number_precision)
+            result = self.numerics.normalize(result, expression.position)
 
-        self.last_result = result
+        return result
 
-    def builtin_print(self) -> None:
-        args, position = self._consume_last_result()
-        transform = lambda x: "true" if x is True else "false" if x is False else x
-        print(*map(transform, args))
+    def builtin_print(self, *args) -> None:
+        transform = lambda x: "true" if x is True else "false" if x is False else str(x)
+        self.output.write(" ".join(map(transform, args)) + "\n")
 
-    def builtin_input(self):
-        self.last_result = input()
+    def builtin_input(self, *_):
+        self.output.flush()
+        return self.input_provider.read_line()
 
 
 def main():
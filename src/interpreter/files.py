@@ -0,0 +1,118 @@
+import io
+from itertools import count
+from typing import BinaryIO, Iterator
+from weakref import WeakSet
+
+from src.ast.types import Type
+from src.interpreter.builtins import BuiltinFunction
+from src.interpreter.input_source import INPUT_BLOCK_SIZE, stream_lines, mapped_lines
+
+INT, BOOL, STRING, VOID, LINES = Type.IntType, Type.BoolType, Type.StringType, Type.VoidType, Type.LineStreamType
+FILE_MODES = ("r", "w", "a")
+
+
+class LineStream:
+    def __init__(self, path: str, file: BinaryIO, lines: Iterator[str]):
+        self.path = path
+        self.file = file
+        self.lines = lines
+        self.lookahead = None
+
+    def __iter__(self) -> Iterator[str]:
+        return self
+
+    def __next__(self) -> str:
+        if (line := self.lookahead) is not None:
+            self.lookahead = None
+            return line
+        if (line := next(self.lines, None)) is None:
+            self.close()
+            raise StopIteration
+        return line
+
+    def read_line(self) -> str:
+        if (line := next(self, None)) is None:
+            raise ValueError(f"end of file {self.path}")
+        return line
+
+    def at_end(self) -> bool:
+        if self.lookahead is None:
+            self.lookahead = next(self.lines, None)
+        return self.lookahead is None
+
+    def close(self):
+        self.lines.close()
+        self.file.close()
+
+    def __str__(self):
+        return f"lines({self.path})"
+
+
+class FileTable:
+    def __init__(self, block_size: int = INPUT_BLOCK_SIZE, encoding: str = "utf-8", mapped: bool = False):
+        self.block_size = block_size
+        self.encoding = encoding
+        self.mapped = mapped
+        self.open_files: dict[int, LineStream | io.TextIOBase] = {}
+        self.streams = WeakSet()
+        self.handles = count(1)
+
+    def builtins(self) -> dict[str, BuiltinFunction]:
+        return {
+            "open": BuiltinFunction(self.open, "open", {(STRING, STRING): INT}),
+            "read_line": BuiltinFunction(self.read_line, "read_line", {(INT,): STRING}),
+            "eof": BuiltinFunction(self.at_end, "eof", {(INT,): BOOL}),
+            "write": BuiltinFunction(self.write, "write", {(INT, STRING): VOID}),
+            "close": BuiltinFunction(self.close, "close", {(INT,): VOID}),
+            "lines": BuiltinFunction(self.lines, "lines", {(STRING,): LINES}),
+        }
+
+    def open(self, path: str, mode: str) -> int:
+        if mode not in FILE_MODES:
+            raise ValueError(f"unknown file mode {mode}, expected r, w or a")
+
+        if mode == "r":
+            file = self._reader(path)
+        else:
+            file = open(path, mode, buffering=self.block_size, encoding=self.encoding, newline="")
+
+        handle = next(self.handles)
+        self.open_files[handle] = file
+        return handle
+
+    def read_line(self, handle: int) -> str:
+        return self._file(handle, LineStream).read_line()
+
+    def at_end(self, handle: int) -> bool:
+        return self._file(handle, LineStream).at_end()
+
+    def write(self, handle: int, text: str):
+        self._file(handle, io.TextIOBase).write(text)
+
+    def close(self, handle: int):
+        self._file(handle).close()
+        del self.open_files[handle]
+
+    def lines(self, path: str) -> LineStream:
+        stream = self._reader(path)
+        self.streams.add(stream)
+        return stream
+
+    def close_all(self):
+        for file in [*self.open_files.values(), *self.streams]:
+            file.close()
+        self.open_files.clear()
+        self.streams.clear()
+
+    def _reader(self, path: str) -> LineStream:
+        file = open(path, "rb", buffering=self.block_size)
+        if self.mapped:
+            return LineStream(path, file, mapped_lines(file, self.encoding))
+        return LineStream(path, file, stream_lines(file, self.block_size, self.encoding))
+
+    def _file(self, handle: int, kind: type = object) -> LineStream | io.TextIOBase:
+        if (file := self.open_files.get(handle)) is None:
+            raise ValueError(f"file {handle} is not open")
+        if not isinstance(file, kind):
+            raise ValueError(f"file {handle} is not open for {'reading' if kind is LineStream else 'writing'}")
+        return file
@@ -0,0 +1,73 @@
+import codecs
+import mmap
+import os
+import sys
+from abc import ABC, abstractmethod
+from typing import BinaryIO, Iterable, Iterator
+
+INPUT_BLOCK_SIZE = 1 << 16
+
+
+class InputProvider(ABC):
+    @abstractmethod
+    def read_line(self) -> str:
+        pass
+
+    def close(self):
+        pass
+
+
+class ConsoleInput(InputProvider):
+    def read_line(self) -> str:
+        return input()
+
+
+class LineInput(InputProvider):
+    def __init__(self, lines: Iterable[str]):
+        self.lines = iter(lines)
+
+    def read_line(self) -> str:
+        if (line := next(self.lines, None)) is None:
+            raise EOFError("No more input lines")
+        return line
+
+
+class ReplayInput(LineInput):
+    def __init__(self, lines: Iterable[str]):
+        self.recorded = list(lines)
+        super().__init__(self.recorded)
+
+
+class StreamInput(LineInput):
+    def __init__(self, stream: BinaryIO = None, block_size: int = INPUT_BLOCK_SIZE, encoding: str = "utf-8"):
+        super().__init__(stream_lines(stream or sys.stdin.buffer, block_size, encoding))
+
+
+class FileInput(LineInput):
+    def __init__(self, path: str, encoding: str = "utf-8"):
+        self.file = open(path, "rb")
+        super().__init__(mapped_lines(self.file, encoding))
+
+    def close(self):
+        self.lines.close()
+        self.file.close()
+
+
+def stream_lines(stream: BinaryIO, block_size: int, encoding: str) -> Iterator[str]:
+    decoder = codecs.getincrementaldecoder(encoding)()
+    pending = ""
+    while block := stream.read1(block_size):
+        *lines, pending = (pending + decoder.decode(block)).split("\n")
+        for line in lines:
+            yield line.removesuffix("\r")
+    if pending := pending + decoder.decode(b"", final=True):
+        yield pending.removesuffix("\r")
+
+
+def mapped_lines(file: BinaryIO, encoding: str) -> Iterator[str]:
+    with file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            while line := mapped.readline():
+                yield line.decode(encoding).removesuffix("\n").removesuffix("\r")
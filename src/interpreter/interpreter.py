@@ -1,25 +1,59 @@
 import argparse
 import sys
+from collections import Counter
 
 from src.errors.interpreter_errors import InterpreterError
 from src.errors.lexer_errors import LexerError
 from src.errors.parser_errors import ParserError
 from src.interpreter.executor import ProgramExecutor
+from src.interpreter.files import FileTable
+from src.interpreter.input_source import InputProvider, ConsoleInput, StreamInput, FileInput
+from src.interpreter.memo_cache import MemoCache, EVICTION_POLICIES
+from src.interpreter.numeric import NUMERIC_MODES
+from src.interpreter.output import OUTPUT_BUFFER_SIZE, OutputSink, StreamSink, FileDescriptorSink
+from src.interpreter.plugins import PluginRegistry, load_plugin, discover_plugins
 from src.interpreter.print_visitor import PrintVisitor
+from src.interpreter.stack_executor import StackExecutor
 from src.lexer.lexer import DefaultLexer
 from src.lexer.source import Source
+from src.optimizer.inlining import INLINE_THRESHOLD
+from src.optimizer.optimizer import optimize
 from src.parser.parser import Parser
 
 
 class Interpreter:
-    def __init__(self, executor: ProgramExecutor):
+    def __init__(self, executor: ProgramExecutor = None):
         self.executor = executor
 
-
     def run(self, args):
         parser = argparse.ArgumentParser(description="Interpreter")
         parser.add_argument("input_file", help="Path to the input file")
         parser.add_argument("--display-ast", action="store_true", help="Display program abstract syntax tree")
+        parser.add_argument("--engine", choices=["tree", "stack"], default="tree",
+                            help="Execution engine: recursive tree walker or explicit-stack evaluator")
+        parser.add_argument("--recursion-limit", type=int, help="Maximum depth of function calls")
+        parser.add_argument("--stack-limit", type=int, help="Maximum evaluation stack size of the stack engine")
+        parser.add_argument("--no-tail-calls", action="store_true", help="Disable tail call elimination")
+        parser.add_argument("--numeric-mode", choices=NUMERIC_MODES, default="strict",
+                            help="Round floats after every operation (strict) or only where values are observed (fast)")
+        parser.add_argument("--output-buffer", type=int, default=OUTPUT_BUFFER_SIZE,
+                            help="Number of characters buffered before output is written, 0 writes every print")
+        parser.add_argument("--output-fd", type=int, help="Write program output directly to this file descriptor")
+        parser.add_argument("--input-file", dest="program_input", help="Read input() lines from this file instead of stdin")
+        parser.add_argument("--mmap-files", action="store_true",
+                            help="Read files opened by the program through memory mapping instead of buffered reads")
+        parser.add_argument("--plugin", action="append", default=[], metavar="MODULE",
+                            help="Load native builtins from a Python module defining register(registry)")
+        parser.add_argument("--optimize", action="store_true", help="Run optimization passes before execution")
+        parser.add_argument("--inline-threshold", type=int, default=INLINE_THRESHOLD,
+                            help="Maximum size of an inlined function body, 0 disables inlining")
+        parser.add_argument("--inline-report", action="store_true", help="Print inlined functions")
+        parser.add_argument("--memoize", action=argparse.BooleanOptionalAction, default=False,
+                            help="Cache results of pure functions")
+        parser.add_argument("--memo-size", type=int, default=1024, help="Maximum number of cached results")
+        parser.add_argument("--memo-eviction", choices=EVICTION_POLICIES, default="lru",
+                            help="Policy used to evict cached results")
+        parser.add_argument("--memo-stats", action="store_true", help="Print memoization statistics on exit")
 
         parsed_args = parser.parse_args(args)
 
@@ -30,11 +64,77 @@ class Interpreter:
             PrintVisitor().visit_program(program)
             sys.exit(0)
 
+        executor = self.executor or self.build_executor(parsed_args)
+
         try:
-            self.executor.execute(program)
+            if parsed_args.optimize:
+                inline_report = Counter()
+                optimize(program, executor.number_precision, parsed_args.inline_threshold, inline_report,
+                         executor.numeric_mode)
+                if parsed_args.inline_report:
+                    self.print_inline_report(inline_report)
+            executor.execute(program)
         except InterpreterError as e:
             print(e, file=sys.stderr)
             sys.exit(1)
+        finally:
+            executor.input_provider.close()
+            if parsed_args.memo_stats and executor.memo_cache is not None:
+                print(executor.memo_cache, file=sys.stderr)
+
+    @staticmethod
+    def print_inline_report(inline_report: Counter):
+        for name, count in sorted(inline_report.items()):
+            print(f"Inlined {name}: {count} call site(s)", file=sys.stderr)
+
+    @staticmethod
+    def build_executor(parsed_args) -> ProgramExecutor:
+        options = {"tail_calls": not parsed_args.no_tail_calls,
+                   "numeric_mode": parsed_args.numeric_mode,
+                   "output": Interpreter.build_output(parsed_args),
+                   "input_provider": Interpreter.build_input(parsed_args),
+                   "plugins": Interpreter.build_plugins(parsed_args),
+                   "files": FileTable(mapped=parsed_args.mmap_files)}
+        if parsed_args.memoize:
+            options["memo_cache"] = MemoCache(parsed_args.memo_size, parsed_args.memo_eviction)
+        if parsed_args.recursion_limit is not None:
+            options["recursion_limit"] = parsed_args.recursion_limit
+
+        if parsed_args.engine == "stack":
+            if parsed_args.stack_limit is not None:
+                options["stack_limit"] = parsed_args.stack_limit
+            return StackExecutor(**options)
+
+        return ProgramExecutor(**options)
+
+    @staticmethod
+    def build_output(parsed_args) -> OutputSink:
+        if parsed_args.output_fd is not None:
+            return FileDescriptorSink(parsed_args.output_fd, parsed_args.output_buffer)
+        return StreamSink(buffer_size=parsed_args.output_buffer)
+
+    @staticmethod
+    def build_input(parsed_args) -> InputProvider:
+        if parsed_args.program_input is not None:
+            try:
+                return FileInput(parsed_args.program_input)
+            except FileNotFoundError:
+                print(f"File not found: {parsed_args.program_input}", file=sys.stderr)
+                sys.exit(1)
+        if sys.stdin.isatty():
+            return ConsoleInput()
+        return StreamInput()
+
+    @staticmethod
+    def build_plugins(parsed_args) -> PluginRegistry:
+        registry = discover_plugins()
+        for module_name in parsed_args.plugin:
+            try:
+                load_plugin(module_name, registry)
+            except (ImportError, AttributeError, ValueError) as e:
+                print(f"Cannot load plugin {module_name}: {e}", file=sys.stderr)
+                sys.exit(1)
+        return registry
 
     @staticmethod
     def build_program(input_file_path):
@@ -54,8 +154,7 @@ class Interpreter:
             raise RuntimeError(e)
 
 def main():
-    executor = ProgramExecutor()
-    interpreter = Interpreter(executor)
+    interpreter = Interpreter()
     interpreter.run(sys.argv[1:])
 
 if __name__ == "__main__":
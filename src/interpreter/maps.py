@@ -0,0 +1,28 @@
+MAP_ELEMENT_TYPES = (int, float, bool, str)
+
+
+class TypedMap(dict):
+    key_type = None
+    value_type = None
+
+    def __str__(self):
+        return f"{{{', '.join(f'{_format(key)}: {_format(value)}' for key, value in self.items())}}}"
+
+
+def _format(value) -> str:
+    return "true" if value is True else "false" if value is False else str(value)
+
+
+def _map_class(key_type: type, value_type: type) -> type[TypedMap]:
+    name = f"map<{key_type.__name__}, {value_type.__name__}>"
+    return type(name, (TypedMap,), {"key_type": key_type, "value_type": value_type})
+
+
+def remove(values: TypedMap, key):
+    if key not in values:
+        raise ValueError(f"key {_format(key)} not found")
+    del values[key]
+
+
+MAP_OF = {(key_type, value_type): _map_class(key_type, value_type)
+          for key_type in MAP_ELEMENT_TYPES for value_type in MAP_ELEMENT_TYPES}
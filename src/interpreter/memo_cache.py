@@ -0,0 +1,42 @@
+from collections import OrderedDict
+from typing import Any, Hashable
+
+EVICTION_POLICIES = ("lru", "fifo")
+
+
+class MemoCache:
+    def __init__(self, max_size: int = 1024, eviction: str = "lru"):
+        if eviction not in EVICTION_POLICIES:
+            raise ValueError(f"Unknown eviction policy {eviction}, expected one of {EVICTION_POLICIES}")
+        self.max_size = max_size
+        self.eviction = eviction
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def lookup(self, key: Hashable) -> tuple[bool, Any]:
+        if key in self.entries:
+            self.hits += 1
+            if self.eviction == "lru":
+                self.entries.move_to_end(key)
+            return True, self.entries[key]
+
+        self.misses += 1
+        return False, None
+
+    def store(self, key: Hashable, value: Any):
+        if self.max_size <= 0:
+            return
+
+        self.entries[key] = value
+        if len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __str__(self):
+        return (f"Memo cache: size={len(self)}/{self.max_size}, eviction={self.eviction}, "
+                f"hits={self.hits}, misses={self.misses}, evictions={self.evictions}")
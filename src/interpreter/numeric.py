@@ -0,0 +1,46 @@
+import sys
+
+from src.ast.position import Position
+from src.errors.interpreter_errors import ValueOverflowError
+
+NUMERIC_MODES = ("strict", "fast")
+
+
+class StrictNumerics:
+    rounds_results = True
+
+    def __init__(self, number_precision: int = 15):
+        self.number_precision = number_precision
+
+    def normalize(self, result: int | float, position: Position) -> int | float:
+        if result >= sys.maxsize or result <= -sys.maxsize:
+            raise ValueOverflowError(result, position)
+        return round(result, self.number_precision) if type(result) is float else result
+
+    def observe(self, value, position: Position):
+        return value
+
+
+class FastNumerics(StrictNumerics):
+    rounds_results = False
+
+    def normalize(self, result: int | float, position: Position) -> int | float:
+        if type(result) is int and (result >= sys.maxsize or result <= -sys.maxsize):
+            raise ValueOverflowError(result, position)
+        return result
+
+    def observe(self, value, position: Position):
+        if type(value) is not float:
+            return value
+        if abs(value) >= sys.maxsize:
+            raise ValueOverflowError(value, position)
+        return round(value, self.number_precision)
+
+
+def create_numerics(numeric_mode: str, number_precision: int) -> StrictNumerics:
+    match numeric_mode:
+        case "strict":
+            return StrictNumerics(number_precision)
+        case "fast":
+            return FastNumerics(number_precision)
+    raise ValueError(f"Unknown numeric mode {numeric_mode}, expected one of {NUMERIC_MODES}")
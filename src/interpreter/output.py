@@ -0,0 +1,53 @@
+import os
+import sys
+from abc import ABC, abstractmethod
+from typing import TextIO
+
+OUTPUT_BUFFER_SIZE = 1 << 16
+
+
+class OutputSink(ABC):
+    def __init__(self, buffer_size: int = OUTPUT_BUFFER_SIZE):
+        self.buffer_size = buffer_size
+        self.chunks = []
+        self.buffered = 0
+
+    def write(self, text: str):
+        self.chunks.append(text)
+        self.buffered += len(text)
+        if self.buffered >= self.buffer_size:
+            self.flush()
+
+    def flush(self):
+        if self.chunks:
+            text = "".join(self.chunks)
+            self.chunks.clear()
+            self.buffered = 0
+            self._write_out(text)
+
+    @abstractmethod
+    def _write_out(self, text: str):
+        pass
+
+
+class StreamSink(OutputSink):
+    def __init__(self, stream: TextIO = None, buffer_size: int = OUTPUT_BUFFER_SIZE):
+        super().__init__(buffer_size)
+        self.stream = stream
+
+    def _write_out(self, text: str):
+        stream = self.stream or sys.stdout
+        stream.write(text)
+        stream.flush()
+
+
+class FileDescriptorSink(OutputSink):
+    def __init__(self, fd: int, buffer_size: int = OUTPUT_BUFFER_SIZE, encoding: str = "utf-8"):
+        super().__init__(buffer_size)
+        self.fd = fd
+        self.encoding = encoding
+
+    def _write_out(self, text: str):
+        data = memoryview(text.encode(self.encoding))
+        while data:
+            data = data[os.write(self.fd, data):]
@@ -0,0 +1,49 @@
+import importlib
+from importlib.metadata import entry_points
+from typing import Any, Callable, Optional, Type as PythonType
+
+from src.ast.types import Type
+from src.interpreter.builtins import BuiltinFunction, BuiltinException
+from src.interpreter.files import FileTable
+from src.interpreter.stdlib import STDLIB
+
+PLUGIN_ENTRY_POINT_GROUP = "xd_interpreter.plugins"
+RESERVED_NAMES = frozenset({"print", "input", *STDLIB, *FileTable().builtins()})
+
+
+class PluginRegistry:
+    def __init__(self):
+        self.functions: dict[str, BuiltinFunction] = {}
+        self.exceptions: dict[str, BuiltinException] = {}
+
+    def add_function(self, name: str, handler: Callable,
+                     signatures: Optional[dict[tuple[Type, ...], Type]] = None):
+        if name in RESERVED_NAMES:
+            raise ValueError(f"plugin function {name} would replace a builtin function")
+        self.functions[name] = BuiltinFunction(handler, name, signatures)
+
+    def function(self, name: str = None, signatures: Optional[dict[tuple[Type, ...], Type]] = None):
+        def decorator(handler: Callable) -> Callable:
+            self.add_function(name or handler.__name__, handler, signatures)
+            return handler
+        return decorator
+
+    def add_exception(self, name: str, exception_object: PythonType[Any]):
+        self.exceptions[name] = BuiltinException(exception_object)
+
+    def update(self, other: 'PluginRegistry'):
+        self.functions.update(other.functions)
+        self.exceptions.update(other.exceptions)
+
+
+def load_plugin(module_name: str, registry: PluginRegistry = None) -> PluginRegistry:
+    registry = registry or PluginRegistry()
+    importlib.import_module(module_name).register(registry)
+    return registry
+
+
+def discover_plugins(registry: PluginRegistry = None) -> PluginRegistry:
+    registry = registry or PluginRegistry()
+    for entry_point in entry_points(group=PLUGIN_ENTRY_POINT_GROUP):
+        entry_point.load()(registry)
+    return registry
@@ -1,20 +1,27 @@
+from typing import Any, Optional
+
 from src.ast.core_structures import Program, Function
 from src.ast.expressions import AdditiveExpression, RelationalExpression, MultiplicativeExpression, \
     GreaterThanExpression, GreaterThanOrEqualsExpression, LessThanOrEqualsExpression, LessThanExpression, \
     NotEqualsExpression, EqualsExpression, MinusExpression, PlusExpression, ModuloExpression, DivideExpression, \
     MultiplyExpression, IntLiteral, StringLiteral, FloatLiteral, BoolLiteral, Variable, AttributeCall, \
-    UnaryMinusExpression, NegatedExpression, CastedExpression, AndExpression, OrExpression
+    UnaryMinusExpression, NegatedExpression, CastedExpression, AndExpression, OrExpression, InvariantExpression, \
+    InlinedCall, InlinedParameter, IndexExpression, MapLiteral
+from src.ast.position import Position
 from src.ast.statemens import AssignmentStatement, FunctionCall, ThrowStatement, WhileStatement, CatchStatement, \
-    TryCatchStatement, ReturnStatement, ContinueStatement, BreakStatement, IfStatement, Attribute, StatementBlock
+    TryCatchStatement, ReturnStatement, ContinueStatement, BreakStatement, IfStatement, Attribute, StatementBlock, \
+    IndexAssignmentStatement, ForStatement, ForRangeStatement
 from src.ast.visitor import Visitor
 from src.interpreter.builtins import BuiltinFunction, BuiltinException
 
 
 class PrintVisitor(Visitor):
-    def visit_builtin_exception(self, builtin_exception: BuiltinException):
+    def visit_builtin_exception(self, builtin_exception: BuiltinException, arguments: Optional[list] = None,
+                                throw_position: Optional[Position] = None):
         pass
 
-    def visit_builtin_function(self, builtin_function: BuiltinFunction):
+    def visit_builtin_function(self, builtin_function: BuiltinFunction, arguments: Optional[list] = None,
+                               call_position: Optional[Position] = None):
         pass
 
     def __init__(self):
@@ -34,7 +41,8 @@ class PrintVisitor(Visitor):
 
         self._print_with_indent("]")
 
-    def visit_function(self, function: Function):
+    def visit_function(self, function: Function, arguments: Optional[list] = None,
+                       call_position: Optional[Position] = None):
         self.indent += 1
         self._print_with_indent("Function [")
 
@@ -65,7 +73,8 @@ class PrintVisitor(Visitor):
         for statement in statement_block.statements:
             statement.accept(self)
 
-    def visit_exception(self, exception: Exception):
+    def visit_exception(self, exception: Exception, arguments: Optional[list] = None,
+                        throw_position: Optional[Position] = None):
         self.indent += 1
         self._print_with_indent("Exception [")
         self.indent += 1
@@ -184,7 +193,7 @@ class PrintVisitor(Visitor):
         self._print_with_indent("]")
         self.indent -= 1
 
-    def visit_catch_statement(self, catch_statement: CatchStatement):
+    def visit_catch_statement(self, catch_statement: CatchStatement, exception: Optional[Any] = None):
         self.indent += 1
         self._print_with_indent("CatchStatement(")
         self.indent += 1
@@ -221,6 +230,52 @@ class PrintVisitor(Visitor):
         self._print_with_indent("]")
         self.indent -= 1
 
+    def visit_for_statement(self, for_statement: ForStatement):
+        self.indent += 1
+        self._print_with_indent(f"ForStatement({for_statement.variable})[")
+        self.indent += 1
+
+        self._print_with_indent("iterable=[")
+        for_statement.iterable.accept(self)
+        self._print_with_indent("]")
+
+        self._print_with_indent("for_block=[")
+        self.indent += 1
+
+        for_statement.block.accept(self)
+
+        self.indent -= 1
+        self._print_with_indent("]")
+
+        self.indent -= 1
+        self._print_with_indent("]")
+        self.indent -= 1
+
+    def visit_for_range_statement(self, for_range_statement: ForRangeStatement):
+        self.indent += 1
+        self._print_with_indent(f"ForRangeStatement({for_range_statement.variable})[")
+        self.indent += 1
+
+        self._print_with_indent("start=[")
+        for_range_statement.start.accept(self)
+        self._print_with_indent("]")
+
+        self._print_with_indent("end=[")
+        for_range_statement.end.accept(self)
+        self._print_with_indent("]")
+
+        self._print_with_indent("for_block=[")
+        self.indent += 1
+
+        for_range_statement.block.accept(self)
+
+        self.indent -= 1
+        self._print_with_indent("]")
+
+        self.indent -= 1
+        self._print_with_indent("]")
+        self.indent -= 1
+
     def visit_throw_statement(self, throw_statement: ThrowStatement):
         self.indent += 1
         self._print_with_indent("ThrowStatement[")
@@ -273,6 +328,25 @@ class PrintVisitor(Visitor):
         self._print_with_indent(")")
         self.indent -= 1
 
+    def visit_index_assignment_statement(self, index_assignment_statement: IndexAssignmentStatement):
+        self.indent += 1
+        self._print_with_indent("IndexAssignmentStatement(")
+        self.indent += 1
+
+        self._print_with_indent(f"name=\"{index_assignment_statement.name}\"")
+
+        self._print_with_indent("index=[")
+        index_assignment_statement.index.accept(self)
+        self._print_with_indent("]")
+
+        self._print_with_indent("expression=[")
+        index_assignment_statement.expression.accept(self)
+        self._print_with_indent("]")
+
+        self.indent -= 1
+        self._print_with_indent(")")
+        self.indent -= 1
+
     def visit_or_expression(self, or_expression: OrExpression):
         self.indent += 1
         self._print_with_indent("OrExpression(")
@@ -345,6 +419,42 @@ class PrintVisitor(Visitor):
         self._print_with_indent(")")
         self.indent -= 1
 
+    def visit_invariant_expression(self, invariant_expression: InvariantExpression):
+        self.indent += 1
+        self._print_with_indent("InvariantExpression(")
+        self.indent += 1
+
+        self._print_with_indent("expression=[")
+        invariant_expression.expression.accept(self)
+        self._print_with_indent("]")
+        self._print_with_indent(f"slot={invariant_expression.slot}")
+
+        self.indent -= 1
+        self._print_with_indent(")")
+        self.indent -= 1
+
+    def visit_inlined_call(self, inlined_call: InlinedCall):
+        self.indent += 1
+        self._print_with_indent(f"InlinedCall({inlined_call.name}")
+        self.indent += 1
+
+        self._print_with_indent("arguments=[")
+        for argument in inlined_call.arguments:
+            argument.accept(self)
+        self._print_with_indent("]")
+        self._print_with_indent("body=[")
+        inlined_call.body.accept(self)
+        self._print_with_indent("]")
+
+        self.indent -= 1
+        self._print_with_indent(")")
+        self.indent -= 1
+
+    def visit_inlined_parameter(self, inlined_parameter: InlinedParameter):
+        self.indent += 1
+        self._print_with_indent(f"InlinedParameter({inlined_parameter.name}, {inlined_parameter.index})")
+        self.indent -= 1
+
     def visit_attribute_call(self, attribute_call: AttributeCall):
         self.indent += 1
         self._print_with_indent("AttributeCall(")
@@ -357,6 +467,40 @@ class PrintVisitor(Visitor):
         self._print_with_indent(")")
         self.indent -= 1
 
+    def visit_index_expression(self, index_expression: IndexExpression):
+        self.indent += 1
+        self._print_with_indent("IndexExpression(")
+        self.indent += 1
+
+        self._print_with_indent("array=[")
+        index_expression.array.accept(self)
+        self._print_with_indent("]")
+
+        self._print_with_indent("index=[")
+        index_expression.index.accept(self)
+        self._print_with_indent("]")
+
+        self.indent -= 1
+        self._print_with_indent(")")
+        self.indent -= 1
+
+    def visit_map_literal(self, map_literal: MapLiteral):
+        self.indent += 1
+        self._print_with_indent(f"MapLiteral({map_literal.map_type})[")
+        self.indent += 1
+
+        for key, value in map_literal.entries:
+            self._print_with_indent("key=[")
+            key.accept(self)
+            self._print_with_indent("]")
+            self._print_with_indent("value=[")
+            value.accept(self)
+            self._print_with_indent("]")
+
+        self.indent -= 1
+        self._print_with_indent("]")
+        self.indent -= 1
+
     def visit_variable(self, variable: Variable):
         self.indent += 1
         self._print_with_indent(f"Variable({variable.name})")
@@ -0,0 +1,11 @@
+class Rope:
+    def __init__(self, parts: list[str]):
+        self.parts = parts
+
+    def append(self, parts: list[str]):
+        self.parts.extend(parts)
+
+    def flatten(self) -> str:
+        if len(self.parts) != 1:
+            self.parts = ["".join(self.parts)]
+        return self.parts[0]
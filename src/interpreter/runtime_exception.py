@@ -1,17 +1,24 @@
 from typing import Any
 
-from src.ast.core_structures import CustomException
+from src.ast.position import Position
 from src.interpreter.builtins import BasicException
 
 
 class RuntimeUserException(BasicException):
-    def __init__(self, name: str,
-                 attributes: list[tuple[str, Any]]):
-        position = next((attr for name, attr in attributes if name == 'position'))
-        message = next((attr for name, attr in attributes if name == 'message'))
-        super().__init__(position, message)
+    __slots__ = ()
+
+    def __init__(self, name: str, attributes: dict[str, Any], position: Position):
         self.name = name
         self.attributes = attributes
+        self.position = position
 
     def __str__(self):
-        return f"{self.name} at {self.attributes[0]}: {self.attributes[1]}"
+        if "message" not in self.attributes:
+            return f"{self.name} at {self.position}"
+        return f"{self.name} at {self.position}: {self.attributes['message']}"
+
+
+class ThrownException(Exception):
+    def __init__(self, exception: BasicException):
+        super().__init__(exception)
+        self.exception = exception
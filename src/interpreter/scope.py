@@ -4,7 +4,6 @@ value_types = int|float|str|bool
 class Scope:
     def __init__(self):
         self.variables = {}
-        self.exception_attributes = {}
 
     def declare_variable(self, name: str, value: value_types) -> bool:
         if self.contains(name):
@@ -20,16 +19,3 @@ class Scope:
 
     def get_variable(self, name: str) -> value_types:
         return self.variables.get(name)
-
-    def contains_attribute(self, exception_id: str, attribute_name: str) -> bool:
-        if exception_id not in self.exception_attributes:
-            return False
-        return attribute_name in self.exception_attributes[exception_id]
-
-    def add_attribute(self, exception_id:str, name:str, value: value_types):
-        if exception_id not in self.exception_attributes:
-            self.exception_attributes[exception_id] = {}
-        self.exception_attributes[exception_id][name] = value
-
-    def get_attribute(self, exception_id: str, attribute_name: str):
-        return self.exception_attributes[exception_id][attribute_name]
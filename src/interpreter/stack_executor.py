@@ -0,0 +1,488 @@
+from types import GeneratorType
+from typing import Callable
+
+from src.ast.core_structures import Function, CustomException
+from src.ast.expressions import *
+from src.ast.quickened import QuickenedArithmeticExpression, QuickenedComparison, QuickenedCastedExpression, \
+    ResolvedCastedExpression
+from src.ast.node import Node
+from src.ast.statemens import *
+from src.errors.interpreter_errors import EvaluationStackOverflowError
+from src.interpreter.builtins import BasicException
+from src.interpreter.executor import ProgramExecutor
+from src.interpreter.files import FileTable
+from src.interpreter.input_source import InputProvider
+from src.interpreter.memo_cache import MemoCache
+from src.interpreter.output import OutputSink
+from src.interpreter.plugins import PluginRegistry
+from src.interpreter.runtime_exception import ThrownException
+from src.interpreter.value_types import TYPE_TO_VALUE_MAP
+from src.optimizer.walker import child_nodes
+
+
+UNWINDING_NODES = (FunctionCall, ThrowStatement, TryCatchStatement, CatchStatement)
+
+
+class StackExecutor(ProgramExecutor):
+    def __init__(self, recursion_limit=500_000, number_precision=15, stack_limit=20_000_000, tail_calls=True,
+                 memo_cache: MemoCache = None, quicken=True, numeric_mode="strict", ropes=True,
+                 output: OutputSink = None, input_provider: InputProvider = None, plugins: PluginRegistry = None,
+                 files: FileTable = None):
+        super().__init__(recursion_limit, number_precision, tail_calls, memo_cache, quicken, numeric_mode, ropes,
+                         output, input_provider, plugins, files)
+        self.stack_limit = stack_limit
+        self.max_stack_depth = 0
+
+    def _run(self, node: Node):
+        result = node.accept(self)
+        if type(result) is not GeneratorType:
+            return result
+
+        stack = [result]
+        stack_limit = self.stack_limit
+        max_depth = 1
+        value = None
+        thrown = None
+
+        while stack:
+            try:
+                if thrown is None:
+                    request = stack[-1].send(value)
+                else:
+                    request, thrown = stack[-1].throw(thrown), None
+            except StopIteration as stop:
+                stack.pop()
+                value = stop.value
+                continue
+            except ThrownException as exception:
+                stack.pop()
+                thrown = exception.with_traceback(None)
+                continue
+
+            try:
+                if type(request) is tuple:
+                    result = request[0].accept(self, *request[1:])
+                else:
+                    result = request.accept(self)
+            except ThrownException as exception:
+                thrown = exception.with_traceback(None)
+                continue
+
+            if type(result) is GeneratorType:
+                stack.append(result)
+                if len(stack) > max_depth:
+                    max_depth = len(stack)
+                    if max_depth > stack_limit:
+                        raise EvaluationStackOverflowError(stack_limit)
+                value = None
+            else:
+                value = result
+
+        self.max_stack_depth = max(self.max_stack_depth, max_depth)
+        if thrown is not None:
+            raise thrown
+        return value
+
+    def _is_call_free(self, node) -> bool:
+        if (call_free := getattr(node, "call_free", None)) is None:
+            call_free = (not isinstance(node, UNWINDING_NODES) and
+                         all(self._is_call_free(child) for child in child_nodes(node)))
+            node.call_free = call_free
+        return call_free
+
+    def visit_function(self, function_def: Function, eval_arguments: list, call_position: Position):
+        memo_key = self._memo_key(function_def, eval_arguments)
+        if memo_key is not None:
+            hit, value = self.memo_cache.lookup(memo_key)
+            if hit:
+                return value
+        return self._function_generator(function_def, eval_arguments, call_position, memo_key)
+
+    def _function_generator(self, function_def: Function, eval_arguments: list, call_position: Position, memo_key):
+        context = self._enter_function(function_def, eval_arguments, call_position)
+        yield function_def.statement_block
+
+        while context.tail_call is not None:
+            function_def = self._enter_tail_call(function_def, context)
+            yield function_def.statement_block
+
+        return self._memoize(memo_key, self._leave_function(function_def, context, call_position))
+
+    def visit_exception(self, exception_def: CustomException, eval_arguments: list, throw_position: Position):
+        context = self._enter_exception(exception_def, eval_arguments, throw_position)
+
+        eval_attributes = {}
+        for attr in exception_def.attributes:
+            value = self._required((yield attr))
+            self._add_attribute(exception_def, eval_attributes, attr.name, value, attr.position)
+
+        self._leave_exception(exception_def, context, eval_attributes, throw_position)
+
+    def visit_attribute(self, attribute: Attribute):
+        if self._is_call_free(attribute.expression):
+            return super().visit_attribute(attribute)
+        return self._evaluate_generator(attribute.expression)
+
+    def visit_statement_block(self, statement_block: StatementBlock):
+        if self._is_call_free(statement_block):
+            return super().visit_statement_block(statement_block)
+        return self._statement_block_generator(statement_block)
+
+    def _statement_block_generator(self, statement_block: StatementBlock):
+        context = self.context_stack[-1]
+        if statement_block.needs_scope:
+            context.push_scope()
+
+        for statement in statement_block.statements:
+            yield statement
+
+            if self.return_flag or self.break_flag or self.continue_flag:
+                break
+
+        if statement_block.needs_scope:
+            context.pop_scope()
+
+    def visit_if_statement(self, if_statement: IfStatement):
+        if self._is_call_free(if_statement):
+            return super().visit_if_statement(if_statement)
+        return self._if_statement_generator(if_statement)
+
+    def _if_statement_generator(self, if_statement: IfStatement):
+        condition_value = self._required((yield if_statement.condition))
+
+        if self._check_condition(condition_value, if_statement.condition):
+            yield if_statement.if_block
+            return
+
+        for elif_condition, elif_block in if_statement.elif_statement:
+            elif_condition_value = self._required((yield elif_condition))
+
+            if self._check_condition(elif_condition_value, elif_condition):
+                yield elif_block
+                return
+
+        if if_statement.else_block is not None:
+            yield if_statement.else_block
+
+    def visit_return_statement(self, return_statement: ReturnStatement):
+        if self._is_call_free(return_statement):
+            return super().visit_return_statement(return_statement)
+        return self._return_statement_generator(return_statement)
+
+    def _return_statement_generator(self, return_statement: ReturnStatement):
+        if return_statement.tail_call and self.tail_calls:
+            function_call = return_statement.expression
+            eval_arguments = yield from self._arguments_generator(function_call)
+
+            function_def = self._resolve_function(function_call)
+            if isinstance(function_def, Function):
+                self._schedule_tail_call(function_call, eval_arguments)
+                return
+
+            self._check_call_depth(function_call)
+            return_value = yield function_def, eval_arguments, function_call.position
+        else:
+            return_value = yield return_statement.expression
+
+        self._set_return_value(return_value)
+
+    def visit_try_catch_statement(self, try_catch_statement: TryCatchStatement):
+        unwind_mark = self._unwind_mark()
+        try:
+            yield try_catch_statement.try_block
+            return
+        except ThrownException as thrown:
+            exception = thrown.exception
+            if (catch := self._select_catch(try_catch_statement, exception)) is None:
+                raise
+
+        self._unwind(unwind_mark)
+        yield catch, exception
+
+    def visit_catch_statement(self, catch: CatchStatement, exception: BasicException):
+        context = self.context_stack[-1]
+        shadowed = self._enter_catch(context, catch, exception)
+        try:
+            yield catch.block
+        finally:
+            self._leave_catch(context, catch, shadowed)
+
+    def visit_while_statement(self, while_statement: WhileStatement):
+        if self._is_call_free(while_statement):
+            return super().visit_while_statement(while_statement)
+        return self._while_statement_generator(while_statement)
+
+    def _while_statement_generator(self, while_statement: WhileStatement):
+        self._enter_loop(while_statement)
+        condition_value = self._required((yield while_statement.condition))
+
+        while self._check_condition(condition_value, while_statement.condition):
+            yield while_statement.block
+
+            if self.break_flag or self.return_flag:
+                self.break_flag = False
+                break
+
+            self.continue_flag = False
+
+            condition_value = self._required((yield while_statement.condition))
+
+    def visit_for_statement(self, for_statement: ForStatement):
+        if self._is_call_free(for_statement):
+            return super().visit_for_statement(for_statement)
+        return self._for_statement_generator(for_statement)
+
+    def _for_statement_generator(self, for_statement: ForStatement):
+        iterable = self._required((yield for_statement.iterable))
+
+        for value in self._iteration_values(for_statement, iterable):
+            self._bind_variable(for_statement.variable, value, for_statement.iterable.position, for_statement.position)
+            yield for_statement.block
+
+            if self.break_flag or self.return_flag:
+                self.break_flag = False
+                break
+
+            self.continue_flag = False
+
+    def visit_for_range_statement(self, for_range_statement: ForRangeStatement):
+        if self._is_call_free(for_range_statement):
+            return super().visit_for_range_statement(for_range_statement)
+        return self._for_range_statement_generator(for_range_statement)
+
+    def _for_range_statement_generator(self, for_range_statement: ForRangeStatement):
+        start = self._required((yield for_range_statement.start))
+        end = self._required((yield for_range_statement.end))
+        variables = self._enter_range(for_range_statement, start, end)
+        name = for_range_statement.variable
+        for value in range(start, end):
+            variables[name] = value
+            yield for_range_statement.block
+
+            if self.break_flag or self.return_flag:
+                self.break_flag = False
+                return
+
+            self.continue_flag = False
+
+        variables[name] = max(start, end)
+
+    def visit_throw_statement(self, throw_statement: ThrowStatement):
+        eval_arguments = []
+        for argument in throw_statement.args:
+            value = self._required((yield argument))
+
+            eval_arguments.append(value)
+
+        exception_def = self._resolve_exception(throw_statement)
+        yield exception_def, eval_arguments, throw_statement.position
+
+    def visit_function_call(self, function_call: FunctionCall):
+        self._check_call_depth(function_call)
+
+        eval_arguments = yield from self._arguments_generator(function_call)
+
+        function_def = self._resolve_function(function_call)
+        return (yield function_def, eval_arguments, function_call.position)
+
+    def visit_inlined_call(self, inlined_call: InlinedCall):
+        if self._is_call_free(inlined_call):
+            return super().visit_inlined_call(inlined_call)
+        return self._inlined_call_generator(inlined_call)
+
+    def _inlined_call_generator(self, inlined_call: InlinedCall):
+        eval_arguments = yield from self._arguments_generator(inlined_call)
+
+        inline_arguments = self.context_stack[-1].inline_arguments
+        inline_arguments.append(eval_arguments)
+        return_value = yield inlined_call.body
+        inline_arguments.pop()
+
+        return self._check_inlined_return(inlined_call, return_value)
+
+    def _arguments_generator(self, function_call: FunctionCall | InlinedCall):
+        eval_arguments = []
+        for argument in function_call.arguments:
+            value = self._required((yield argument))
+
+            eval_arguments.append(value)
+
+        return eval_arguments
+
+    def visit_index_expression(self, index_expression: IndexExpression):
+        if self._is_call_free(index_expression):
+            return super().visit_index_expression(index_expression)
+        return self._index_expression_generator(index_expression)
+
+    def _index_expression_generator(self, index_expression: IndexExpression):
+        collection = self._required((yield index_expression.array))
+
+        index = self._required((yield index_expression.index))
+
+        return self._load_element(index_expression, collection, index)
+
+    def visit_map_literal(self, map_literal: MapLiteral):
+        if self._is_call_free(map_literal):
+            return super().visit_map_literal(map_literal)
+        return self._map_literal_generator(map_literal)
+
+    def _map_literal_generator(self, map_literal: MapLiteral):
+        values = TYPE_TO_VALUE_MAP[map_literal.map_type]()
+        for key_expression, value_expression in map_literal.entries:
+            key = self._required((yield key_expression))
+
+            value = self._required((yield value_expression))
+
+            self._put_entry(values, key_expression, key, value_expression, value)
+
+        return values
+
+    def visit_index_assignment_statement(self, index_assignment_statement: IndexAssignmentStatement):
+        if self._is_call_free(index_assignment_statement):
+            return super().visit_index_assignment_statement(index_assignment_statement)
+        return self._index_assignment_statement_generator(index_assignment_statement)
+
+    def _index_assignment_statement_generator(self, index_assignment_statement: IndexAssignmentStatement):
+        index = self._required((yield index_assignment_statement.index))
+
+        value = self._required((yield index_assignment_statement.expression))
+
+        self._store_element(index_assignment_statement, index, value)
+
+    def visit_assignment_statement(self, assigment_statement: AssignmentStatement):
+        if self._is_call_free(assigment_statement):
+            return super().visit_assignment_statement(assigment_statement)
+        return self._assignment_statement_generator(assigment_statement)
+
+    def _assignment_statement_generator(self, assigment_statement: AssignmentStatement):
+        if self.ropes and (appended := self._appended_expressions(assigment_statement)) and (
+                (rope := self._append_target(assigment_statement)) is not None):
+            parts = []
+            for plus_expression in appended:
+                value = self._required((yield plus_expression.right))
+
+                parts.append(self._check_appended(plus_expression, value))
+
+            return self._append(assigment_statement, rope, parts)
+
+        value = self._required((yield assigment_statement.expression))
+
+        self._assign(assigment_statement, value)
+
+    def visit_or_expression(self, or_expression: OrExpression):
+        if self._is_call_free(or_expression):
+            return super().visit_or_expression(or_expression)
+        return self._or_expression_generator(or_expression)
+
+    def _or_expression_generator(self, or_expression: OrExpression):
+        left = self._required((yield or_expression.left))
+
+        if self._assert_bool(left, or_expression.left.position):
+            return True
+
+        right = self._required((yield or_expression.right))
+
+        return self._assert_bool(right, or_expression.right.position)
+
+    def visit_and_expression(self, and_expression: AndExpression):
+        if self._is_call_free(and_expression):
+            return super().visit_and_expression(and_expression)
+        return self._and_expression_generator(and_expression)
+
+    def _and_expression_generator(self, and_expression: AndExpression):
+        left = self._required((yield and_expression.left))
+
+        if not self._assert_bool(left, and_expression.left.position):
+            return False
+
+        right = self._required((yield and_expression.right))
+
+        return self._assert_bool(right, and_expression.right.position)
+
+    def visit_casted_expression(self, casted_expression: CastedExpression):
+        if self._is_call_free(casted_expression):
+            return super().visit_casted_expression(casted_expression)
+        return self._casted_expression_generator(casted_expression)
+
+    def visit_resolved_cast(self, casted_expression: ResolvedCastedExpression):
+        if self._is_call_free(casted_expression):
+            return super().visit_resolved_cast(casted_expression)
+        return self._resolved_cast_generator(casted_expression)
+
+    def _resolved_cast_generator(self, casted_expression: ResolvedCastedExpression):
+        value = self._required((yield casted_expression.expression))
+
+        return casted_expression.operation(self.numerics.observe(value, casted_expression.position))
+
+    def visit_quickened_cast(self, casted_expression: QuickenedCastedExpression):
+        if self._is_call_free(casted_expression):
+            return super().visit_quickened_cast(casted_expression)
+        return self._casted_expression_generator(casted_expression)
+
+    def _casted_expression_generator(self, casted_expression: CastedExpression):
+        value = self._required((yield casted_expression.expression))
+
+        value = self.numerics.observe(value, casted_expression.position)
+        return self._cast_expression(value, casted_expression.to_type, casted_expression.position)
+
+    def _evaluate_generator(self, expression: Expression):
+        return self._required((yield expression))
+
+    def _evaluate_unary_expression(
+            self,
+            expression: Expression,
+            expected_types: list[type] | type,
+            position: Position,
+            operator_fn: Callable
+    ):
+        if self._is_call_free(expression):
+            return super()._evaluate_unary_expression(expression, expected_types, position, operator_fn)
+        return self._unary_expression_generator(expression, expected_types, position, operator_fn)
+
+    def _unary_expression_generator(self, expression, expected_types, position, operator_fn):
+        value = self._required((yield expression))
+
+        return self._apply_unary(value, expected_types, position, operator_fn)
+
+    def _visit_binary_comparison(self, expr, op_func):
+        if self._is_call_free(expr):
+            return super()._visit_binary_comparison(expr, op_func)
+        return self._binary_comparison_generator(expr, op_func)
+
+    def visit_quickened_comparison(self, expr: QuickenedComparison):
+        if self._is_call_free(expr):
+            return super().visit_quickened_comparison(expr)
+        return self._binary_comparison_generator(expr, expr.operation)
+
+    def _binary_comparison_generator(self, expr, op_func):
+        left = self._required((yield expr.left))
+
+        right = self._required((yield expr.right))
+
+        return self._compare_observed(expr, op_func, left, right)
+
+    def _evaluate_arithmetic_expression(
+            self,
+            expression: Expression,
+            operator_func: Callable,
+            allowed_types: list[type],
+    ):
+        if self._is_call_free(expression):
+            return super()._evaluate_arithmetic_expression(expression, operator_func, allowed_types)
+        return self._arithmetic_expression_generator(expression, operator_func, allowed_types)
+
+    def visit_quickened_arithmetic(self, expression: QuickenedArithmeticExpression):
+        if self._is_call_free(expression):
+            return super().visit_quickened_arithmetic(expression)
+        return self._arithmetic_expression_generator(expression, expression.operation, expression.allowed_types)
+
+    def _arithmetic_expression_generator(self, expression, operator_func, allowed_types):
+        left = self._required((yield expression.left))
+
+        self._check_operand(left, allowed_types, expression.left)
+
+        right = self._required((yield expression.right))
+
+        self._check_operand(right, allowed_types, expression.right)
+
+        return self._apply_arithmetic(expression, operator_func, left, right)
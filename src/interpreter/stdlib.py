@@ -0,0 +1,64 @@
+import math
+import operator
+
+from src.ast.types import Type
+from src.interpreter import arrays, maps
+from src.interpreter.builtins import BuiltinFunction
+from src.interpreter.value_types import VALUE_TO_TYPE_MAP
+
+INT, FLOAT, BOOL, STRING, VOID = Type.IntType, Type.FloatType, Type.BoolType, Type.StringType, Type.VoidType
+INTS, FLOATS = Type.IntArrayType, Type.FloatArrayType
+MAPS = [VALUE_TO_TYPE_MAP[map_class] for map_class in maps.MAP_OF.values()]
+
+
+def _substr(text: str, start: int, length: int) -> str:
+    if start < 0 or length < 0:
+        raise ValueError("start and length must not be negative")
+    return text[start:start + length]
+
+
+def _pow(base: int | float, exponent: int | float) -> int | float:
+    if type(base) is int:
+        if exponent < 0:
+            raise ValueError("negative integer exponent")
+        if abs(base) > 1 and exponent >= 64:
+            raise OverflowError("integer result too large")
+        return base ** exponent
+    return math.pow(base, exponent)
+
+
+def _round(value: float, digits: int = None) -> int | float:
+    return round(value, digits) if digits is not None else round(value)
+
+
+STDLIB = {
+    "len": (len, {(STRING,): INT, (INTS,): INT, (FLOATS,): INT, **{(map_type,): INT for map_type in MAPS}}),
+    "substr": (_substr, {(STRING, INT, INT): STRING}),
+    "find": (str.find, {(STRING, STRING): INT}),
+    "replace": (str.replace, {(STRING, STRING, STRING): STRING}),
+    "upper": (str.upper, {(STRING,): STRING}),
+    "lower": (str.lower, {(STRING,): STRING}),
+    "pow": (_pow, {(INT, INT): INT, (FLOAT, FLOAT): FLOAT}),
+    "sqrt": (math.sqrt, {(INT,): FLOAT, (FLOAT,): FLOAT}),
+    "abs": (abs, {(INT,): INT, (FLOAT,): FLOAT}),
+    "min": (min, {(INT, INT): INT, (FLOAT, FLOAT): FLOAT}),
+    "max": (max, {(INT, INT): INT, (FLOAT, FLOAT): FLOAT}),
+    "floor": (math.floor, {(FLOAT,): INT}),
+    "round": (_round, {(FLOAT,): INT, (FLOAT, INT): FLOAT}),
+    "array": (arrays.new_array, {(INT, INT): INTS, (INT, FLOAT): FLOATS}),
+    "append": (arrays.TypedArray.append, {(INTS, INT): VOID, (FLOATS, FLOAT): VOID}),
+    "fill": (arrays.fill, {(INTS, INT): VOID, (FLOATS, FLOAT): VOID}),
+    "copy": (arrays.copy, {(INTS,): INTS, (FLOATS,): FLOATS}),
+    "sort": (arrays.sort, {(INTS,): VOID, (FLOATS,): VOID}),
+    "sum": (sum, {(INTS,): INT, (FLOATS,): FLOAT}),
+    "contains": (operator.contains, {(map_type, map_type.key_type): BOOL for map_type in MAPS}),
+    "remove": (maps.remove, {(map_type, map_type.key_type): VOID for map_type in MAPS}),
+}
+
+
+def stdlib_functions() -> dict[str, BuiltinFunction]:
+    return {name: BuiltinFunction(handler, name, signatures) for name, (handler, signatures) in STDLIB.items()}
+
+
+def stdlib_return_type(name: str, argument_types: tuple[Type | None, ...]) -> Type | None:
+    return STDLIB[name][1].get(argument_types) if name in STDLIB else None
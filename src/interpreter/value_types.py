@@ -0,0 +1,36 @@
+from src.ast.types import Type, MapType
+from src.interpreter.arrays import IntArray, FloatArray
+from src.interpreter.files import LineStream
+from src.interpreter.maps import MAP_OF
+
+VALUE_TO_TYPE_MAP = {
+    int: Type.IntType,
+    float: Type.FloatType,
+    bool: Type.BoolType,
+    str: Type.StringType,
+    IntArray: Type.IntArrayType,
+    FloatArray: Type.FloatArrayType,
+    LineStream: Type.LineStreamType,
+}
+VALUE_TO_TYPE_MAP.update({map_class: MapType(VALUE_TO_TYPE_MAP[key_type], VALUE_TO_TYPE_MAP[value_type])
+                          for (key_type, value_type), map_class in MAP_OF.items()})
+TYPE_TO_VALUE_MAP = {v: k for k, v in VALUE_TO_TYPE_MAP.items()}
+
+CAST_FUNCTIONS = {
+    (int, Type.IntType): lambda v: v,
+    (int, Type.FloatType): float,
+    (int, Type.BoolType): lambda v: v != 0,
+    (int, Type.StringType): str,
+    (float, Type.IntType): int,
+    (float, Type.FloatType): lambda v: v,
+    (float, Type.BoolType): lambda v: v != 0.0,
+    (float, Type.StringType): str,
+    (bool, Type.IntType): lambda v: 1 if v else 0,
+    (bool, Type.FloatType): lambda v: 1.0 if v else 0.0,
+    (bool, Type.BoolType): lambda v: v,
+    (bool, Type.StringType): lambda v: "true" if v else "false",
+    (str, Type.IntType): int,
+    (str, Type.FloatType): float,
+    (str, Type.BoolType): lambda v: v != '',
+    (str, Type.StringType): lambda v: v,
+}
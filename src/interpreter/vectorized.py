@@ -0,0 +1,184 @@
+import sys
+from itertools import repeat
+from operator import add, sub, mul, truediv, floordiv, mod, eq, ne, lt, le, gt, ge, neg
+from typing import Callable
+
+from src.ast.expressions import *
+from src.ast.position import Position
+from src.ast.quickened import GENERIC_NODES
+from src.errors.interpreter_errors import NotMatchingTypesInBinaryExpression, DivisionByZeroError, \
+    ArrayLengthMismatchError, ValueOverflowError
+from src.interpreter.arrays import TypedArray, IntArray, FloatArray
+from src.interpreter.numeric import StrictNumerics
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+ARITHMETIC_OPERATIONS = {
+    PlusExpression: add,
+    MinusExpression: sub,
+    MultiplyExpression: mul,
+    DivideExpression: truediv,
+    ModuloExpression: mod,
+}
+
+COMPARISON_OPERATIONS = {
+    EqualsExpression: eq,
+    NotEqualsExpression: ne,
+    LessThanExpression: lt,
+    LessThanOrEqualsExpression: le,
+    GreaterThanExpression: gt,
+    GreaterThanOrEqualsExpression: ge,
+}
+
+EXACT_INT_LIMIT = 2 ** 62
+EXACT_SCALE_PRECISION = 22
+SPLITTER = 2.0 ** 27 + 1
+
+
+def is_vector(value) -> bool:
+    return isinstance(value, TypedArray)
+
+
+class Vectorizer:
+    def __init__(self, numerics: StrictNumerics):
+        self.numerics = numerics
+
+    def arithmetic(self, expression: Expression, left, right) -> TypedArray:
+        array_type = self._array_type(expression, left, right)
+        operation = ARITHMETIC_OPERATIONS[GENERIC_NODES.get(type(expression), type(expression))]
+
+        if operation is truediv or operation is mod:
+            self._check_divisor(right, expression.position)
+            if operation is truediv and array_type is IntArray:
+                operation = floordiv
+
+        if numpy is not None and (result := self._numpy_arithmetic(operation, left, right, array_type)) is not None:
+            return result
+
+        length = len(left) if is_vector(left) else len(right)
+        normalize = self.numerics.normalize
+        result = array_type(normalize(operation(x, y), expression.position)
+                            for x, y in zip(_elements(left, length), _elements(right, length)))
+        if array_type is FloatArray and not self.numerics.rounds_results:
+            self._check_overflow(result, expression.position)
+        return result
+
+    def compare(self, expression: RelationalExpression, left, right) -> IntArray:
+        self._array_type(expression, left, right)
+        operation = COMPARISON_OPERATIONS[GENERIC_NODES.get(type(expression), type(expression))]
+        left = self._observe(left, expression.left.position)
+        right = self._observe(right, expression.right.position)
+
+        if numpy is not None:
+            return _from_numpy(operation(_to_numpy(left), _to_numpy(right)), IntArray)
+
+        length = len(left) if is_vector(left) else len(right)
+        return IntArray(map(int, map(operation, _elements(left, length), _elements(right, length))))
+
+    @staticmethod
+    def negate(value: TypedArray) -> TypedArray:
+        if numpy is not None:
+            return _from_numpy(numpy.negative(_to_numpy(value)), type(value))
+        return type(value)(map(neg, value))
+
+    def _numpy_arithmetic(self, operation: Callable, left, right, array_type: type[TypedArray]) -> TypedArray | None:
+        if array_type is IntArray:
+            estimate = operation(_to_numpy(left, float), _to_numpy(right, float))
+            if (numpy.abs(estimate) >= EXACT_INT_LIMIT).any():
+                return None
+            return _from_numpy(operation(_to_numpy(left), _to_numpy(right)), IntArray)
+
+        result = operation(_to_numpy(left), _to_numpy(right))
+        if (numpy.abs(result) >= sys.maxsize).any():
+            return None
+        if self.numerics.rounds_results:
+            result = _round_floats(result, self.numerics.number_precision)
+        return _from_numpy(result, FloatArray)
+
+    def _observe(self, value, position: Position):
+        if self.numerics.rounds_results or not is_vector(value) or value.element_type is not float:
+            return value
+
+        self._check_overflow(value, position)
+        if numpy is not None:
+            return _from_numpy(_round_floats(_to_numpy(value), self.numerics.number_precision), FloatArray)
+        return FloatArray(map(round, value, repeat(self.numerics.number_precision)))
+
+    @staticmethod
+    def _check_overflow(result: FloatArray, position: Position):
+        for value in result:
+            if abs(value) >= sys.maxsize:
+                raise ValueOverflowError(value, position)
+
+    def _check_divisor(self, divisor, position: Position):
+        if is_vector(divisor):
+            if 0 in divisor:
+                raise DivisionByZeroError(position)
+        elif self.numerics.observe(divisor, position) == 0:
+            raise DivisionByZeroError(position)
+
+    @staticmethod
+    def _array_type(expression: Expression, left, right) -> type[TypedArray]:
+        left_type = left.element_type if is_vector(left) else type(left)
+        right_type = right.element_type if is_vector(right) else type(right)
+        if left_type is not right_type:
+            raise NotMatchingTypesInBinaryExpression(type(left), type(right), expression.left.position)
+
+        if is_vector(left) and is_vector(right) and len(left) != len(right):
+            raise ArrayLengthMismatchError(len(left), len(right), expression.position)
+
+        return type(left) if is_vector(left) else type(right)
+
+
+def _elements(value, length: int):
+    return value if is_vector(value) else repeat(value, length)
+
+
+def _to_numpy(value, dtype=None):
+    if not is_vector(value):
+        return value if dtype is None else dtype(value)
+    vector = numpy.frombuffer(value, dtype=value.typecode) if len(value) else numpy.empty(0, value.typecode)
+    return vector if dtype is None else vector.astype(dtype)
+
+
+def _from_numpy(vector, array_type: type[TypedArray]) -> TypedArray:
+    result = array_type()
+    result.frombytes(vector.astype(result.typecode, copy=False).tobytes())
+    return result
+
+
+# numpy.round misrounds values close to a tie after scaling, so the exact error
+# of the scaled product decides the direction, matching round(value, precision).
+def _round_floats(vector, precision: int):
+    if precision > EXACT_SCALE_PRECISION:
+        return numpy.array([round(value, precision) for value in vector.tolist()])
+
+    scale = 10.0 ** precision
+    scaled = vector * scale
+    error = _product_error(vector, scale, scaled)
+    lower = numpy.floor(scaled)
+    fraction = scaled - lower
+    half = lower * 0.5
+    odd = half != numpy.floor(half)
+    up = ((fraction > 0.5) | ((fraction == 0.5) & ((error > 0) | ((error == 0) & odd)))
+          | ((fraction == 0) & (error == 0.5) & odd))
+    down = (fraction == 0) & (error == -0.5) & odd
+    result = numpy.copysign((lower + up - down) / scale, vector)
+
+    unchanged = numpy.spacing(numpy.abs(vector)) > 1.0 / scale
+    result[unchanged] = vector[unchanged]
+    return result
+
+
+def _product_error(vector, factor: float, product):
+    vector_high = SPLITTER * vector
+    vector_high = vector_high - (vector_high - vector)
+    vector_low = vector - vector_high
+    factor_high = SPLITTER * factor
+    factor_high = factor_high - (factor_high - factor)
+    factor_low = factor - factor_high
+    return ((vector_high * factor_high - product) + vector_high * factor_low + vector_low * factor_high
+            + vector_low * factor_low)
@@ -22,13 +22,19 @@ class TokenType(Enum):
     CATCH_KEYWORD = auto()
     TRY_KEYWORD = auto()
     THROW_KEYWORD = auto()
+    MAP_KEYWORD = auto()
+    FOR_KEYWORD = auto()
+    IN_KEYWORD = auto()
 
     LEFT_ROUND_BRACKET = auto()
     RIGHT_ROUND_BRACKET = auto()
     LEFT_CURLY_BRACKET = auto()
     RIGHT_CURLY_BRACKET = auto()
+    LEFT_SQUARE_BRACKET = auto()
+    RIGHT_SQUARE_BRACKET = auto()
 
     DOT = auto()
+    RANGE = auto()
     COMMA = auto()
     COLON = auto()
     SEMICOLON = auto()
@@ -81,6 +87,9 @@ class Symbols:
         "throw": TokenType.THROW_KEYWORD,
         "try": TokenType.TRY_KEYWORD,
         "catch": TokenType.CATCH_KEYWORD,
+        "map": TokenType.MAP_KEYWORD,
+        "for": TokenType.FOR_KEYWORD,
+        "in": TokenType.IN_KEYWORD,
         "or": TokenType.OR_OPERATOR,
         "and": TokenType.AND_OPERATOR,
         "not": TokenType.NEGATION_OPERATOR,
@@ -93,6 +102,8 @@ class Symbols:
         ")": TokenType.RIGHT_ROUND_BRACKET,
         "{": TokenType.LEFT_CURLY_BRACKET,
         "}": TokenType.RIGHT_CURLY_BRACKET,
+        "[": TokenType.LEFT_SQUARE_BRACKET,
+        "]": TokenType.RIGHT_SQUARE_BRACKET,
         ".": TokenType.DOT,
         ",": TokenType.COMMA,
         ":": TokenType.COLON,
@@ -114,6 +125,7 @@ class Symbols:
         ">=": TokenType.GREATER_THAN_OR_EQUAL_OPERATOR,
         "==": TokenType.EQUAL_OPERATOR,
         "!=": TokenType.NOT_EQUAL_OPERATOR,
+        "..": TokenType.RANGE,
     }
 
     boolean_literals = {
@@ -0,0 +1,130 @@
+from src.ast.core_structures import Program, Function
+from src.ast.expressions import *
+from src.ast.quickened import ResolvedCastedExpression
+from src.ast.statemens import *
+from src.interpreter.arrays import IntArray, FloatArray
+from src.interpreter.maps import TypedMap
+from src.interpreter.stdlib import stdlib_return_type
+from src.interpreter.value_types import VALUE_TO_TYPE_MAP, TYPE_TO_VALUE_MAP, CAST_FUNCTIONS
+from src.optimizer.walker import child_nodes
+
+LITERAL_TYPES = {
+    IntLiteral: int,
+    FloatLiteral: float,
+    BoolLiteral: bool,
+    StringLiteral: str,
+}
+
+ARRAY_TYPES = {IntArray, FloatArray}
+
+
+def resolve_casts(program: Program) -> int:
+    resolved = 0
+    for function in program.functions.values():
+        inference = TypeInference(program, infer_variable_types(program, function))
+        resolved += _resolve_node(function.statement_block, inference)
+
+    for exception in program.exceptions.values():
+        inference = TypeInference(program, {param.name: TYPE_TO_VALUE_MAP[param.type]
+                                            for param in exception.parameters})
+        for attribute in exception.attributes:
+            resolved += _resolve_node(attribute.expression, inference)
+
+    return resolved
+
+
+def _resolve_node(node, inference: 'TypeInference') -> int:
+    resolved = 0
+    pending = [node]
+    while pending:
+        node = pending.pop()
+        if type(node) is CastedExpression and (
+                source_type := inference.infer(node.expression)) is not None and (
+                operation := CAST_FUNCTIONS.get((source_type, node.to_type))) is not None:
+            node.guard = source_type
+            node.operation = operation
+            node.__class__ = ResolvedCastedExpression
+            resolved += 1
+        pending.extend(child_nodes(node))
+    return resolved
+
+
+def infer_variable_types(program: Program, function: Function) -> dict[str, type]:
+    assignments = {}
+    loop_variables = set()
+    pending = [function.statement_block]
+    while pending:
+        node = pending.pop()
+        if isinstance(node, AssignmentStatement):
+            assignments.setdefault(node.name, []).append(node.expression)
+        elif isinstance(node, ForRangeStatement):
+            assignments.setdefault(node.variable, []).append(node.start)
+        elif isinstance(node, ForStatement):
+            loop_variables.add(node.variable)
+        pending.extend(child_nodes(node))
+
+    for name in loop_variables | {param.name for param in function.parameters}:
+        assignments.pop(name, None)
+
+    candidates = {}
+    inference = TypeInference(program, {})
+    for name, expressions in assignments.items():
+        known_types = {inference.infer(expression) for expression in expressions} - {None}
+        if len(known_types) == 1:
+            candidates[name] = known_types.pop()
+
+    changed = True
+    while changed:
+        changed = False
+        inference = TypeInference(program, candidates)
+        for name in list(candidates):
+            if any(inference.infer(expression) is not candidates[name] for expression in assignments[name]):
+                del candidates[name]
+                changed = True
+
+    return candidates
+
+
+class TypeInference:
+    def __init__(self, program: Program, variable_types: dict[str, type]):
+        self.program = program
+        self.variable_types = variable_types
+
+    def infer(self, expression: Expression) -> type | None:
+        match expression:
+            case IntLiteral() | FloatLiteral() | BoolLiteral() | StringLiteral():
+                return LITERAL_TYPES[type(expression)]
+            case Variable(name=name):
+                return self.variable_types.get(name)
+            case CastedExpression(to_type=to_type):
+                return TYPE_TO_VALUE_MAP.get(to_type)
+            case OrExpression() | AndExpression() | NegatedExpression():
+                return bool
+            case RelationalExpression():
+                operand_types = {self.infer(expression.left), self.infer(expression.right)}
+                if operand_types & ARRAY_TYPES:
+                    return IntArray
+                return bool if None not in operand_types else None
+            case AdditiveExpression() | MultiplicativeExpression():
+                left_type = self.infer(expression.left)
+                return left_type if left_type is not None and left_type is self.infer(expression.right) else None
+            case UnaryMinusExpression():
+                operand_type = self.infer(expression.expression)
+                return operand_type if operand_type in (int, float) or operand_type in ARRAY_TYPES else None
+            case InvariantExpression():
+                return self.infer(expression.expression)
+            case IndexExpression():
+                collection_type = self.infer(expression.array)
+                if collection_type is not None and issubclass(collection_type, TypedMap):
+                    return collection_type.value_type
+                return getattr(collection_type, "element_type", None)
+            case MapLiteral(map_type=map_type):
+                return TYPE_TO_VALUE_MAP[map_type]
+            case InlinedCall(return_type=return_type):
+                return TYPE_TO_VALUE_MAP.get(return_type)
+            case FunctionCall(name=name) if (function := self.program.functions.get(name)) is not None:
+                return TYPE_TO_VALUE_MAP.get(function.return_type)
+            case FunctionCall(name=name, arguments=arguments):
+                argument_types = tuple(VALUE_TO_TYPE_MAP.get(self.infer(argument)) for argument in arguments)
+                return TYPE_TO_VALUE_MAP.get(stdlib_return_type(name, argument_types))
+        return None
@@ -0,0 +1,34 @@
+from typing import Iterable
+
+from src.ast.core_structures import Program
+from src.ast.statemens import *
+from src.optimizer.walker import child_nodes
+
+BASE_EXCEPTION = "BasicException"
+
+
+def build_catch_tables(program: Program, exception_names: Iterable[str], parents: dict[str, str] = None):
+    lineages = {name: exception_lineage(name, parents or {}) for name in {*exception_names, BASE_EXCEPTION}}
+    pending = [function.statement_block for function in program.functions.values()]
+    while pending:
+        node = pending.pop()
+        if isinstance(node, TryCatchStatement):
+            node.catch_table = _catch_table(node.catch_statements, lineages)
+        pending.extend(child_nodes(node))
+
+
+def exception_lineage(name: str, parents: dict[str, str]) -> tuple[str, ...]:
+    lineage = [name]
+    while name != BASE_EXCEPTION:
+        name = parents.get(name, BASE_EXCEPTION)
+        lineage.append(name)
+    return tuple(lineage)
+
+
+def _catch_table(catch_statements: list[CatchStatement],
+                 lineages: dict[str, tuple[str, ...]]) -> dict[str, CatchStatement]:
+    catch_table = {}
+    for name, lineage in lineages.items():
+        if (catch := next((catch for catch in catch_statements if catch.exception in lineage), None)) is not None:
+            catch_table[name] = catch
+    return catch_table
@@ -0,0 +1,174 @@
+from collections import Counter
+
+from src.ast.core_structures import Program, Function
+from src.ast.expressions import *
+from src.ast.statemens import *
+from src.ast.types import Type
+from src.errors.interpreter_errors import InterpreterError
+from src.interpreter.executor import ProgramExecutor
+from src.interpreter.stdlib import stdlib_functions, stdlib_return_type
+
+LITERALS = (IntLiteral, FloatLiteral, BoolLiteral, StringLiteral)
+LITERAL_TYPES = {IntLiteral: Type.IntType, FloatLiteral: Type.FloatType,
+                 BoolLiteral: Type.BoolType, StringLiteral: Type.StringType}
+
+
+def fold_constants(program: Program, number_precision: int = 15, numeric_mode: str = "strict"):
+    folder = ConstantFolder(number_precision, numeric_mode)
+    for name in program.functions:
+        folder.evaluator.functions.pop(name, None)
+    for function in program.functions.values():
+        folder.fold_function(function)
+    for exception in program.exceptions.values():
+        for attribute in exception.attributes:
+            attribute.expression = folder.fold_expression(attribute.expression, {})
+
+
+def to_literal(value, position: Position) -> Expression:
+    match value:
+        case bool():
+            return BoolLiteral(position, "true" if value else "false")
+        case int():
+            return IntLiteral(position, value)
+        case float():
+            return FloatLiteral(position, value)
+        case str():
+            return StringLiteral(position, value)
+
+
+class ConstantFolder:
+    def __init__(self, number_precision: int = 15, numeric_mode: str = "strict"):
+        self.evaluator = ProgramExecutor(number_precision=number_precision, quicken=False, numeric_mode=numeric_mode)
+        self.evaluator.functions.update(stdlib_functions())
+
+    def fold_function(self, function: Function):
+        assignments = Counter()
+        _count_assignments(function.statement_block, assignments)
+        single_assigned = {name for name, count in assignments.items() if count == 1}
+        single_assigned -= {param.name for param in function.parameters}
+
+        constants = {}
+        for statement in function.statement_block.statements:
+            self.fold_statement(statement, constants)
+
+            match statement:
+                case AssignmentStatement(name=name, expression=expression) if (
+                        name in single_assigned and isinstance(expression, LITERALS)):
+                    constants[name] = expression
+
+    def fold_block(self, statement_block: StatementBlock, constants: dict):
+        for statement in statement_block.statements:
+            self.fold_statement(statement, constants)
+
+    def fold_statement(self, statement: Statement, constants: dict):
+        match statement:
+            case AssignmentStatement():
+                statement.expression = self.fold_expression(statement.expression, constants)
+            case IndexAssignmentStatement():
+                statement.index = self.fold_expression(statement.index, constants)
+                statement.expression = self.fold_expression(statement.expression, constants)
+            case ReturnStatement(expression=expression) if expression is not None:
+                statement.expression = self.fold_expression(expression, constants)
+            case FunctionCall():
+                self.fold_expression(statement, constants)
+            case IfStatement():
+                statement.condition = self.fold_expression(statement.condition, constants)
+                self.fold_block(statement.if_block, constants)
+                statement.elif_statement = [(self.fold_expression(condition, constants), block)
+                                            for condition, block in statement.elif_statement]
+                for _, elif_block in statement.elif_statement:
+                    self.fold_block(elif_block, constants)
+                if statement.else_block is not None:
+                    self.fold_block(statement.else_block, constants)
+            case WhileStatement():
+                statement.condition = self.fold_expression(statement.condition, constants)
+                self.fold_block(statement.block, constants)
+            case ForStatement():
+                statement.iterable = self.fold_expression(statement.iterable, constants)
+                self.fold_block(statement.block, constants)
+            case ForRangeStatement():
+                statement.start = self.fold_expression(statement.start, constants)
+                statement.end = self.fold_expression(statement.end, constants)
+                self.fold_block(statement.block, constants)
+            case TryCatchStatement():
+                self.fold_block(statement.try_block, constants)
+                for catch in statement.catch_statements:
+                    self.fold_block(catch.block, constants)
+            case ThrowStatement():
+                statement.args = [self.fold_expression(arg, constants) for arg in statement.args]
+            case StatementBlock():
+                self.fold_block(statement, constants)
+
+    def fold_expression(self, expression: Expression, constants: dict) -> Expression:
+        match expression:
+            case Variable(name=name) if name in constants:
+                constant = constants[name]
+                return type(constant)(expression.position, constant.value)
+            case IndexExpression():
+                expression.array = self.fold_expression(expression.array, constants)
+                expression.index = self.fold_expression(expression.index, constants)
+            case MapLiteral():
+                expression.entries = [(self.fold_expression(key, constants), self.fold_expression(value, constants))
+                                      for key, value in expression.entries]
+            case FunctionCall():
+                expression.arguments = [self.fold_expression(arg, constants) for arg in expression.arguments]
+                if self._returns_literal(expression):
+                    return self._evaluate(expression, *expression.arguments)
+                return expression
+            case OrExpression() | AndExpression():
+                expression.left = self.fold_expression(expression.left, constants)
+                expression.right = self.fold_expression(expression.right, constants)
+                if isinstance(expression.left, BoolLiteral):
+                    short_circuit = "true" if isinstance(expression, OrExpression) else "false"
+                    if expression.left.value == short_circuit:
+                        return to_literal(short_circuit == "true", expression.position)
+                return self._evaluate(expression, expression.left, expression.right)
+            case (RelationalExpression() | AdditiveExpression() | MultiplicativeExpression()):
+                expression.left = self.fold_expression(expression.left, constants)
+                expression.right = self.fold_expression(expression.right, constants)
+                return self._evaluate(expression, expression.left, expression.right)
+            case CastedExpression() | NegatedExpression() | UnaryMinusExpression():
+                expression.expression = self.fold_expression(expression.expression, constants)
+                return self._evaluate(expression, expression.expression)
+        return expression
+
+    def _returns_literal(self, function_call: FunctionCall) -> bool:
+        if function_call.name not in self.evaluator.functions:
+            return False
+        argument_types = tuple(LITERAL_TYPES.get(type(argument)) for argument in function_call.arguments)
+        return stdlib_return_type(function_call.name, argument_types) in LITERAL_TYPES.values()
+
+    def _evaluate(self, expression: Expression, *operands: Expression) -> Expression:
+        if not all(isinstance(operand, LITERALS) for operand in operands):
+            return expression
+
+        try:
+            value = expression.accept(self.evaluator)
+        except (InterpreterError, ValueError):
+            return expression
+
+        return to_literal(value, expression.position) or expression
+
+
+def _count_assignments(statement_block: StatementBlock, assignments: Counter):
+    for statement in statement_block.statements:
+        match statement:
+            case AssignmentStatement(name=name):
+                assignments[name] += 1
+            case IfStatement():
+                _count_assignments(statement.if_block, assignments)
+                for _, elif_block in statement.elif_statement:
+                    _count_assignments(elif_block, assignments)
+                if statement.else_block is not None:
+                    _count_assignments(statement.else_block, assignments)
+            case WhileStatement():
+                _count_assignments(statement.block, assignments)
+            case ForStatement() | ForRangeStatement():
+                assignments[statement.variable] += 1
+                _count_assignments(statement.block, assignments)
+            case TryCatchStatement():
+                _count_assignments(statement.try_block, assignments)
+                for catch in statement.catch_statements:
+                    _count_assignments(catch.block, assignments)
+            case StatementBlock():
+                _count_assignments(statement, assignments)
@@ -0,0 +1,117 @@
+from collections import Counter
+
+from src.ast.core_structures import Program
+from src.ast.expressions import *
+from src.ast.statemens import *
+from src.optimizer.cast_resolution import infer_variable_types
+from src.optimizer.walker import child_nodes
+
+LOOPS = (WhileStatement, ForStatement, ForRangeStatement)
+
+
+def rewrite_counted_loops(program: Program) -> int:
+    rewritten = 0
+    for function in program.functions.values():
+        rewriter = CountedLoopRewriter(infer_variable_types(program, function))
+        rewriter.rewrite_block(function.statement_block)
+        rewritten += rewriter.rewritten
+    return rewritten
+
+
+class CountedLoopRewriter:
+    def __init__(self, variable_types: dict[str, type]):
+        self.variable_types = variable_types
+        self.rewritten = 0
+
+    def rewrite_block(self, statement_block: StatementBlock):
+        statement_block.statements = [self.rewrite_statement(statement) for statement in statement_block.statements]
+
+    def rewrite_statement(self, statement: Statement) -> Statement:
+        match statement:
+            case WhileStatement():
+                self.rewrite_block(statement.block)
+                if (counted_loop := self._counted_loop(statement)) is not None:
+                    self.rewritten += 1
+                    return counted_loop
+            case ForStatement() | ForRangeStatement():
+                self.rewrite_block(statement.block)
+            case IfStatement():
+                self.rewrite_block(statement.if_block)
+                for _, elif_block in statement.elif_statement:
+                    self.rewrite_block(elif_block)
+                if statement.else_block is not None:
+                    self.rewrite_block(statement.else_block)
+            case TryCatchStatement():
+                self.rewrite_block(statement.try_block)
+                for catch in statement.catch_statements:
+                    self.rewrite_block(catch.block)
+            case StatementBlock():
+                self.rewrite_block(statement)
+        return statement
+
+    def _counted_loop(self, while_statement: WhileStatement) -> ForRangeStatement | None:
+        match while_statement.condition:
+            case LessThanExpression(left=Variable(name=name) as variable, right=end):
+                inclusive = False
+            case LessThanOrEqualsExpression(left=Variable(name=name) as variable, right=end):
+                inclusive = True
+            case _:
+                return None
+
+        statements = while_statement.block.statements
+        if not statements or not _is_increment(statements[-1], name):
+            return None
+
+        assignments = _count_assignments(while_statement.block)
+        if (self.variable_types.get(name) is not int or assignments[name] != 1 or
+                not self._is_bound(end, assignments) or _continues(while_statement.block)):
+            return None
+
+        if inclusive:
+            end = PlusExpression(end.position, end, IntLiteral(end.position, 1))
+
+        while_statement.block.statements = statements[:-1]
+        return ForRangeStatement(while_statement.position, name, Variable(variable.position, name), end,
+                                 while_statement.block)
+
+    def _is_bound(self, expression: Expression, assignments: Counter) -> bool:
+        match expression:
+            case IntLiteral():
+                return True
+            case Variable(name=name):
+                return assignments[name] == 0 and self.variable_types.get(name) is int
+            case PlusExpression() | MinusExpression() | MultiplyExpression():
+                return self._is_bound(expression.left, assignments) and self._is_bound(expression.right, assignments)
+        return False
+
+
+def _is_increment(statement: Statement, name: str) -> bool:
+    match statement:
+        case (AssignmentStatement(expression=PlusExpression(left=Variable(name=variable), right=IntLiteral(value=1))) |
+              AssignmentStatement(expression=PlusExpression(left=IntLiteral(value=1), right=Variable(name=variable)))):
+            return statement.name == name and variable == name
+    return False
+
+
+def _count_assignments(node) -> Counter:
+    assignments = Counter()
+    pending = [node]
+    while pending:
+        node = pending.pop()
+        if isinstance(node, AssignmentStatement):
+            assignments[node.name] += 1
+        elif isinstance(node, ForStatement | ForRangeStatement):
+            assignments[node.variable] += 1
+        pending.extend(child_nodes(node))
+    return assignments
+
+
+def _continues(statement_block: StatementBlock) -> bool:
+    pending = [statement_block]
+    while pending:
+        node = pending.pop()
+        if isinstance(node, ContinueStatement):
+            return True
+        if not isinstance(node, LOOPS):
+            pending.extend(child_nodes(node))
+    return False
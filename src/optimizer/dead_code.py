@@ -0,0 +1,110 @@
+from src.ast.core_structures import Program
+from src.ast.expressions import BoolLiteral
+from src.ast.statemens import *
+from src.optimizer.walker import child_nodes
+
+TERMINATORS = (ReturnStatement, BreakStatement, ContinueStatement, ThrowStatement)
+
+
+def eliminate_dead_code(program: Program):
+    for function in program.functions.values():
+        _prune_block(function.statement_block)
+
+    reachable = reachable_functions(program)
+    program.functions = {name: function for name, function in program.functions.items() if name in reachable}
+
+
+def reachable_functions(program: Program) -> set[str]:
+    pending = ["main"]
+    for exception in program.exceptions.values():
+        for attribute in exception.attributes:
+            pending.extend(_called_functions(attribute.expression))
+
+    reachable = set()
+    while pending:
+        name = pending.pop()
+        if name in reachable or (function := program.functions.get(name)) is None:
+            continue
+        reachable.add(name)
+        pending.extend(_called_functions(function.statement_block))
+
+    return reachable
+
+
+def _called_functions(node) -> list[str]:
+    called = []
+    pending = [node]
+    while pending:
+        node = pending.pop()
+        if isinstance(node, FunctionCall):
+            called.append(node.name)
+        pending.extend(child_nodes(node))
+    return called
+
+
+def _prune_block(statement_block: StatementBlock):
+    statements = []
+    for statement in statement_block.statements:
+        if (statement := _prune_statement(statement)) is None:
+            continue
+
+        statements.append(statement)
+        if _terminates(statement):
+            break
+
+    statement_block.statements = statements
+
+
+def _prune_statement(statement: Statement) -> Statement | None:
+    match statement:
+        case IfStatement():
+            return _prune_if_statement(statement)
+        case WhileStatement(condition=BoolLiteral(value="false")):
+            return None
+        case WhileStatement() | ForStatement() | ForRangeStatement():
+            _prune_block(statement.block)
+        case TryCatchStatement():
+            _prune_block(statement.try_block)
+            for catch in statement.catch_statements:
+                _prune_block(catch.block)
+        case StatementBlock():
+            _prune_block(statement)
+    return statement
+
+
+def _prune_if_statement(if_statement: IfStatement) -> Statement | None:
+    branches = [(if_statement.condition, if_statement.if_block), *if_statement.elif_statement]
+
+    live_branches = []
+    else_block = if_statement.else_block
+    for condition, block in branches:
+        match condition:
+            case BoolLiteral(value="false"):
+                continue
+            case BoolLiteral(value="true"):
+                else_block = block
+                break
+        live_branches.append((condition, block))
+
+    if else_block is not None:
+        _prune_block(else_block)
+
+    if not live_branches:
+        return else_block
+
+    for _, block in live_branches:
+        _prune_block(block)
+
+    (if_statement.condition, if_statement.if_block), *if_statement.elif_statement = live_branches
+    if_statement.else_block = else_block
+    return if_statement
+
+
+def _terminates(statement: Statement) -> bool:
+    match statement:
+        case StatementBlock(statements=[*_, last]):
+            return _terminates(last)
+        case IfStatement(else_block=StatementBlock() as else_block):
+            blocks = [statement.if_block, *(block for _, block in statement.elif_statement), else_block]
+            return all(_terminates(block) for block in blocks)
+    return isinstance(statement, TERMINATORS)
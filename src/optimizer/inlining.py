@@ -0,0 +1,161 @@
+from collections import Counter
+from copy import deepcopy
+
+from src.ast.core_structures import Program, Function
+from src.ast.expressions import *
+from src.ast.statemens import *
+from src.optimizer.purity import find_pure_functions
+from src.optimizer.walker import child_nodes
+
+INLINE_THRESHOLD = 16
+
+
+def inline_functions(program: Program, threshold: int = INLINE_THRESHOLD) -> Counter:
+    inliner = Inliner(_inline_candidates(program, threshold))
+    for function in program.functions.values():
+        inliner.inline_block(function.statement_block)
+    return inliner.inlined
+
+
+def _inline_candidates(program: Program, threshold: int) -> dict[str, Function]:
+    candidates = {}
+    for name in find_pure_functions(program):
+        function = program.functions[name]
+        match function.statement_block.statements:
+            case [ReturnStatement(expression=Expression() as body)] if (
+                    _size(body) <= threshold and
+                    _reads_only_parameters(body, function) and
+                    not _is_recursive(program, function)):
+                candidates[name] = function
+    return candidates
+
+
+def _size(node) -> int:
+    return 1 + sum(_size(child) for child in child_nodes(node))
+
+
+def _reads_only_parameters(node, function: Function) -> bool:
+    parameters = {param.name for param in function.parameters}
+    pending = [node]
+    while pending:
+        node = pending.pop()
+        match node:
+            case Variable(name=name) if name not in parameters:
+                return False
+            case AttributeCall():
+                return False
+        pending.extend(child_nodes(node))
+    return True
+
+
+def _is_recursive(program: Program, function: Function) -> bool:
+    visited = set()
+    pending = [function.statement_block]
+    while pending:
+        node = pending.pop()
+        if isinstance(node, FunctionCall):
+            if node.name == function.name:
+                return True
+            if node.name not in visited and (callee := program.functions.get(node.name)) is not None:
+                visited.add(node.name)
+                pending.append(callee.statement_block)
+        pending.extend(child_nodes(node))
+    return False
+
+
+class Inliner:
+    def __init__(self, candidates: dict[str, Function]):
+        self.candidates = candidates
+        self.inlined = Counter()
+
+    def inline_block(self, statement_block: StatementBlock):
+        for statement in statement_block.statements:
+            self.inline_statement(statement)
+
+    def inline_statement(self, statement: Statement):
+        match statement:
+            case AssignmentStatement():
+                statement.expression = self.inline_expression(statement.expression)
+            case IndexAssignmentStatement():
+                statement.index = self.inline_expression(statement.index)
+                statement.expression = self.inline_expression(statement.expression)
+            case ReturnStatement(expression=expression) if expression is not None:
+                statement.expression = self.inline_expression(expression)
+            case FunctionCall():
+                statement.arguments = [self.inline_expression(arg) for arg in statement.arguments]
+            case ThrowStatement():
+                statement.args = [self.inline_expression(arg) for arg in statement.args]
+            case IfStatement():
+                statement.condition = self.inline_expression(statement.condition)
+                self.inline_block(statement.if_block)
+                statement.elif_statement = [(self.inline_expression(condition), block)
+                                            for condition, block in statement.elif_statement]
+                for _, elif_block in statement.elif_statement:
+                    self.inline_block(elif_block)
+                if statement.else_block is not None:
+                    self.inline_block(statement.else_block)
+            case WhileStatement():
+                statement.condition = self.inline_expression(statement.condition)
+                self.inline_block(statement.block)
+            case ForStatement():
+                statement.iterable = self.inline_expression(statement.iterable)
+                self.inline_block(statement.block)
+            case ForRangeStatement():
+                statement.start = self.inline_expression(statement.start)
+                statement.end = self.inline_expression(statement.end)
+                self.inline_block(statement.block)
+            case TryCatchStatement():
+                self.inline_block(statement.try_block)
+                for catch in statement.catch_statements:
+                    self.inline_block(catch.block)
+            case StatementBlock():
+                self.inline_block(statement)
+
+    def inline_expression(self, expression: Expression) -> Expression:
+        match expression:
+            case FunctionCall():
+                expression.arguments = [self.inline_expression(arg) for arg in expression.arguments]
+                if (function := self.candidates.get(expression.name)) is not None and (
+                        len(expression.arguments) == len(function.parameters)):
+                    return self._inline_call(expression, function)
+            case (OrExpression() | AndExpression() | RelationalExpression() |
+                  AdditiveExpression() | MultiplicativeExpression()):
+                expression.left = self.inline_expression(expression.left)
+                expression.right = self.inline_expression(expression.right)
+            case CastedExpression() | NegatedExpression() | UnaryMinusExpression():
+                expression.expression = self.inline_expression(expression.expression)
+            case IndexExpression():
+                expression.array = self.inline_expression(expression.array)
+                expression.index = self.inline_expression(expression.index)
+            case MapLiteral():
+                expression.entries = [(self.inline_expression(key), self.inline_expression(value))
+                                      for key, value in expression.entries]
+        return expression
+
+    def _inline_call(self, function_call: FunctionCall, function: Function) -> InlinedCall:
+        self.inlined[function.name] += 1
+        body = deepcopy(function.statement_block.statements[0].expression)
+        body = self.inline_expression(_bind_parameters(body, function))
+        return InlinedCall(function_call.position, function.name, function_call.arguments, body, function.return_type)
+
+
+def _bind_parameters(expression: Expression, function: Function) -> Expression:
+    indexes = {param.name: index for index, param in enumerate(function.parameters)}
+    match expression:
+        case Variable(name=name):
+            return InlinedParameter(expression.position, name, indexes[name])
+        case FunctionCall() | InlinedCall():
+            expression.arguments = [_bind_parameters(arg, function) for arg in expression.arguments]
+        case (OrExpression() | AndExpression() | RelationalExpression() |
+              AdditiveExpression() | MultiplicativeExpression()):
+            expression.left = _bind_parameters(expression.left, function)
+            expression.right = _bind_parameters(expression.right, function)
+        case CastedExpression() | NegatedExpression() | UnaryMinusExpression():
+            expression.expression = _bind_parameters(expression.expression, function)
+        case IndexExpression():
+            expression.array = _bind_parameters(expression.array, function)
+            expression.index = _bind_parameters(expression.index, function)
+        case MapLiteral():
+            expression.entries = [(_bind_parameters(key, function), _bind_parameters(value, function))
+                                  for key, value in expression.entries]
+    return expression
@@ -0,0 +1,174 @@
+from itertools import count
+
+from src.ast.core_structures import Program
+from src.ast.expressions import *
+from src.ast.statemens import *
+from src.interpreter.value_types import TYPE_TO_VALUE_MAP
+from src.optimizer.cast_resolution import infer_variable_types
+from src.optimizer.walker import child_nodes
+
+ATOMS = (IntLiteral, FloatLiteral, BoolLiteral, StringLiteral, Variable)
+SCALAR_TYPES = (int, float, bool, str)
+
+
+def hoist_loop_invariants(program: Program):
+    slots = count()
+    for function in program.functions.values():
+        scalars = {name for name, value_type in infer_variable_types(program, function).items()
+                   if value_type in SCALAR_TYPES}
+        scalars.update(param.name for param in function.parameters
+                       if TYPE_TO_VALUE_MAP.get(param.type) in SCALAR_TYPES)
+        _hoist_block(function.statement_block, slots, scalars)
+
+
+def _hoist_block(statement_block: StatementBlock, slots: count, scalars: set[str]):
+    for statement in statement_block.statements:
+        match statement:
+            case WhileStatement() | ForRangeStatement():
+                _hoist_loop(statement, slots, scalars)
+            case ForStatement():
+                _hoist_block(statement.block, slots, scalars)
+            case IfStatement():
+                _hoist_block(statement.if_block, slots, scalars)
+                for _, elif_block in statement.elif_statement:
+                    _hoist_block(elif_block, slots, scalars)
+                if statement.else_block is not None:
+                    _hoist_block(statement.else_block, slots, scalars)
+            case TryCatchStatement():
+                _hoist_block(statement.try_block, slots, scalars)
+                for catch in statement.catch_statements:
+                    _hoist_block(catch.block, slots, scalars)
+            case StatementBlock():
+                _hoist_block(statement, slots, scalars)
+
+
+def _hoist_loop(loop_statement: WhileStatement | ForRangeStatement, slots: count, scalars: set[str]):
+    assigned_names, mutates = _assigned_names(loop_statement.block, scalars)
+    if mutates:
+        assigned_names |= _read_names(loop_statement) - scalars
+
+    if isinstance(loop_statement, WhileStatement):
+        hoister = LoopHoister(assigned_names, slots)
+        loop_statement.condition = hoister.hoist_expression(loop_statement.condition)
+    else:
+        hoister = LoopHoister(assigned_names | {loop_statement.variable}, slots)
+    hoister.hoist_block(loop_statement.block)
+    loop_statement.invariant_slots = hoister.hoisted
+
+    _hoist_block(loop_statement.block, slots, scalars)
+
+
+def _assigned_names(node, scalars: set[str]) -> tuple[set[str], bool]:
+    names = set()
+    mutates = False
+    pending = [node]
+    while pending:
+        node = pending.pop()
+        match node:
+            case AssignmentStatement(name=name):
+                names.add(name)
+            case IndexAssignmentStatement(name=name):
+                names.add(name)
+                mutates = True
+            case ForStatement(variable=variable) | ForRangeStatement(variable=variable):
+                names.add(variable)
+            case FunctionCall(arguments=arguments) | InlinedCall(arguments=arguments):
+                shared = {argument.name for argument in arguments if isinstance(argument, Variable)} - scalars
+                names |= shared
+                mutates = mutates or bool(shared)
+        pending.extend(child_nodes(node))
+    return names, mutates
+
+
+def _read_names(node) -> set[str]:
+    names = set()
+    pending = [node]
+    while pending:
+        node = pending.pop()
+        if isinstance(node, Variable):
+            names.add(node.name)
+        pending.extend(child_nodes(node))
+    return names
+
+
+class LoopHoister:
+    def __init__(self, assigned_names: set[str], slots: count):
+        self.assigned_names = assigned_names
+        self.slots = slots
+        self.hoisted = []
+
+    def hoist_block(self, statement_block: StatementBlock):
+        for statement in statement_block.statements:
+            self.hoist_statement(statement)
+
+    def hoist_statement(self, statement: Statement):
+        match statement:
+            case AssignmentStatement():
+                statement.expression = self.hoist_expression(statement.expression)
+            case IndexAssignmentStatement():
+                statement.index = self.hoist_expression(statement.index)
+                statement.expression = self.hoist_expression(statement.expression)
+            case ReturnStatement(expression=expression) if expression is not None:
+                statement.expression = self.hoist_expression(expression)
+            case FunctionCall():
+                statement.arguments = [self.hoist_expression(arg) for arg in statement.arguments]
+            case ThrowStatement():
+                statement.args = [self.hoist_expression(arg) for arg in statement.args]
+            case IfStatement():
+                statement.condition = self.hoist_expression(statement.condition)
+                self.hoist_block(statement.if_block)
+                statement.elif_statement = [(self.hoist_expression(condition), block)
+                                            for condition, block in statement.elif_statement]
+                for _, elif_block in statement.elif_statement:
+                    self.hoist_block(elif_block)
+                if statement.else_block is not None:
+                    self.hoist_block(statement.else_block)
+            case WhileStatement():
+                statement.condition = self.hoist_expression(statement.condition)
+                self.hoist_block(statement.block)
+            case ForStatement():
+                statement.iterable = self.hoist_expression(statement.iterable)
+                self.hoist_block(statement.block)
+            case ForRangeStatement():
+                statement.start = self.hoist_expression(statement.start)
+                statement.end = self.hoist_expression(statement.end)
+                self.hoist_block(statement.block)
+            case TryCatchStatement():
+                self.hoist_block(statement.try_block)
+                for catch in statement.catch_statements:
+                    self.hoist_block(catch.block)
+            case StatementBlock():
+                self.hoist_block(statement)
+
+    def hoist_expression(self, expression: Expression) -> Expression:
+        if isinstance(expression, ATOMS):
+            return expression
+
+        if self._is_invariant(expression):
+            slot = next(self.slots)
+            self.hoisted.append(slot)
+            return InvariantExpression(expression.position, expression, slot)
+
+        match expression:
+            case FunctionCall() | InlinedCall():
+                expression.arguments = [self.hoist_expression(arg) for arg in expression.arguments]
+            case (OrExpression() | AndExpression() | RelationalExpression() |
+                  AdditiveExpression() | MultiplicativeExpression()):
+                expression.left = self.hoist_expression(expression.left)
+                expression.right = self.hoist_expression(expression.right)
+            case CastedExpression() | NegatedExpression() | UnaryMinusExpression():
+                expression.expression = self.hoist_expression(expression.expression)
+            case IndexExpression():
+                expression.index = self.hoist_expression(expression.index)
+            case MapLiteral():
+                expression.entries = [(self.hoist_expression(key), self.hoist_expression(value))
+                                      for key, value in expression.entries]
+        return expression
+
+    def _is_invariant(self, expression: Expression) -> bool:
+        match expression:
+            case Variable(name=name):
+                return name not in self.assigned_names
+            case FunctionCall() | AttributeCall() | InvariantExpression() | IndexExpression() | MapLiteral():
+                return False
+        return all(self._is_invariant(child) for child in child_nodes(expression))
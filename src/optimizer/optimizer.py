@@ -0,0 +1,30 @@
+from collections import Counter
+from typing import Optional
+
+from src.ast.core_structures import Program
+from src.optimizer.cast_resolution import resolve_casts
+from src.optimizer.constant_folding import fold_constants
+from src.optimizer.counted_loops import rewrite_counted_loops
+from src.optimizer.dead_code import eliminate_dead_code
+from src.optimizer.inlining import inline_functions, INLINE_THRESHOLD
+from src.optimizer.loop_invariants import hoist_loop_invariants
+
+
+def optimize(program: Program,
+             number_precision: int = 15,
+             inline_threshold: int = INLINE_THRESHOLD,
+             inline_report: Optional[Counter] = None,
+             numeric_mode: str = "strict") -> Program:
+    fold_constants(program, number_precision, numeric_mode)
+    eliminate_dead_code(program)
+
+    if inline_threshold > 0:
+        inlined = inline_functions(program, inline_threshold)
+        eliminate_dead_code(program)
+        if inline_report is not None:
+            inline_report.update(inlined)
+
+    rewrite_counted_loops(program)
+    hoist_loop_invariants(program)
+    resolve_casts(program)
+    return program
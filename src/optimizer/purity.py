@@ -0,0 +1,46 @@
+from src.ast.core_structures import Program, Function
+from src.ast.types import Type, MapType
+from src.ast.statemens import FunctionCall, ThrowStatement
+from src.interpreter.stdlib import STDLIB
+from src.optimizer.walker import child_nodes
+
+SHARED_TYPES = (Type.VoidType, Type.IntArrayType, Type.FloatArrayType)
+
+
+def find_pure_functions(program: Program) -> set[str]:
+    calls = {}
+    pure = set()
+    for function in program.functions.values():
+        if _shares_state(function.return_type) or any(_shares_state(param.type) for param in function.parameters):
+            continue
+        if (called := _called_functions(function)) is not None:
+            calls[function.name] = called
+            pure.add(function.name)
+
+    builtins = STDLIB.keys() - program.functions.keys()
+    changed = True
+    while changed:
+        changed = False
+        for name in list(pure):
+            if not calls[name] <= pure | builtins:
+                pure.discard(name)
+                changed = True
+
+    return pure
+
+
+def _shares_state(type: Type | MapType) -> bool:
+    return type in SHARED_TYPES or isinstance(type, MapType)
+
+
+def _called_functions(function: Function) -> set[str] | None:
+    called = set()
+    pending = [function.statement_block]
+    while pending:
+        node = pending.pop()
+        if isinstance(node, ThrowStatement):
+            return None
+        if isinstance(node, FunctionCall):
+            called.add(node.name)
+        pending.extend(child_nodes(node))
+    return called
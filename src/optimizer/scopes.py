@@ -0,0 +1,38 @@
+from src.ast.core_structures import Program
+from src.ast.statemens import *
+
+
+def mark_scopes(program: Program):
+    for function in program.functions.values():
+        _mark_block(function.statement_block, {param.name for param in function.parameters}, has_scope=True)
+
+
+def _mark_block(statement_block: StatementBlock, declared: set[str], has_scope: bool = False):
+    introduced = {statement.name for statement in statement_block.statements
+                  if isinstance(statement, AssignmentStatement)}
+    introduced |= {statement.variable for statement in statement_block.statements
+                   if isinstance(statement, (ForStatement, ForRangeStatement))}
+    statement_block.needs_scope = not has_scope and not introduced <= declared
+
+    declared = set(declared)
+    for statement in statement_block.statements:
+        match statement:
+            case AssignmentStatement(name=name):
+                declared.add(name)
+            case IfStatement():
+                _mark_block(statement.if_block, declared)
+                for _, elif_block in statement.elif_statement:
+                    _mark_block(elif_block, declared)
+                if statement.else_block is not None:
+                    _mark_block(statement.else_block, declared)
+            case WhileStatement():
+                _mark_block(statement.block, declared)
+            case ForStatement() | ForRangeStatement():
+                declared.add(statement.variable)
+                _mark_block(statement.block, declared)
+            case TryCatchStatement():
+                _mark_block(statement.try_block, declared)
+                for catch in statement.catch_statements:
+                    _mark_block(catch.block, declared, has_scope=True)
+            case StatementBlock():
+                _mark_block(statement, declared)
@@ -0,0 +1,32 @@
+from src.ast.core_structures import Program
+from src.ast.statemens import *
+
+
+def mark_tail_calls(program: Program):
+    for function in program.functions.values():
+        if function.return_type != Type.VoidType:
+            _mark_block(function.statement_block)
+
+
+def _mark_block(statement_block: StatementBlock):
+    for statement in statement_block.statements:
+        _mark_statement(statement)
+
+
+def _mark_statement(statement: Statement):
+    match statement:
+        case ReturnStatement(expression=FunctionCall()):
+            statement.tail_call = True
+        case IfStatement():
+            _mark_block(statement.if_block)
+            for _, elif_block in statement.elif_statement:
+                _mark_block(elif_block)
+            if statement.else_block is not None:
+                _mark_block(statement.else_block)
+        case WhileStatement() | ForStatement() | ForRangeStatement():
+            _mark_block(statement.block)
+        case TryCatchStatement():
+            for catch in statement.catch_statements:
+                _mark_block(catch.block)
+        case StatementBlock():
+            _mark_block(statement)
@@ -0,0 +1,19 @@
+from dataclasses import fields, is_dataclass
+
+from src.ast.node import Node
+
+
+def child_nodes(node) -> list:
+    children = []
+    if is_dataclass(node):
+        for field in fields(node):
+            _collect_nodes(getattr(node, field.name), children)
+    return children
+
+
+def _collect_nodes(value, children: list):
+    if isinstance(value, Node):
+        children.append(value)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            _collect_nodes(item, children)
@@ -38,6 +38,11 @@ SIMPLE_TYPE_MAP = {
     TokenType.STRING_KEYWORD: Type.StringType,
 }
 
+ARRAY_TYPE_MAP = {
+    Type.IntType: Type.IntArrayType,
+    Type.FloatType: Type.FloatArrayType,
+}
+
 
 class Parser:
     def __init__(self, lexer: Lexer):
@@ -76,10 +81,9 @@ class Parser:
 
     # function_declaration = function_return_type, identifier, "(", [parameters], ")", statement_block;
     def _parse_function(self, on_success) -> bool:
-        if (return_type := self._get_return_type(self.current_token.type)) is None:
-            return False
         position = self.current_token.position
-        self._consume_token()
+        if (return_type := self._parse_return_type()) is None:
+            return False
 
         name = self._consume_identifier()
 
@@ -133,12 +137,11 @@ class Parser:
 
         return parameters
 
-    # parameter = simple_type, identifier;
+    # parameter = type, identifier;
     def _parse_parameter(self) -> Optional[Parameter]:
-        if (type := SIMPLE_TYPE_MAP.get(self.current_token.type)) is None:
-            return None
         position = self.current_token.position
-        self._consume_token()
+        if (type := self._parse_type()) is None:
+            return None
 
         name = self._consume_identifier()
 
@@ -163,6 +166,7 @@ class Parser:
 
     # statement = if_statement |
     #            while_statement |
+    #            for_statement |
     #            loop_control_statement |
     #            value_assigment_or_call |
     #            return_statement |
@@ -170,6 +174,7 @@ class Parser:
     #            exception_throw;;
     def _parse_statement(self) -> Statement:
         return ((self._parse_while_statement() or
+                 self._parse_for_statement() or
                  self._parse_if_statement() or
                  self._parse_loop_control_statement() or
                  self._parse_assignment_or_function_call() or
@@ -246,6 +251,38 @@ class Parser:
 
         return WhileStatement(position, condition, statement_block)
 
+    # for_statement = "for", "(", identifier, "in", expression, [".." expression], ")", statement_block;
+    def _parse_for_statement(self) -> Optional[ForStatement | ForRangeStatement]:
+        if self.current_token.type != TokenType.FOR_KEYWORD:
+            return None
+
+        position = self.current_token.position
+        self._consume_token()
+
+        self._consume(TokenType.LEFT_ROUND_BRACKET)
+
+        variable = self._consume_identifier()
+
+        self._consume(TokenType.IN_KEYWORD)
+
+        if (iterable := self._parse_expression()) is None:
+            raise ExpectedExpressionError(self.current_token.position, TokenType.IN_KEYWORD)
+
+        end = None
+        if self.current_token.type == TokenType.RANGE:
+            self._consume_token()
+            if (end := self._parse_expression()) is None:
+                raise ExpectedExpressionError(self.current_token.position, TokenType.RANGE)
+
+        self._consume(TokenType.RIGHT_ROUND_BRACKET)
+
+        if (statement_block := self._parse_statement_block()) is None:
+            raise ExpectedStatementBlockError(self.current_token.position, "for statement")
+
+        if end is not None:
+            return ForRangeStatement(position, variable, iterable, end, statement_block)
+        return ForStatement(position, variable, iterable, statement_block)
+
     # loop_control_statement = ("break" | "continue"), ";";
     def _parse_loop_control_statement(self) -> Optional[BreakStatement | ContinueStatement]:
 
@@ -267,8 +304,10 @@ class Parser:
 
         return builder(position)
 
-    # value_assigment_or_call = identifier, ("=", expression | "(", [function_arguments], ")") ";";
-    def _parse_assignment_or_function_call(self) -> Optional[AssignmentStatement | FunctionCall]:
+    # value_assigment_or_call = identifier, (["[", expression, "]"], "=", expression |
+    #                                       "(", [function_arguments], ")") ";";
+    def _parse_assignment_or_function_call(self) -> Optional[AssignmentStatement | IndexAssignmentStatement |
+                                                             FunctionCall]:
         if self.current_token.type != TokenType.IDENTIFIER:
             return None
 
@@ -276,6 +315,16 @@ class Parser:
         position = self.current_token.position
         self._consume_token()
 
+        if (index := self._parse_index()) is not None:
+            self._consume(TokenType.ASSIGNMENT)
+
+            if (expression := self._parse_expression()) is None:
+                raise ExpectedExpressionError(self.current_token.position, TokenType.ASSIGNMENT)
+
+            self._consume(TokenType.SEMICOLON)
+
+            return IndexAssignmentStatement(position, name, index, expression)
+
         if self.current_token.type == TokenType.ASSIGNMENT:
             self._consume_token()
 
@@ -399,7 +448,7 @@ class Parser:
 
         return attributes
 
-    # attribute_definition = identifier, ":", simple_type, "=", expression, ";";
+    # attribute_definition = identifier, ":", type, "=", expression, ";";
     def _parse_attribute(self) -> Optional[Attribute]:
         if self.current_token.type != TokenType.IDENTIFIER:
             return None
@@ -410,10 +459,9 @@ class Parser:
 
         self._consume(TokenType.COLON)
 
-        if (type := SIMPLE_TYPE_MAP.get(self.current_token.type)) is None:
+        if (type := self._parse_type()) is None:
             raise ExpectedSimpleTypeError(self.current_token.position, TokenType.COLON)
 
-        self._consume_token()
         self._consume(TokenType.ASSIGNMENT)
 
         if (expression := self._parse_expression()) is None:
@@ -533,10 +581,12 @@ class Parser:
         return self._parse_basic_expression()
 
     # basic_expression = literal |
+    #                    map_literal |
     #                    "(", expression, ")" |
     #                    call_or_attribute_or_var;
     def _parse_basic_expression(self) -> Optional[Expression]:
         return (self._parse_literal() or
+                self._parse_map_literal() or
                 self._parse_parenthesized_expression() or
                 self._parse_call_or_attribute_or_var())
 
@@ -552,8 +602,8 @@ class Parser:
 
         return expression
 
-    # call_or_attribute_or_var = identifier, ["(", function_arguments, ")" | ".", identifier ];
-    def _parse_call_or_attribute_or_var(self) -> Optional[FunctionCall | AttributeCall | Variable]:
+    # call_or_attribute_or_var = identifier, ["(", function_arguments, ")" | ".", identifier | index];
+    def _parse_call_or_attribute_or_var(self) -> Optional[FunctionCall | AttributeCall | IndexExpression | Variable]:
         if self.current_token.type != TokenType.IDENTIFIER:
             return None
 
@@ -577,8 +627,110 @@ class Parser:
 
             return AttributeCall(position, name, attr_name)
 
+        if (index := self._parse_index()) is not None:
+            return IndexExpression(position, Variable(position, name), index)
+
         return Variable(position, name)
 
+    # index = "[", expression, "]";
+    def _parse_index(self) -> Optional[Expression]:
+        if self.current_token.type != TokenType.LEFT_SQUARE_BRACKET:
+            return None
+        self._consume_token()
+
+        if (index := self._parse_expression()) is None:
+            raise ExpectedExpressionError(self.current_token.position, TokenType.LEFT_SQUARE_BRACKET)
+
+        self._consume(TokenType.RIGHT_SQUARE_BRACKET)
+
+        return index
+
+    # map_literal = map_type, "{", [map_entry, {",", map_entry}], "}";
+    def _parse_map_literal(self) -> Optional[MapLiteral]:
+        position = self.current_token.position
+        if (map_type := self._parse_map_type()) is None:
+            return None
+
+        self._consume(TokenType.LEFT_CURLY_BRACKET)
+
+        entries = []
+        if entry := self._parse_map_entry():
+            entries.append(entry)
+
+            while self.current_token.type == TokenType.COMMA:
+                self._consume_token()
+                if (entry := self._parse_map_entry()) is None:
+                    raise ExpectedExpressionError(self.current_token.position, TokenType.COMMA)
+                entries.append(entry)
+
+        self._consume(TokenType.RIGHT_CURLY_BRACKET)
+
+        return MapLiteral(position, map_type, entries)
+
+    # map_entry = expression, ":", expression;
+    def _parse_map_entry(self) -> Optional[tuple[Expression, Expression]]:
+        if (key := self._parse_expression()) is None:
+            return None
+
+        self._consume(TokenType.COLON)
+
+        if (value := self._parse_expression()) is None:
+            raise ExpectedExpressionError(self.current_token.position, TokenType.COLON)
+
+        return key, value
+
+    # function_return_type = type | "void";
+    def _parse_return_type(self) -> Optional[Type | MapType]:
+        if self.current_token.type == TokenType.VOID_KEYWORD:
+            self._consume_token()
+            return Type.VoidType
+
+        return self._parse_type()
+
+    # type = simple_type, ["[", "]"] | map_type;
+    def _parse_type(self) -> Optional[Type | MapType]:
+        if (map_type := self._parse_map_type()) is not None:
+            return map_type
+
+        if (type := SIMPLE_TYPE_MAP.get(self.current_token.type)) is None:
+            return None
+        position = self.current_token.position
+        self._consume_token()
+
+        return self._parse_array_suffix(type, position)
+
+    # map_type = "map", "<", simple_type, ",", simple_type, ">";
+    def _parse_map_type(self) -> Optional[MapType]:
+        if self.current_token.type != TokenType.MAP_KEYWORD:
+            return None
+        self._consume_token()
+
+        self._consume(TokenType.LESS_THAN_OPERATOR)
+        key_type = self._parse_simple_type(TokenType.LESS_THAN_OPERATOR)
+        self._consume(TokenType.COMMA)
+        value_type = self._parse_simple_type(TokenType.COMMA)
+        self._consume(TokenType.GREATER_THAN_OPERATOR)
+
+        return MapType(key_type, value_type)
+
+    def _parse_simple_type(self, previous_token: TokenType) -> Type:
+        if (type := SIMPLE_TYPE_MAP.get(self.current_token.type)) is None:
+            raise ExpectedSimpleTypeError(self.current_token.position, previous_token)
+        self._consume_token()
+
+        return type
+
+    def _parse_array_suffix(self, element_type: Type, position: Position) -> Type:
+        if self.current_token.type != TokenType.LEFT_SQUARE_BRACKET:
+            return element_type
+        self._consume_token()
+        self._consume(TokenType.RIGHT_SQUARE_BRACKET)
+
+        if (array_type := ARRAY_TYPE_MAP.get(element_type)) is None:
+            raise UnknownTypeError(position, TokenType.LEFT_SQUARE_BRACKET)
+
+        return array_type
+
     # literal = int_literal |
     #           float_literal |
     #           boolean_literal |
@@ -622,15 +774,6 @@ class Parser:
         while self.current_token.type == TokenType.COMMENT:
             self.current_token = self.lexer.next_token()
 
-    @staticmethod
-    def _get_return_type(type: TokenType) -> Optional[Type]:
-        if return_type := SIMPLE_TYPE_MAP.get(type):
-            return return_type
-        elif type == TokenType.VOID_KEYWORD:
-            return Type.VoidType
-        else:
-            return None
-
 
 def main():
     input_code = """
@@ -0,0 +1,22 @@
+import functools
+
+import pytest
+
+from src.interpreter.executor import ProgramExecutor
+from src.interpreter.stack_executor import StackExecutor
+
+
+EXECUTORS = {
+    "tree": ProgramExecutor,
+    "stack": functools.partial(StackExecutor, recursion_limit=30),
+}
+
+
+@pytest.fixture(params=EXECUTORS.keys())
+def engine(request) -> str:
+    return request.param
+
+
+@pytest.fixture
+def make_executor(engine):
+    return EXECUTORS[engine]
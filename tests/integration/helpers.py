@@ -0,0 +1,31 @@
+import contextlib
+import io
+
+from src.interpreter.executor import ProgramExecutor
+from src.lexer.lexer import DefaultLexer
+from src.lexer.source import Source
+from src.parser.parser import Parser
+
+
+def parse_program(input_code: str):
+    return Parser(DefaultLexer(Source(io.StringIO(input_code)))).get_program()
+
+
+def execute_program(program, executor: ProgramExecutor) -> str:
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        executor.execute(program)
+
+    return output.getvalue().strip()
+
+
+def execute_code(input_code: str, executor: ProgramExecutor) -> str:
+    return execute_program(parse_program(input_code), executor)
+
+
+def in_main(body: str) -> str:
+    return f"""
+    void main(){{
+        {body}
+    }}
+    """
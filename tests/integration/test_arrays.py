@@ -0,0 +1,147 @@
+import pytest
+
+from src.ast.expressions import *
+from src.ast.statemens import *
+from src.ast.types import Type
+from src.errors.interpreter_errors import *
+from src.errors.parser_errors import *
+from src.optimizer.loop_invariants import hoist_loop_invariants
+from src.optimizer.optimizer import optimize
+from src.optimizer.purity import find_pure_functions
+from tests.integration.helpers import execute_program, in_main, parse_program
+
+
+def test_should_parse_array_types_and_indexing():
+    code = """
+    float[] scale(int[] values, float factor){
+        values[0] = values[1];
+        return array(1, factor);
+    }
+    void main(){}
+    """
+    function = parse_program(code).functions["scale"]
+    assert function.return_type == Type.FloatArrayType
+    assert [param.type for param in function.parameters] == [Type.IntArrayType, Type.FloatType]
+
+    assignment = function.statement_block.statements[0]
+    assert isinstance(assignment, IndexAssignmentStatement) and assignment.name == "values"
+    assert isinstance(assignment.expression, IndexExpression)
+    assert assignment.expression.array.name == "values" and assignment.expression.index.value == 1
+
+
+@pytest.mark.parametrize("code", [
+    "string[] f(){}",
+    "int[ f(){}",
+    "void main(){ a[] = 1; }",
+])
+def test_should_reject_malformed_array_syntax(code):
+    with pytest.raises(ParserError):
+        parse_program(code)
+
+
+@pytest.mark.parametrize("body, expected", [
+    ("print(array(3, 0));", "[0, 0, 0]"),
+    ("print(array(2, 1.5));", "[1.5, 1.5]"),
+    ("a = array(3, 1); a[1] = 5; print(a[0] + a[1] + a[2], len(a));", "7 3"),
+    ("a = array(0, 1); append(a, 4); append(a, 2); print(a, len(a));", "[4, 2] 2"),
+    ("a = array(3, 0.0); fill(a, 2.5); print(a, sum(a));", "[2.5, 2.5, 2.5] 7.5"),
+    ("a = array(0, 0); append(a, 3); append(a, 1); b = copy(a); sort(b); print(a, b);", "[3, 1] [1, 3]"),
+    ("a = array(2, 0); b = a; b[0] = 9; print(a);", "[9, 0]"),
+])
+def test_should_operate_on_arrays(make_executor, body, expected):
+    program = parse_program(in_main(body))
+    assert execute_program(program, make_executor()) == expected
+
+
+@pytest.mark.parametrize("body, error", [
+    ("a = array(2, 0); print(a[2]);", IndexOutOfRangeError),
+    ("a = array(2, 0); a[-1] = 1;", IndexOutOfRangeError),
+    ('a = array(2, 0); print(a["0"]);', WrongExpressionTypeError),
+    ("a = array(2, 0); a[0] = 1.5;", WrongExpressionTypeError),
+    ("a = array(2, 0.0); append(a, 1);", WrongExpressionTypeError),
+    ("a = 3; print(a[0]);", WrongExpressionTypeError),
+    ("b[0] = 1;", UndefinedVariableError),
+    ("a = array(-1, 0);", InvalidArgumentError),
+])
+def test_should_reject_invalid_array_access(make_executor, body, error):
+    program = parse_program(in_main(body))
+    with pytest.raises(error):
+        execute_program(program, make_executor())
+
+
+def test_should_share_arrays_between_functions(make_executor):
+    code = """
+    void square_all(int[] values){
+        i = 0;
+        while(i < len(values)){
+            values[i] = values[i] * values[i];
+            i = i + 1;
+        }
+    }
+    int[] numbers(int count){
+        result = array(0, 0);
+        i = 1;
+        while(i <= count){
+            append(result, i);
+            i = i + 1;
+        }
+        return result;
+    }
+    void main(){
+        a = numbers(4);
+        square_all(a);
+        print(a, sum(a));
+    }
+    """
+    program = parse_program(code)
+    assert execute_program(program, make_executor()) == "[1, 4, 9, 16] 30"
+
+
+def test_should_optimize_programs_with_arrays(make_executor):
+    code = """
+    int first(int[] values){
+        return values[0];
+    }
+    void main(){
+        a = array(3, 2);
+        limit = 3;
+        i = 0;
+        while(i < limit){
+            a[i] = a[i] + first(a) * limit;
+            i = i + 1;
+        }
+        print(a);
+    }
+    """
+    program = parse_program(code)
+    optimize(program)
+    assert execute_program(program, make_executor()) == "[8, 26, 26]"
+
+
+def test_functions_sharing_arrays_are_not_pure():
+    code = """
+    int first(int[] values){
+        return values[0];
+    }
+    int[] single(int value){
+        return array(1, value);
+    }
+    int total(int count){
+        return sum(array(count, 1));
+    }
+    void main(){}
+    """
+    assert find_pure_functions(parse_program(code)) == {"total"}
+
+
+def test_array_reads_are_not_hoisted():
+    code = in_main("""
+        a = array(2, 0);
+        while(a[0] < 3){
+            a[0] = a[0] + 1;
+        }
+    """)
+    program = parse_program(code)
+    hoist_loop_invariants(program)
+    loop = program.functions["main"].statement_block.statements[1]
+    assert loop.invariant_slots == []
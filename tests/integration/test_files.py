@@ -0,0 +1,102 @@
+import pytest
+
+from src.errors.interpreter_errors import *
+from src.interpreter.files import FileTable
+from tests.integration.helpers import execute_code
+
+
+LINES = ["id,name", "1,zażółć", "", "2,b\r"]
+
+
+@pytest.fixture(params=["buffered", "mapped"])
+def files(request):
+    return FileTable(block_size=4, mapped=request.param == "mapped")
+
+
+@pytest.fixture
+def source(tmp_path) -> str:
+    path = tmp_path / "input.csv"
+    path.write_bytes("\n".join(LINES).encode("utf-8"))
+    return str(path)
+
+
+def test_should_stream_lines_of_a_file(make_executor, files, source):
+    code = f"""
+    void main(){{
+        count = 0;
+        for (line in lines("{source}")){{
+            print(count, len(line), line);
+            count = count + 1;
+        }}
+        print(count);
+    }}
+    """
+    assert execute_code(code, make_executor(files=files)) == "0 7 id,name\n1 8 1,zażółć\n2 0 \n3 3 2,b\n4"
+
+
+def test_should_read_and_write_through_handles(make_executor, files, source, tmp_path):
+    target = tmp_path / "output.txt"
+    code = f"""
+    void main(){{
+        input = open("{source}", "r");
+        output = open("{target}", "w");
+        header = read_line(input);
+        while(!eof(input)){{
+            write(output, upper(read_line(input)) + ";");
+        }}
+        close(input);
+        close(output);
+        output = open("{target}", "a");
+        write(output, header);
+        close(output);
+    }}
+    """
+    execute_code(code, make_executor(files=files))
+    assert target.read_text(encoding="utf-8") == "1,ZAŻÓŁĆ;;2,B;id,name"
+
+
+def test_should_stop_streaming_after_break(make_executor, files, source):
+    code = f"""
+    void main(){{
+        stream = lines("{source}");
+        for (line in stream){{
+            break;
+        }}
+        for (line in stream){{
+            print(line);
+        }}
+    }}
+    """
+    assert execute_code(code, make_executor(files=files)) == "1,zażółć\n\n2,b"
+
+
+@pytest.mark.parametrize("body", [
+    'f = open("{missing}", "r");',
+    'f = open("{source}", "x");',
+    'f = open("{source}", "r"); close(f); close(f);',
+    'f = open("{source}", "r"); write(f, "text");',
+    'f = open("{target}", "w"); print(read_line(f));',
+    'f = open("{source}", "r"); while(true){{ read_line(f); }}',
+    'for (line in lines("{missing}")){{}}',
+])
+def test_should_reject_invalid_file_operations(make_executor, files, source, tmp_path, body):
+    body = body.format(missing=tmp_path / "missing.txt", source=source, target=tmp_path / "output.txt")
+    with pytest.raises(InvalidArgumentError):
+        execute_code(f"void main(){{ {body} }}", make_executor(files=files))
+
+
+def test_should_close_files_after_uncaught_exception(make_executor, files, source, tmp_path):
+    target = tmp_path / "output.txt"
+    code = f"""
+    void main(){{
+        stream = lines("{source}");
+        output = open("{target}", "w");
+        for (line in stream){{
+            write(output, line);
+            throw BasicException("stop");
+        }}
+    }}
+    """
+    execute_code(code, make_executor(files=files))
+    assert target.read_text(encoding="utf-8") == "id,name"
+    assert files.open_files == {} and len(files.streams) == 0
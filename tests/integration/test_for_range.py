@@ -0,0 +1,158 @@
+import io
+
+import pytest
+
+from src.ast.expressions import *
+from src.ast.statemens import *
+from src.errors.interpreter_errors import *
+from src.errors.parser_errors import *
+from src.interpreter.input_source import LineInput
+from src.lexer.lexer import DefaultLexer
+from src.lexer.source import Source
+from src.lexer.token_ import TokenType
+from src.optimizer.counted_loops import rewrite_counted_loops
+from src.optimizer.optimizer import optimize
+from tests.integration.helpers import execute_program, in_main, parse_program
+
+
+def test_should_lex_range_operator():
+    lexer = DefaultLexer(Source(io.StringIO("0..n 1.5")))
+    tokens = [lexer.next_token() for _ in range(4)]
+    assert [token.type for token in tokens] == [TokenType.INT_LITERAL, TokenType.RANGE,
+                                                TokenType.IDENTIFIER, TokenType.FLOAT_LITERAL]
+
+
+def test_should_parse_for_range_statement():
+    program = parse_program(in_main("for (i in 1..n + 1){ print(i); }"))
+    loop = program.functions["main"].statement_block.statements[0]
+    assert isinstance(loop, ForRangeStatement) and loop.variable == "i"
+    assert loop.start.value == 1
+    assert isinstance(loop.end, PlusExpression) and loop.end.left.name == "n"
+
+
+@pytest.mark.parametrize("code", [
+    "void main(){ for (i in 0..){} }",
+    "void main(){ for (i in 0..5 {} }",
+    "void main(){ for (i in ..5){} }",
+])
+def test_should_reject_malformed_range_syntax(code):
+    with pytest.raises(ParserError):
+        parse_program(code)
+
+
+@pytest.mark.parametrize("body, expected", [
+    ("total = 0; for (i in 0..5){ total = total + i; } print(total, i);", "10 5"),
+    ("for (i in 3..1){ print(i); } print(i);", "3"),
+    ("n = 2; for (i in -n..n){ print(i); }", "-2\n-1\n0\n1"),
+    ("for (i in 0..10){ if(i == 3){ break; } } print(i);", "3"),
+    ("for (i in 0..4){ if(i % 2 == 0){ continue; } print(i); } print(i);", "1\n3\n4"),
+    ("i = 7; for (i in 0..2){} print(i);", "2"),
+    ("for (i in 0..2){ for (j in i..2){ print(i, j); } }", "0 0\n0 1\n1 1"),
+])
+def test_should_execute_for_range_loops(make_executor, body, expected):
+    program = parse_program(in_main(body))
+    assert execute_program(program, make_executor()) == expected
+
+
+@pytest.mark.parametrize("body, error", [
+    ("for (i in 0.5..2){}", WrongExpressionTypeError),
+    ('for (i in 0.."2"){}', WrongExpressionTypeError),
+    ('i = "a"; for (i in 0..2){}', WrongExpressionTypeError),
+    ("for (i in 0..n){}", UndefinedVariableError),
+])
+def test_should_reject_invalid_range_bounds(make_executor, body, error):
+    program = parse_program(in_main(body))
+    with pytest.raises(error):
+        execute_program(program, make_executor())
+
+
+def test_should_call_functions_and_return_from_for_range(make_executor):
+    code = """
+    int square(int value){
+        return value * value;
+    }
+    int first_square_above(int limit){
+        for (i in 0..limit){
+            if(square(i) > limit){
+                return i;
+            }
+        }
+        return -1;
+    }
+    void main(){
+        print(first_square_above(10), first_square_above(0));
+    }
+    """
+    program = parse_program(code)
+    assert execute_program(program, make_executor()) == "4 -1"
+
+
+@pytest.mark.parametrize("loop", ["for (i in 0..n){}", "for (i in array(n, 0)){}"])
+@pytest.mark.parametrize("optimized", [False, True])
+def test_loop_variable_stays_local_to_block_with_only_loop(make_executor, loop, optimized):
+    code = in_main(f"""
+        n = input() to int;
+        if(n > 1){{
+            {loop}
+        }}
+        i = "done";
+        print(i);
+    """)
+    program = parse_program(code)
+    if optimized:
+        optimize(program)
+    executor = make_executor(input_provider=LineInput(["3"]))
+    assert execute_program(program, executor) == "done"
+
+
+@pytest.mark.parametrize("body", [
+    "i = 0; n = 5; while(i < n){ print(i); i = i + 1; }",
+    "i = 1; while(i <= 5){ print(i); i = 1 + i; }",
+    "i = 0; n = 3; while(i < n * 2){ while(i < 0){} i = i + 1; }",
+])
+def test_should_rewrite_counting_while_loops(body):
+    program = parse_program(in_main(body))
+    assert rewrite_counted_loops(program) == 1
+    assert isinstance(program.functions["main"].statement_block.statements[-1], ForRangeStatement)
+
+
+@pytest.mark.parametrize("body", [
+    "i = 0; while(i < 5){ i = i + 2; }",
+    "i = 0; while(i < 5){ i = i + 1; print(i); }",
+    "i = 0; while(i < 5){ if(i == 2){ i = 4; } i = i + 1; }",
+    "i = 0; while(i < 5){ if(i == 2){ continue; } i = i + 1; }",
+    "i = 0; n = 5; while(i < n){ n = n - 1; i = i + 1; }",
+    "i = 0; a = array(3, 0); while(i < len(a)){ append(a, 1); i = i + 1; }",
+    "i = 0.0; while(i < 5.0){ i = i + 1.0; }",
+    "i = 0; n = 5.0; while(i < n){ i = i + 1; }",
+])
+def test_should_not_rewrite_other_while_loops(body):
+    assert rewrite_counted_loops(parse_program(in_main(body))) == 0
+
+
+@pytest.mark.parametrize("low, high", [(1, 3), (5, 2)])
+def test_rewritten_loops_should_keep_while_semantics(make_executor, low, high):
+    code = in_main(f"""
+        i = {low};
+        j = 0;
+        high = {high};
+        total = 0;
+        while(i <= high){{
+            j = 0;
+            limit = 3;
+            while(j < limit){{
+                if(i * j > 4){{
+                    break;
+                }}
+                total = total + i * j;
+                j = j + 1;
+            }}
+            i = i + 1;
+        }}
+        print(i, j, total);
+    """)
+    expected = execute_program(parse_program(code), make_executor())
+    program = parse_program(code)
+    assert rewrite_counted_loops(program) == 2
+    optimize(program)
+    assert execute_program(program, make_executor()) == expected
@@ -0,0 +1,76 @@
+import io
+
+import pytest
+
+from src.errors.interpreter_errors import DivisionByZeroError
+from src.interpreter.input_source import ReplayInput, StreamInput, FileInput
+from tests.integration.helpers import execute_code
+
+
+SUM_LINES = """
+void main(){
+    count = input() to int;
+    total = 0;
+    while(count > 0){
+        total = total + input() to int;
+        count = count - 1;
+    }
+    print(total, input());
+}
+"""
+
+LINES = ["3", "10", "20", "12", "zażółć"]
+
+
+def test_should_replay_recorded_lines(make_executor):
+    assert execute_code(SUM_LINES, make_executor(input_provider=ReplayInput(LINES))) == "42 zażółć"
+
+
+@pytest.mark.parametrize("newline", ["\n", "\r\n"])
+@pytest.mark.parametrize("block_size", [1, 3, 1 << 16])
+def test_should_read_lines_from_stream_blocks(make_executor, newline, block_size):
+    stream = io.BufferedReader(io.BytesIO(newline.join(LINES).encode("utf-8")))
+    executor = make_executor(input_provider=StreamInput(stream, block_size=block_size))
+    assert execute_code(SUM_LINES, executor) == "42 zażółć"
+
+
+@pytest.mark.parametrize("trailing_newline", ["", "\n"])
+def test_should_read_lines_from_mapped_file(make_executor, trailing_newline, tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_text("\n".join(LINES) + trailing_newline, encoding="utf-8")
+    assert execute_code(SUM_LINES, make_executor(input_provider=FileInput(str(path)))) == "42 zażółć"
+
+
+def test_should_raise_eof_error_when_input_is_exhausted(make_executor, tmp_path):
+    path = tmp_path / "empty.txt"
+    path.write_text("")
+    with pytest.raises(EOFError):
+        execute_code(SUM_LINES, make_executor(input_provider=FileInput(str(path))))
+
+    with pytest.raises(EOFError):
+        execute_code(SUM_LINES, make_executor(input_provider=ReplayInput(LINES[:3])))
+
+
+@pytest.mark.parametrize("body", ["print(input());", ""])
+def test_should_close_input_file_after_execution(make_executor, tmp_path, body):
+    path = tmp_path / "input.txt"
+    path.write_text("\n".join(LINES))
+    provider = FileInput(str(path))
+    execute_code(f"void main(){{ {body} }}", make_executor(input_provider=provider))
+    assert provider.file.closed
+
+
+def test_should_close_input_file_after_uncaught_error(make_executor, tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_text("\n".join(LINES))
+    provider = FileInput(str(path))
+    with pytest.raises(DivisionByZeroError):
+        execute_code("void main(){ print(input()); x = 1 / 0; }", make_executor(input_provider=provider))
+    assert provider.file.closed
+
+
+def test_should_keep_empty_lines():
+    provider = StreamInput(io.BufferedReader(io.BytesIO(b"a\n\nb\n")))
+    assert [provider.read_line() for _ in range(3)] == ["a", "", "b"]
+    with pytest.raises(EOFError):
+        provider.read_line()
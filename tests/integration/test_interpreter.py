@@ -1,26 +1,19 @@
-import contextlib
-import io
 from unittest.mock import patch
 
 import pytest
 
 from src.errors.interpreter_errors import *
+from src.ast.position import Position
+from src.interpreter.builtins import BasicException
 from src.interpreter.executor import ProgramExecutor
-from src.lexer.lexer import DefaultLexer
-from src.lexer.source import Source
-from src.parser.parser import Parser
+from tests.integration.helpers import execute_code, parse_program
 
 
-def execute_program(input_code: str) -> str:
-    stream = io.StringIO(input_code)
-    source = Source(stream)
-    lexer = DefaultLexer(source)
-    program = Parser(lexer).get_program()
-    output = io.StringIO()
-    with contextlib.redirect_stdout(output):
-        ProgramExecutor().execute(program)
-
-    return output.getvalue().strip()
+@pytest.fixture
+def execute_program(make_executor):
+    def execute(input_code: str) -> str:
+        return execute_code(input_code, make_executor())
+    return execute
 
 
 def generate_nested_prints(value, depth):
@@ -40,7 +33,7 @@ def generate_nested_prints(value, depth):
         ("\"text1\", \"text2\"", "text1 text2"),
     ]
 )
-def test_should_execute_builtin_print(args, expected):
+def test_should_execute_builtin_print(execute_program, args, expected):
     input_code = f"""
     void main(){{
         print({args});
@@ -57,7 +50,7 @@ def test_should_execute_builtin_print(args, expected):
         ("text", "text"),
     ]
 )
-def test_should_execute_builtin_input(value, expected):
+def test_should_execute_builtin_input(execute_program, value, expected):
     input_code = f"""
     void main(){{
         print(input() to string);
@@ -96,7 +89,7 @@ def test_should_execute_builtin_input(value, expected):
         ("\"text\" to string", "text")
     ]
 )
-def test_cast_simple_types(casted_expression, expected):
+def test_cast_simple_types(execute_program, casted_expression, expected):
     input_code = f"""
     void main(){{
         print({casted_expression});
@@ -114,7 +107,7 @@ def test_cast_simple_types(casted_expression, expected):
         ("\"text\"", "text")
     ]
 )
-def test_declare_variable(value, expected):
+def test_declare_variable(execute_program, value, expected):
     input_code = f"""
     void main(){{
         x = {value};
@@ -132,7 +125,7 @@ def test_declare_variable(value, expected):
         ("\"text\"", "\"another\"", "textanother")
     ]
 )
-def test_execute_plus_expression(a, b, expected):
+def test_execute_plus_expression(execute_program, a, b, expected):
     input_code = f"""
     void main(){{
         x = {a} + {b};
@@ -149,7 +142,7 @@ def test_execute_plus_expression(a, b, expected):
         (1.4, 1.3, "0.1"),
     ]
 )
-def test_execute_minus_expression(a, b, expected):
+def test_execute_minus_expression(execute_program, a, b, expected):
     input_code = f"""
     void main(){{
         x = {a} - {b};
@@ -169,7 +162,7 @@ def test_execute_minus_expression(a, b, expected):
         (1.0, 3.0, "0.333333333333333"),
     ]
 )
-def test_execute_divide_expression(a, b, expected):
+def test_execute_divide_expression(execute_program, a, b, expected):
     input_code = f"""
     void main(){{
         x = {a} / {b};
@@ -188,7 +181,7 @@ def test_execute_divide_expression(a, b, expected):
         (2.0, 0.3, "0.6"),
     ]
 )
-def test_execute_multiply_expression(a, b, expected):
+def test_execute_multiply_expression(execute_program, a, b, expected):
     input_code = f"""
     void main(){{
         x = {a} * {b};
@@ -207,7 +200,7 @@ def test_execute_multiply_expression(a, b, expected):
         (2.0, 0.3, "0.2"),
     ]
 )
-def test_execute_modulo_expression(a, b, expected):
+def test_execute_modulo_expression(execute_program, a, b, expected):
     input_code = f"""
     void main(){{
         x = {a} % {b};
@@ -225,7 +218,7 @@ def test_execute_modulo_expression(a, b, expected):
         ("\"text\"", 1)
     ]
 )
-def test_should_raise_when_type_missmatch_in_binary_expression(a, b):
+def test_should_raise_when_type_missmatch_in_binary_expression(execute_program, a, b):
     input_code = f"""
     void main(){{
         x = {a} + {b};
@@ -236,6 +229,25 @@ def test_should_raise_when_type_missmatch_in_binary_expression(a, b):
         execute_program(input_code)
 
 
+@pytest.mark.parametrize(
+    "expression", [
+        "1 == \"a\"",
+        "1 < 1.0",
+        "true != 1",
+    ]
+)
+def test_should_raise_when_type_missmatch_in_comparison(execute_program, expression):
+    input_code = f"""
+    void main(){{
+        x = {expression};
+    }}
+    """
+    with pytest.raises(NotMatchingTypesInBinaryExpression) as exception_info:
+        execute_program(input_code)
+
+    assert exception_info.value.message.endswith("at Line 3, Column 13")
+
+
 @pytest.mark.parametrize(
     "expression, expected", [
         ("5.0 > 3.0", "true"),
@@ -276,7 +288,7 @@ def test_should_raise_when_type_missmatch_in_binary_expression(a, b):
         ("true != true", "false"),
     ]
 )
-def test_execute_relational_expressions(expression, expected):
+def test_execute_relational_expressions(execute_program, expression, expected):
     input_code = f"""
     void main(){{
         print({expression});
@@ -298,7 +310,7 @@ def test_execute_relational_expressions(expression, expected):
         ("false or false", "false"),
     ]
 )
-def test_execute_logical_expressions(expression, expected):
+def test_execute_logical_expressions(execute_program, expression, expected):
     input_code = f"""
     void main(){{
         print({expression});
@@ -328,7 +340,7 @@ def test_execute_logical_expressions(expression, expected):
         ("!(1>2)", "true"),
     ]
 )
-def test_execute_negated_expressions(expression, expected):
+def test_execute_negated_expressions(execute_program, expression, expected):
     input_code = f"""
     void main(){{
         print({expression});
@@ -345,7 +357,7 @@ def test_execute_negated_expressions(expression, expected):
         ("-(7+1)", "-8"),
     ]
 )
-def test_execute_negated_expressions(expression, expected):
+def test_execute_negated_expressions(execute_program, expression, expected):
     input_code = f"""
     void main(){{
         print({expression});
@@ -360,7 +372,7 @@ def test_execute_negated_expressions(expression, expected):
         (3, 5, "5")
     ]
 )
-def test_assigment_should_change_value_of_variable(a, b, expected):
+def test_assigment_should_change_value_of_variable(execute_program, a, b, expected):
     input_code = f"""
     void main(){{
         x = {a};
@@ -388,7 +400,7 @@ def test_assigment_should_change_value_of_variable(a, b, expected):
         ("\"3\"", "true"),
     ]
 )
-def test_variable_assignment_fails_with_wrong_type(a, b):
+def test_variable_assignment_fails_with_wrong_type(execute_program, a, b):
     input_code = f"""
     void main(){{
         x = {a};
@@ -407,7 +419,7 @@ def test_variable_assignment_fails_with_wrong_type(a, b):
         ("3", "else"),
     ]
 )
-def test_execute_if_statement(value, expected):
+def test_execute_if_statement(execute_program, value, expected):
     input_code = f"""
     void main(){{
         x = {value};
@@ -432,7 +444,7 @@ def test_execute_if_statement(value, expected):
         (2, 3, "2"),
     ]
 )
-def test_execute_while_statement(value, threshold, expected):
+def test_execute_while_statement(execute_program, value, threshold, expected):
     input_code = f"""
     void main(){{
         x = {value};
@@ -446,7 +458,7 @@ def test_execute_while_statement(value, threshold, expected):
     assert captured_output == expected
 
 
-def test_while_statement_should_end_after_break():
+def test_while_statement_should_end_after_break(execute_program):
     input_code = f"""
     void main(){{
         x = 5;
@@ -465,7 +477,7 @@ def test_while_statement_should_end_after_break():
     assert captured_output == "5\n4\n3\n2\n1"
 
 
-def test_while_statement_should_end_after_return():
+def test_while_statement_should_end_after_return(execute_program):
     input_code = f"""
     int func(){{
         x = 5;
@@ -487,7 +499,7 @@ def test_while_statement_should_end_after_return():
     assert captured_output == "5\n4\n3\n2"
 
 
-def test_while_statement_should_skip_rest_of_statements_after_continue():
+def test_while_statement_should_skip_rest_of_statements_after_continue(execute_program):
     input_code = f"""
     void main(){{
         x = 5;
@@ -506,7 +518,22 @@ def test_while_statement_should_skip_rest_of_statements_after_continue():
     assert captured_output == "5\n4\n3\n2\n1\n0"
 
 
-def test_execute_function_call():
+def test_continue_should_reevaluate_loop_condition(execute_program):
+    input_code = f"""
+    void main(){{
+        i = 0;
+        while(i < 1){{
+            i = i + 1;
+            continue;
+        }}
+        print(i);
+    }}
+    """
+    captured_output = execute_program(input_code)
+    assert captured_output == "1"
+
+
+def test_execute_function_call(execute_program):
     input_code = f"""
     int add(int x, int y){{
         return x+y;
@@ -536,7 +563,7 @@ def test_execute_function_call():
     assert captured_output == "3\n2.5\ntrue\ntext\na"
 
 
-def test_execute_function_call_should_reset_value_after_each_call():
+def test_execute_function_call_should_reset_value_after_each_call(execute_program):
     input_code = f"""
     float func1(float x){{
         return x;
@@ -550,7 +577,7 @@ def test_execute_function_call_should_reset_value_after_each_call():
     assert captured_output == "3.0"
 
 
-def test_execute_function_call_should_end_executing_statements_after_return():
+def test_execute_function_call_should_end_executing_statements_after_return(execute_program):
     input_code = f"""
     float func1(float x){{
         return x;
@@ -564,7 +591,7 @@ def test_execute_function_call_should_end_executing_statements_after_return():
     assert captured_output == "3.0"
 
 
-def test_execute_function_call_without_enough_parameters():
+def test_execute_function_call_without_enough_parameters(execute_program):
     input_code = f"""
     float func1(float x){{
         return x;
@@ -594,7 +621,7 @@ def test_execute_function_call_without_enough_parameters():
         ("string", "true"),
     ]
 )
-def test_return_type_mismatch_raises_error(func_type, value):
+def test_return_type_mismatch_raises_error(execute_program, func_type, value):
     input_code = f"""
     {func_type} func1(){{
         return {value};
@@ -615,7 +642,7 @@ def test_return_type_mismatch_raises_error(func_type, value):
         "string",
     ]
 )
-def test_should_raise_when_missing_return_in_non_void_function(func_type):
+def test_should_raise_when_missing_return_in_non_void_function(execute_program, func_type):
     input_code = f"""
     {func_type} func1(){{
         x = 5;
@@ -628,7 +655,7 @@ def test_should_raise_when_missing_return_in_non_void_function(func_type):
         execute_program(input_code)
 
 
-def test_recursion():
+def test_recursion(execute_program):
     input_code = f"""
     int fibonacci(int n){{
         if(n<3){{
@@ -644,7 +671,7 @@ def test_recursion():
     assert captured_output == "610"
 
 
-def test_should_raise_exception_when_recursion_is_too_deep():
+def test_should_raise_exception_when_recursion_is_too_deep(execute_program):
     input_code = f"""
     int fibonacci(int n){{
         if(n<3){{
@@ -660,7 +687,114 @@ def test_should_raise_exception_when_recursion_is_too_deep():
         execute_program(input_code)
 
 
-def test_should_correctly_deduce_variable_scope():
+def test_tail_recursion_should_run_in_constant_stack_space(execute_program):
+    input_code = f"""
+    int sum_to(int n, int acc){{
+        if(n == 0){{
+            return acc;
+        }}
+        return sum_to(n - 1, acc + n);
+    }}
+    void main(){{
+        print(sum_to(5000, 0));
+    }}
+    """
+    captured_output = execute_program(input_code)
+    assert captured_output == "12502500"
+
+
+def test_mutual_tail_recursion_should_run_in_constant_stack_space(execute_program):
+    input_code = f"""
+    bool is_even(int n){{
+        if(n == 0){{
+            return true;
+        }}
+        return is_odd(n - 1);
+    }}
+    bool is_odd(int n){{
+        if(n == 0){{
+            return false;
+        }}
+        return is_even(n - 1);
+    }}
+    void main(){{
+        print(is_even(1001), is_odd(1001));
+    }}
+    """
+    captured_output = execute_program(input_code)
+    assert captured_output == "false true"
+
+
+def test_tail_call_should_check_return_type_of_every_function_in_chain(execute_program):
+    input_code = f"""
+    float func1(){{
+        return 1.5;
+    }}
+    int func2(){{
+        return func1();
+    }}
+    void main(){{
+        print(func2());
+    }}
+    """
+    with pytest.raises(InvalidReturnedValueTypeException):
+        execute_program(input_code)
+
+
+def test_call_returned_inside_try_block_should_not_be_tail_call(execute_program):
+    input_code = f"""
+    int countdown(int n){{
+        if(n == 0){{
+            return 0;
+        }}
+        try{{
+            return countdown(n - 1);
+        }}catch(BasicException e){{
+            return -1;
+        }}
+    }}
+    void main(){{
+        print(countdown(100));
+    }}
+    """
+    with pytest.raises(RecursionTooDeepError):
+        execute_program(input_code)
+
+
+def test_tail_calls_can_be_disabled():
+    input_code = f"""
+    int countdown(int n){{
+        if(n == 0){{
+            return 0;
+        }}
+        return countdown(n - 1);
+    }}
+    void main(){{
+        print(countdown(100));
+    }}
+    """
+    program = parse_program(input_code)
+    with pytest.raises(RecursionTooDeepError):
+        ProgramExecutor(tail_calls=False).execute(program)
+
+
+def test_should_raise_when_recursion_exceeds_python_stack():
+    input_code = """
+    int countdown(int n){
+        if(n == 0){
+            return 0;
+        }
+        return countdown(n - 1) + 1;
+    }
+    void main(){
+        print(countdown(100000));
+    }
+    """
+    with pytest.raises(RecursionTooDeepError):
+        ProgramExecutor(recursion_limit=100_000_000).execute(parse_program(input_code))
+
+
+def test_should_correctly_deduce_variable_scope(execute_program):
     input_code = f"""
     void func1(int x){{
         print(x);
@@ -686,7 +820,7 @@ def test_should_correctly_deduce_variable_scope():
     assert captured_output == "5\n5\n3\n2\n2\n5"
 
 
-def test_should_throw_exception_when_variable_declared_in_inner_scope():
+def test_should_throw_exception_when_variable_declared_in_inner_scope(execute_program):
     input_code = f"""
     void func1(int x){{
         print(x);
@@ -715,7 +849,7 @@ def test_should_throw_exception_when_variable_declared_in_inner_scope():
     assert exception_info.value.message == 'Undefined variable "y" at Line 11, Column 19'
 
 
-def test_execute_throw_custom_exception():
+def test_execute_throw_custom_exception(execute_program):
     input_code = f"""
     exception ValueError(int value) {{
         message: string = "Text value=" + value to string;
@@ -728,7 +862,7 @@ def test_execute_throw_custom_exception():
     assert captured_output == "\x1b[31mValueError at Line 6, Column 9: Text value=3\033[0m"
 
 
-def test_execute_throw_custom_exception_from_within_function():
+def test_execute_throw_custom_exception_from_within_function(execute_program):
     input_code = f"""
     exception ValueError(int value) {{
         message: string = "Text value=" + value to string;
@@ -746,7 +880,7 @@ def test_execute_throw_custom_exception_from_within_function():
     assert captured_output == "\x1b[31mValueError at Line 6, Column 9: Text value=3\033[0m"
 
 
-def test_execute_try_catch_statement():
+def test_execute_try_catch_statement(execute_program):
     input_code = f"""
     exception ValueError(int value) {{
         message: string = "Text value=" + value to string;
@@ -768,7 +902,7 @@ def test_execute_try_catch_statement():
     assert captured_output == "after catch"
 
 
-def test__get_access_to_attributes_in_catch_statement():
+def test__get_access_to_attributes_in_catch_statement(execute_program):
     input_code = f"""
     exception ValueError(int value) {{
         message: string = "Text value=" + value to string;
@@ -790,7 +924,7 @@ def test__get_access_to_attributes_in_catch_statement():
     assert captured_output == "Text value=3 Line 6, Column 9"
 
 
-def test_catch_custom_exception_using_builtin_base_exception():
+def test_catch_custom_exception_using_builtin_base_exception(execute_program):
     input_code = f"""
     exception ValueError(int value) {{
         message: string = "Text value=" + value to string;
@@ -814,7 +948,7 @@ def test_catch_custom_exception_using_builtin_base_exception():
     assert captured_output == "Text value=3 Line 6, Column 9"
 
 
-def test_should_throw_exception_when_exception_class_is_not_matched():
+def test_should_throw_exception_when_exception_class_is_not_matched(execute_program):
     input_code = f"""
     exception ValueError(int value) {{
         message: string = "Text value=" + value to string;
@@ -839,7 +973,7 @@ def test_should_throw_exception_when_exception_class_is_not_matched():
     assert captured_output == "\x1b[31mValueError at Line 9, Column 9: Text value=3\033[0m"
 
 
-def test_should_raise_exception_when_missing_main_function():
+def test_should_raise_exception_when_missing_main_function(execute_program):
     input_code = f"""
     void func1(){{
         x = 2;
@@ -849,7 +983,7 @@ def test_should_raise_exception_when_missing_main_function():
         execute_program(input_code)
 
 
-def test_should_raise_exception_when_variable_already_declared():
+def test_should_raise_exception_when_variable_already_declared(execute_program):
     input_code = f"""
     int func1(int x, float x){{
         x = 2;
@@ -862,7 +996,7 @@ def test_should_raise_exception_when_variable_already_declared():
         execute_program(input_code)
 
 
-def test_should_raise_exception_when_called_unknown_function():
+def test_should_raise_exception_when_called_unknown_function(execute_program):
     input_code = f"""
     void main(){{
         func1();
@@ -891,7 +1025,7 @@ def test_should_raise_exception_when_called_unknown_function():
         "\"text\" or \"text\"",
     ]
 )
-def test_should_raise_when_wrong_expression_type_for_operations(expr):
+def test_should_raise_when_wrong_expression_type_for_operations(execute_program, expr):
     input_code = f"""
     void main(){{
         a = {expr};
@@ -907,7 +1041,7 @@ def test_should_raise_when_wrong_expression_type_for_operations(expr):
         "1.0/0.0"
     ]
 )
-def test_should_raise_when_divide_by_zero(expr):
+def test_should_raise_when_divide_by_zero(execute_program, expr):
     input_code = f"""
     void main(){{
         x = {expr};
@@ -917,7 +1051,45 @@ def test_should_raise_when_divide_by_zero(expr):
         execute_program(input_code)
 
 
-def test_should_raise_when_throw_undefined_exception():
+def test_should_raise_when_throw_with_wrong_number_of_arguments(execute_program):
+    input_code = f"""
+    exception ValueError(int value) {{
+        message: string = "Text value=" + value to string;
+    }}
+    void main(){{
+        throw ValueError(1, 2);
+    }}
+    """
+    with pytest.raises(WrongNumberOfArguments) as exception_info:
+        execute_program(input_code)
+
+    assert exception_info.value.message.endswith("at Line 6, Column 9")
+
+
+def test_exception_attribute_throwing_propagates_inner_exception(execute_program):
+    input_code = f"""
+    exception ValueError(int value) {{
+        message: string = "Text value=" + fail() to string;
+    }}
+    int fail(){{
+        throw BasicException("inner");
+        return 1;
+    }}
+    void main(){{
+        try{{
+            throw ValueError(1);
+        }}catch(ValueError e){{
+            print("outer");
+        }}catch(BasicException e){{
+            print(e.message);
+        }}
+    }}
+    """
+    captured_output = execute_program(input_code)
+    assert captured_output == "inner"
+
+
+def test_should_raise_when_throw_undefined_exception(execute_program):
     input_code = f"""
     void main(){{
         throw RandomException();
@@ -933,7 +1105,7 @@ def test_should_raise_when_throw_undefined_exception():
         "continue",
     ]
 )
-def test_should_raise_when_loop_control_outside_loop(stmnt):
+def test_should_raise_when_loop_control_outside_loop(execute_program, stmnt):
     input_code = f"""
     int func1(int x){{
         {stmnt};
@@ -947,7 +1119,7 @@ def test_should_raise_when_loop_control_outside_loop(stmnt):
         execute_program(input_code)
 
 
-def test_should_raise_when_call_non_existent_attribute():
+def test_should_raise_when_call_non_existent_attribute(execute_program):
     input_code = f"""
     exception ValueError(int value) {{
         message: string = "Text value=" + value to string;
@@ -969,7 +1141,170 @@ def test_should_raise_when_call_non_existent_attribute():
         execute_program(input_code)
 
 
-def test_should_raise_when_no_value_to_read():
+def test_should_bind_nested_catch_variables_to_exceptions(execute_program):
+    input_code = f"""
+    exception ValueError(int value) {{
+        message: string = "Text value=" + value to string;
+        value: int = value;
+    }}
+    void main(){{
+        try{{
+            throw ValueError(1);
+        }}catch(ValueError e){{
+            try{{
+                throw BasicException("inner");
+            }}catch(BasicException e){{
+                print(e.message);
+            }}
+            print(e.message, e.value);
+        }}
+    }}
+    """
+    assert execute_program(input_code) == "inner\nText value=1 1"
+
+
+def test_should_dispatch_to_first_matching_catch(execute_program):
+    input_code = f"""
+    exception ValueError(int value) {{
+        message: string = "Text value=" + value to string;
+    }}
+    void check(int value){{
+        try{{
+            if(value > 0){{
+                throw ValueError(value);
+            }}
+            throw BasicException("negative");
+        }}catch(ValueError e){{
+            print("value", e.message);
+        }}catch(BasicException e){{
+            print("basic", e.message);
+        }}catch(ValueError e){{
+            print("unreachable");
+        }}
+    }}
+    void main(){{
+        check(1);
+        check(-1);
+        try{{
+            check(0);
+            throw ValueError(2);
+        }}catch(BasicException e){{
+            print("outer", e.message);
+        }}
+    }}
+    """
+    assert execute_program(input_code) == "value Text value=1\nbasic negative\nbasic negative\nouter Text value=2"
+
+
+def test_should_not_read_attributes_outside_of_catch(execute_program):
+    input_code = f"""
+    void main(){{
+        try{{
+            throw BasicException("inner");
+        }}catch(BasicException e){{
+            print(e.message);
+        }}
+        print(e.message);
+    }}
+    """
+    with pytest.raises(UndefinedAttributeError):
+        execute_program(input_code)
+
+
+def test_should_print_uncaught_exception_without_message(execute_program):
+    input_code = f"""
+    exception EmptyError(int value) {{
+        value: int = value;
+    }}
+    void main(){{
+        throw EmptyError(1);
+    }}
+    """
+    assert execute_program(input_code) == "\x1b[31mEmptyError at Line 6, Column 9\x1b[0m"
+
+
+def test_should_unwind_calls_loops_and_scopes_to_catching_try(execute_program):
+    input_code = f"""
+    int descend(int depth){{
+        if(depth == 0){{
+            throw BasicException("bottom");
+        }}
+        while(true){{
+            local = depth;
+            return descend(depth - 1) + local;
+        }}
+    }}
+    void main(){{
+        total = 0;
+        round = 0;
+        while(round < 10){{
+            try{{
+                if(true){{
+                    inner = round;
+                    total = total + descend(25);
+                }}
+            }}catch(BasicException e){{
+                total = total + 1;
+            }}
+            round = round + 1;
+        }}
+        print(total, round);
+    }}
+    """
+    assert execute_program(input_code) == "10 10"
+
+
+def test_should_restore_catch_variable_after_rethrow_from_catch(execute_program):
+    input_code = f"""
+    void fail(string message){{
+        try{{
+            throw BasicException(message);
+        }}catch(BasicException e){{
+            throw BasicException(e.message + "!");
+        }}
+    }}
+    void main(){{
+        try{{
+            throw BasicException("outer");
+        }}catch(BasicException e){{
+            try{{
+                fail("inner");
+            }}catch(BasicException inner){{
+                print(inner.message);
+            }}
+            try{{
+                try{{
+                    throw BasicException("shadow");
+                }}catch(BasicException e){{
+                    fail(e.message);
+                }}
+            }}catch(BasicException other){{
+                print(other.message);
+            }}
+            print(e.message);
+        }}
+    }}
+    """
+    assert execute_program(input_code) == "inner!\nshadow!\nouter"
+
+
+def test_should_read_throw_position_in_catch(execute_program):
+    input_code = f"""
+    exception ValueError(int value) {{
+        value: int = value;
+    }}
+    void main(){{
+        try{{
+            throw ValueError(1);
+        }}catch(ValueError e){{
+            print(e.position, e.value);
+        }}
+    }}
+    """
+    assert execute_program(input_code) == "Line 7, Column 13 1"
+
+
+def test_should_raise_when_no_value_to_read(execute_program):
     input_code = f"""
     void func1(){{
         print("text after throw");
@@ -983,7 +1318,7 @@ def test_should_raise_when_no_value_to_read():
         execute_program(input_code)
 
 
-def test_should_raise_when_attribute_already_declared():
+def test_should_raise_when_attribute_already_declared(execute_program):
     input_code = f"""
     exception ValueError(int value) {{
         message: string = "Text value=" + value to string;
@@ -1014,7 +1349,7 @@ def test_should_raise_when_attribute_already_declared():
         "func3(func1())"
     ]
 )
-def test_should_raise_when_void_function_passed_as_value(statement):
+def test_should_raise_when_void_function_passed_as_value(execute_program, statement):
     input_code = f"""
     exception ValueError(int value) {{
         message: string = "Text value=" + value to string;
@@ -1041,7 +1376,7 @@ def test_should_raise_when_void_function_passed_as_value(statement):
         execute_program(input_code)
 
 
-def test_should_raise_when_result_exceeds_limit():
+def test_should_raise_when_result_exceeds_limit(execute_program):
     input_code = f"""
     void main(){{
         x = {sys.maxsize} + 1;
@@ -1051,7 +1386,7 @@ def test_should_raise_when_result_exceeds_limit():
         execute_program(input_code)
 
 
-def test_should_raise_when_void_function_returns_value():
+def test_should_raise_when_void_function_returns_value(execute_program):
     input_code = f"""
     void main(){{
         return 5;
@@ -1061,7 +1396,7 @@ def test_should_raise_when_void_function_returns_value():
         execute_program(input_code)
 
 
-def test_should_throw_base_exception():
+def test_should_throw_base_exception(execute_program):
     input_code = f"""
     void main(){{
         throw BasicException();
@@ -1071,7 +1406,7 @@ def test_should_throw_base_exception():
     assert output_value == "\033[31mBase exception at Line 3, Column 9: Exception raised\033[0m"
 
 
-def test_should_throw_base_exception_with_custom_message():
+def test_should_throw_base_exception_with_custom_message(execute_program):
     input_code = f"""
     void main(){{
         throw BasicException("Custom message");
@@ -1082,7 +1417,7 @@ def test_should_throw_base_exception_with_custom_message():
 
 
 
-def test_throw_in_condition():
+def test_throw_in_condition(execute_program):
     input_code = f"""
     bool func1(){{
         throw BasicException("Custom message");
@@ -1099,10 +1434,10 @@ def test_throw_in_condition():
     }}
     """
     output_value = execute_program(input_code)
-    assert output_value == "\x1b[31mBase exception at ('position', Line 3, Column 9): ('message', 'Custom message')\x1b[0m"
+    assert output_value == "\x1b[31mBase exception at Line 3, Column 9: Custom message\x1b[0m"
 
 
-def test_nested_throw():
+def test_nested_throw(execute_program):
     input_code = f"""
     exception ValueError(int value) {{
         message: string = "Text value=" + value to string;
@@ -1134,7 +1469,7 @@ def test_nested_throw():
     assert output_value == "Text value=2\nCustom message"
 
 
-def test_nested_exception():
+def test_nested_exception(execute_program):
     input_code = f"""
     exception ValueError(int value) {{
         message: string = "Text value=" + value to string;
@@ -1159,3 +1494,10 @@ def test_nested_exception():
     """
     with pytest.raises(RecursionTooDeepError):
         execute_program(input_code)
+
+
+def test_should_materialize_throw_position_on_first_read():
+    exception = BasicException(Position(1, 2), "boom")
+    assert "position" not in exception.attributes
+    assert exception.attribute("position") == Position(1, 2)
+    assert exception.attributes == {"message": "boom", "position": Position(1, 2)}
@@ -0,0 +1,226 @@
+import pytest
+
+from src.ast.expressions import *
+from src.ast.statemens import *
+from src.ast.types import Type, MapType
+from src.errors.interpreter_errors import *
+from src.errors.parser_errors import *
+from src.optimizer.cast_resolution import resolve_casts
+from src.optimizer.optimizer import optimize
+from src.optimizer.purity import find_pure_functions
+from tests.integration.helpers import execute_program, in_main, parse_program
+
+
+def test_should_parse_map_types_literals_and_for_loops():
+    code = """
+    map<string, int> invert(map<int, string> names){
+        result = map<string, int>{"zero": 0, "one": 1};
+        for (key in names){
+            result[names[key]] = key;
+        }
+        return result;
+    }
+    void main(){}
+    """
+    function = parse_program(code).functions["invert"]
+    assert function.return_type == MapType(Type.StringType, Type.IntType)
+    assert function.parameters[0].type == MapType(Type.IntType, Type.StringType)
+
+    literal, loop, _ = function.statement_block.statements
+    assert isinstance(literal.expression, MapLiteral)
+    assert [(key.value, value.value) for key, value in literal.expression.entries] == [("zero", 0), ("one", 1)]
+    assert isinstance(loop, ForStatement) and loop.variable == "key" and loop.iterable.name == "names"
+    assert isinstance(loop.block.statements[0], IndexAssignmentStatement)
+
+
+@pytest.mark.parametrize("code", [
+    "map<int> f(){}",
+    "map<int, int[]> f(){}",
+    "void main(){ m = map<int, int>{1: 2,}; }",
+    "void main(){ m = map<int, int>{1 2}; }",
+    "void main(){ for (k m){} }",
+])
+def test_should_reject_malformed_map_syntax(code):
+    with pytest.raises(ParserError):
+        parse_program(code)
+
+
+@pytest.mark.parametrize("body, expected", [
+    ('print(map<int, string>{1: "one", 2: "two"});', "{1: one, 2: two}"),
+    ("print(map<string, bool>{});", "{}"),
+    ('m = map<string, int>{"a": 1}; m["b"] = 2; m["a"] = 3; print(m, len(m));', "{a: 3, b: 2} 2"),
+    ('m = map<int, float>{1: 0.5}; print(m[1], contains(m, 1), contains(m, 2));', "0.5 true false"),
+    ('m = map<int, int>{1: 1, 2: 4}; remove(m, 1); print(m);', "{2: 4}"),
+    ('m = map<bool, string>{true: "yes", 1 > 2: "no"}; print(m[false]);', "no"),
+    ("m = map<float, int>{0.1 + 0.2: 1}; print(m[0.3]);", "1"),
+    ('m = map<int, int>{1: 1}; n = m; n[2] = 2; print(m);', "{1: 1, 2: 2}"),
+])
+def test_should_operate_on_maps(make_executor, body, expected):
+    program = parse_program(in_main(body))
+    assert execute_program(program, make_executor()) == expected
+
+
+@pytest.mark.parametrize("body, error", [
+    ('m = map<int, string>{1: "one"}; print(m[2]);', KeyNotFoundError),
+    ('m = map<int, string>{1: "one"}; print(m["1"]);', WrongExpressionTypeError),
+    ('m = map<int, string>{1: 1};', WrongExpressionTypeError),
+    ('m = map<int, string>{}; m[1] = 1.5;', WrongExpressionTypeError),
+    ('m = map<int, string>{}; m = map<int, int>{};', WrongExpressionTypeError),
+    ('m = map<int, string>{}; print(contains(m, "a"));', WrongExpressionTypeError),
+    ('m = map<int, string>{}; remove(m, 1);', InvalidArgumentError),
+    ("for (x in 5){}", WrongExpressionTypeError),
+])
+def test_should_reject_invalid_map_access(make_executor, body, error):
+    program = parse_program(in_main(body))
+    with pytest.raises(error):
+        execute_program(program, make_executor())
+
+
+def test_should_iterate_over_map_keys_and_arrays(make_executor):
+    code = """
+    map<string, int> count_letters(string text){
+        result = map<string, int>{};
+        i = 0;
+        while(i < len(text)){
+            letter = substr(text, i, 1);
+            if(contains(result, letter)){
+                result[letter] = result[letter] + 1;
+            } else {
+                result[letter] = 1;
+            }
+            i = i + 1;
+        }
+        return result;
+    }
+    void main(){
+        counts = count_letters("abracadabra");
+        for (letter in counts){
+            if(counts[letter] == 1){
+                continue;
+            }
+            if(letter == "r"){
+                remove(counts, letter);
+                break;
+            }
+            print(letter, counts[letter]);
+        }
+        total = 0;
+        for (value in array(3, 2)){
+            total = total + value;
+        }
+        print(counts, total);
+    }
+    """
+    program = parse_program(code)
+    assert execute_program(program, make_executor()) == "a 5\nb 2\n{a: 5, b: 2, c: 1, d: 1} 6"
+
+
+@pytest.mark.parametrize("body, expected", [
+    ("for (x in array(2, 5)){} print(x);", "5"),
+    ("x = 1; for (x in array(2, 5)){} print(x);", "5"),
+    ("for (k in map<int, int>{1: 2, 3: 4}){ if(k == 1){ break; } } print(k);", "1"),
+    ("x = 1; for (x in array(0, 5)){} print(x);", "1"),
+])
+def test_for_loop_variable_stays_bound_after_loop(make_executor, body, expected):
+    program = parse_program(in_main(body))
+    assert execute_program(program, make_executor()) == expected
+
+
+@pytest.mark.parametrize("body, error", [
+    ("for (x in array(0, 5)){} print(x);", UndefinedVariableError),
+    ('x = "a"; for (x in array(1, 5)){}', WrongExpressionTypeError),
+])
+def test_for_loop_variable_binding_errors(make_executor, body, error):
+    program = parse_program(in_main(body))
+    with pytest.raises(error):
+        execute_program(program, make_executor())
+
+
+def test_should_return_from_for_loop(make_executor):
+    code = """
+    string find(map<string, int> values, int wanted){
+        for (key in values){
+            if(values[key] == wanted){
+                return key;
+            }
+        }
+        return "";
+    }
+    void main(){
+        print(find(map<string, int>{"a": 1, "b": 2}, 2));
+    }
+    """
+    program = parse_program(code)
+    assert execute_program(program, make_executor()) == "b"
+
+
+def test_should_optimize_programs_with_maps(make_executor):
+    code = """
+    int twice(int value){
+        return value * 2;
+    }
+    void main(){
+        total = 0;
+        key = 0;
+        limit = 3;
+        squares = map<int, int>{};
+        while(key < limit){
+            fresh = map<int, int>{0: limit};
+            fresh[0] = fresh[0] + twice(key);
+            squares[key] = fresh[0];
+            key = key + 1;
+        }
+        for (key in squares){
+            total = total + squares[key];
+        }
+        print(squares, total);
+    }
+    """
+    program = parse_program(code)
+    optimize(program)
+    assert execute_program(program, make_executor()) == "{0: 3, 1: 5, 2: 7} 15"
+
+
+def test_functions_sharing_maps_are_not_pure():
+    code = """
+    int size(map<int, int> values){
+        return len(values);
+    }
+    int count(int value){
+        return len(map<int, int>{value: 1});
+    }
+    void main(){}
+    """
+    assert find_pure_functions(parse_program(code)) == {"count"}
+
+
+def test_should_resolve_casts_of_map_values():
+    code = """
+    void main(){
+        m = map<string, int>{"a": 1};
+        for (item in m){
+            print(item to string);
+        }
+        print(m["a"] to string);
+    }
+    """
+    assert resolve_casts(parse_program(code)) == 1
+
+
+@pytest.mark.parametrize("body", [
+    "while(m != target and i < 5){ m[1] = 1; i = i + 1; }",
+    "while(m != target and i < 5){ alias[1] = 1; i = i + 1; }",
+    "while(len(m) < 1 and i < 5){ remove(target, 1); alias[1] = 1; i = i + 1; }",
+])
+def test_should_not_hoist_reads_of_mutated_maps(make_executor, body):
+    code = in_main(f"""
+        m = map<int, int>{{}};
+        alias = m;
+        target = map<int, int>{{1: 1}};
+        i = 0;
+        {body}
+        print(i);
+    """)
+    program = parse_program(code)
+    optimize(program)
+    assert execute_program(program, make_executor()) == "1"
@@ -0,0 +1,146 @@
+import pytest
+
+from src.interpreter.memo_cache import MemoCache
+from src.optimizer.purity import find_pure_functions
+from tests.integration.helpers import execute_code, parse_program
+
+
+FIBONACCI = """
+int fibonacci(int n){{
+    if(n < 3){{
+        return 1;
+    }}
+    return fibonacci(n - 2) + fibonacci(n - 1);
+}}
+void main(){{
+    print(fibonacci({n}));
+}}
+"""
+
+
+def test_should_find_pure_functions():
+    input_code = """
+    int square(int x){
+        return x * x;
+    }
+    int sum_of_squares(int a, int b){
+        return square(a) + square(b);
+    }
+    int noisy(int x){
+        print(x);
+        return x;
+    }
+    int uses_noisy(int x){
+        return noisy(x) + 1;
+    }
+    int throwing(int x){
+        if(x < 0){
+            throw BasicException("negative");
+        }
+        return x;
+    }
+    int reads(){
+        return input() to int;
+    }
+    void nothing(){
+        x = 1;
+    }
+    void main(){
+        print(sum_of_squares(1, 2));
+    }
+    """
+    assert find_pure_functions(parse_program(input_code)) == {"square", "sum_of_squares"}
+
+
+def test_mutually_recursive_functions_can_be_pure():
+    input_code = """
+    bool is_even(int n){
+        if(n == 0){
+            return true;
+        }
+        return is_odd(n - 1);
+    }
+    bool is_odd(int n){
+        if(n == 0){
+            return false;
+        }
+        return is_even(n - 1);
+    }
+    void main(){
+        print(is_even(4));
+    }
+    """
+    assert find_pure_functions(parse_program(input_code)) == {"is_even", "is_odd"}
+
+
+def test_should_memoize_pure_function(make_executor):
+    cache = MemoCache()
+    captured_output = execute_code(FIBONACCI.format(n=25), make_executor(memo_cache=cache))
+    assert captured_output == "75025"
+    assert cache.misses == 25
+    assert cache.hits == 22
+    assert len(cache) == 25
+
+
+def test_should_not_memoize_impure_function(make_executor):
+    input_code = """
+    int noisy(int x){
+        print(x);
+        return x;
+    }
+    void main(){
+        print(noisy(1) + noisy(1));
+    }
+    """
+    cache = MemoCache()
+    captured_output = execute_code(input_code, make_executor(memo_cache=cache))
+    assert captured_output == "1\n1\n2"
+    assert cache.hits == 0
+    assert cache.misses == 0
+
+
+def test_should_distinguish_arguments_by_type(make_executor):
+    input_code = """
+    string describe(float x){
+        return x to string;
+    }
+    void main(){
+        print(describe(1), describe(1.0));
+    }
+    """
+    cache = MemoCache()
+    captured_output = execute_code(input_code, make_executor(memo_cache=cache))
+    assert captured_output == "1 1.0"
+    assert cache.hits == 0
+
+
+def test_should_evict_least_recently_used_entry():
+    cache = MemoCache(max_size=2)
+    cache.store("a", 1)
+    cache.store("b", 2)
+    cache.lookup("a")
+    cache.store("c", 3)
+    assert cache.lookup("a") == (True, 1)
+    assert cache.lookup("b") == (False, None)
+    assert cache.evictions == 1
+
+
+def test_should_evict_oldest_entry_in_fifo_mode():
+    cache = MemoCache(max_size=2, eviction="fifo")
+    cache.store("a", 1)
+    cache.store("b", 2)
+    cache.lookup("a")
+    cache.store("c", 3)
+    assert cache.lookup("a") == (False, None)
+    assert cache.lookup("b") == (True, 2)
+
+
+def test_should_not_cache_when_size_is_zero():
+    cache = MemoCache(max_size=0)
+    cache.store("a", 1)
+    assert len(cache) == 0
+
+
+def test_should_reject_unknown_eviction_policy():
+    with pytest.raises(ValueError):
+        MemoCache(eviction="random")
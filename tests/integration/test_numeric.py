@@ -0,0 +1,99 @@
+import pytest
+
+from src.errors.interpreter_errors import *
+from src.interpreter.executor import ProgramExecutor
+from src.optimizer.optimizer import optimize
+from tests.integration.helpers import execute_code, execute_program, parse_program
+
+
+MODES = ["strict", "fast"]
+
+
+@pytest.mark.parametrize("mode", MODES)
+def test_should_round_printed_floats(make_executor, mode):
+    code = """
+    void main(){
+        a = 0.1 + 0.2;
+        print(a, a * 3.0, a to string, (a * 10.0) to int);
+    }
+    """
+    assert execute_code(code, make_executor(numeric_mode=mode)) == "0.3 0.9 0.3 3"
+
+
+@pytest.mark.parametrize("mode", MODES)
+def test_should_compare_rounded_floats(make_executor, mode):
+    code = """
+    bool same(float a, float b){
+        return a == b;
+    }
+    void main(){
+        i = 0;
+        total = 0.0;
+        while(i < 10){
+            total = total + 0.1;
+            i = i + 1;
+        }
+        print(total == 1.0, same(0.1 + 0.2, 0.3), 0.3 - 0.1 - 0.2 < 0.0);
+    }
+    """
+    assert execute_code(code, make_executor(numeric_mode=mode)) == "true true false"
+
+
+@pytest.mark.parametrize("mode", MODES)
+def test_should_detect_division_by_rounded_zero(make_executor, mode):
+    code = """
+    void main(){
+        print(1.0 / (0.3 - 0.1 - 0.2));
+    }
+    """
+    with pytest.raises(DivisionByZeroError):
+        execute_code(code, make_executor(numeric_mode=mode))
+
+
+@pytest.mark.parametrize("mode", MODES)
+def test_should_detect_int_overflow(make_executor, mode):
+    code = """
+    void main(){
+        a = 3037000500;
+        b = a * a;
+        print("unreachable");
+    }
+    """
+    with pytest.raises(ValueOverflowError):
+        execute_code(code, make_executor(numeric_mode=mode))
+
+
+def test_should_detect_float_overflow_when_observed_in_fast_mode(make_executor):
+    code = """
+    void main(){
+        a = 3037000500.0;
+        b = a * a;
+        print(b / a);
+        print(b);
+    }
+    """
+    with pytest.raises(ValueOverflowError):
+        execute_code(code, make_executor(numeric_mode="fast"))
+
+
+@pytest.mark.parametrize("mode", MODES)
+def test_optimized_program_should_print_same_floats(make_executor, mode):
+    code = """
+    float scale(float value){
+        return value * 10000000000000000.0;
+    }
+    void main(){
+        x = 0.1 + 0.2;
+        y = 1.0 / 3.0 * 3.0;
+        print(x * 10000000000000000.0, scale(0.1 + 0.2), y == 1.0, (x - 0.3) * 1000000000000000000.0);
+    }
+    """
+    expected = execute_program(parse_program(code), make_executor(numeric_mode=mode))
+    program = parse_program(code)
+    optimize(program, numeric_mode=mode)
+    assert execute_program(program, make_executor(numeric_mode=mode)) == expected
+
+
+def test_should_reject_unknown_numeric_mode():
+    with pytest.raises(ValueError):
+        ProgramExecutor(numeric_mode="loose")
@@ -0,0 +1,749 @@
+import contextlib
+import io
+from collections import Counter
+
+import pytest
+
+from src.ast.expressions import *
+from src.ast.quickened import ResolvedCastedExpression
+from src.ast.statemens import *
+from src.errors.interpreter_errors import *
+from src.optimizer.constant_folding import fold_constants
+from src.optimizer.cast_resolution import resolve_casts
+from src.optimizer.catch_tables import build_catch_tables, exception_lineage
+from src.optimizer.dead_code import eliminate_dead_code
+from src.optimizer.inlining import inline_functions
+from src.optimizer.loop_invariants import hoist_loop_invariants
+from src.optimizer.optimizer import optimize
+from src.optimizer.scopes import mark_scopes
+from tests.integration.helpers import execute_program, parse_program
+
+
+def main_statements(program):
+    return program.functions["main"].statement_block.statements
+
+
+@pytest.mark.parametrize(
+    "expression, expected", [
+        ("5*2+1-(4+2)", "5"),
+        ("\"Lorem\" + \" ipsum\"", "Lorem ipsum"),
+        ("7 / 2", "3"),
+        ("7.0 / 2.0", "3.5"),
+        ("0.1 + 0.2", "0.3"),
+        ("-(3 - 5) % 3", "2"),
+        ("\"12\" to int + 1", "13"),
+        ("2.9 to int", "2"),
+        ("(1 < 2) and !(2 == 3)", "true"),
+        ("true or 1 to bool", "true"),
+        ("5 to string + \"!\"", "5!"),
+    ]
+)
+def test_should_fold_constant_expression(make_executor, expression, expected):
+    input_code = f"""
+    void main(){{
+        print({expression});
+    }}
+    """
+    program = parse_program(input_code)
+    optimize(program)
+    call = main_statements(program)[0]
+    assert isinstance(call.arguments[0], (IntLiteral, FloatLiteral, BoolLiteral, StringLiteral))
+    assert execute_program(program, make_executor()) == expected
+
+
+def test_should_leave_division_by_zero_for_runtime(make_executor):
+    input_code = """
+    void main(){
+        print("before");
+        x = 10 / (5 - 5);
+    }
+    """
+    program = optimize(parse_program(input_code))
+    assert isinstance(main_statements(program)[1].expression, DivideExpression)
+    with pytest.raises(DivisionByZeroError):
+        execute_program(program, make_executor())
+
+
+def test_should_not_report_division_by_zero_in_dead_code(make_executor):
+    input_code = """
+    void main(){
+        if(false){
+            y = 1 / 0;
+        }
+        print("ok");
+    }
+    """
+    program = optimize(parse_program(input_code))
+    assert execute_program(program, make_executor()) == "ok"
+
+
+@pytest.mark.parametrize(
+    "expression", [
+        "9223372036854775806 + 10",
+        "\"text\" to int",
+        "1 + 1.5",
+    ]
+)
+def test_should_leave_failing_expression_for_runtime(expression):
+    input_code = f"""
+    void main(){{
+        print({expression});
+    }}
+    """
+    program = parse_program(input_code)
+    optimize(program)
+    assert not isinstance(main_statements(program)[0].arguments[0], (IntLiteral, FloatLiteral, StringLiteral))
+
+
+def test_should_propagate_single_assignment_locals(make_executor):
+    input_code = """
+    int scale(int x){
+        factor = 2 * 3;
+        offset = factor + 1;
+        return x * factor + offset;
+    }
+    void main(){
+        print(scale(2));
+    }
+    """
+    program = parse_program(input_code)
+    fold_constants(program)
+    statements = program.functions["scale"].statement_block.statements
+    assert statements[1].expression == IntLiteral(None, 7)
+    assert statements[2].expression.right == IntLiteral(None, 7)
+    assert execute_program(program, make_executor()) == "19"
+
+
+def test_should_not_propagate_reassigned_locals(make_executor):
+    input_code = """
+    void main(){
+        i = 0;
+        while(i < 3){
+            i = i + 1;
+        }
+        limit = 3;
+        if(true){
+            limit2 = limit;
+        }
+        print(i, limit);
+    }
+    """
+    program = parse_program(input_code)
+    fold_constants(program)
+    statements = main_statements(program)
+    assert isinstance(statements[1].condition.left, Variable)
+    assert statements[4].arguments == [Variable(None, "i"), IntLiteral(None, 3)]
+    assert execute_program(program, make_executor()) == "3 3"
+
+
+def test_should_fold_statically_known_conditions():
+    input_code = """
+    void main(){
+        debug = 1 > 2;
+        if(debug){
+            print("debug");
+        }
+        while(debug or 2 < 1){
+            print("loop");
+        }
+    }
+    """
+    program = parse_program(input_code)
+    fold_constants(program)
+    statements = main_statements(program)
+    assert statements[1].condition == BoolLiteral(None, "false")
+    assert statements[2].condition == BoolLiteral(None, "false")
+
+
+def test_should_fold_exception_attributes():
+    input_code = """
+    exception ValueError(int value){
+        message: string = "Value " + 5 to string;
+    }
+    void main(){
+        print(1);
+    }
+    """
+    program = parse_program(input_code)
+    fold_constants(program)
+    assert program.exceptions["ValueError"].attributes[0].expression == StringLiteral(None, "Value 5")
+
+
+def test_should_remove_statements_after_terminator(make_executor):
+    input_code = """
+    int first(int x){
+        return x;
+        print("unreachable");
+        x = 2;
+    }
+    void main(){
+        i = 0;
+        while(i < 3){
+            i = i + 1;
+            if(i == 2){
+                continue;
+                print("skipped");
+            }
+            print(first(i));
+            if(i == 3){
+                break;
+                i = 10;
+            }
+        }
+        throw BasicException("stop");
+        print("after throw");
+    }
+    """
+    program = parse_program(input_code)
+    eliminate_dead_code(program)
+    assert len(program.functions["first"].statement_block.statements) == 1
+    statements = main_statements(program)
+    assert len(statements) == 3
+    loop_body = statements[1].block.statements
+    assert len(loop_body[1].if_block.statements) == 1
+    assert len(loop_body[3].if_block.statements) == 1
+    captured_output = execute_program(program, make_executor())
+    assert captured_output.startswith("1\n3\n")
+    assert "stop" in captured_output
+
+
+def test_should_collapse_constant_if_chain(make_executor):
+    input_code = """
+    void main(){
+        x = 1;
+        if(false){
+            print("if");
+        }elif(x == 1){
+            print("elif");
+        }elif(true){
+            print("always");
+        }elif(x == 2){
+            print("never");
+        }else{
+            print("else");
+        }
+    }
+    """
+    program = parse_program(input_code)
+    eliminate_dead_code(program)
+    if_statement = main_statements(program)[1]
+    assert isinstance(if_statement.condition, EqualsExpression)
+    assert if_statement.elif_statement == []
+    assert if_statement.else_block.statements[0].arguments == [StringLiteral(None, "always")]
+    assert execute_program(program, make_executor()) == "elif"
+
+
+def test_should_replace_constant_if_with_taken_block(make_executor):
+    input_code = """
+    int sign(int x){
+        if(true){
+            return 1;
+        }
+        return 0;
+    }
+    void main(){
+        if(1 > 2){
+            print("never");
+        }
+        while(false){
+            print("never");
+        }
+        if(2 > 1){
+            x = sign(5);
+            print(x);
+        }else{
+            print("never");
+        }
+    }
+    """
+    program = optimize(parse_program(input_code))
+    statements = main_statements(program)
+    assert len(statements) == 1
+    assert isinstance(statements[0], StatementBlock)
+    assert len(program.functions["sign"].statement_block.statements) == 1
+    assert execute_program(program, make_executor()) == "1"
+
+
+def test_should_remove_unreachable_functions():
+    input_code = """
+    exception ValueError(int value){
+        message: string = describe(value);
+    }
+    string describe(int value){
+        return "Wrong value " + value to string;
+    }
+    int used(int x){
+        return helper(x);
+    }
+    int helper(int x){
+        return x;
+    }
+    int unused(int x){
+        return unused_helper(x);
+    }
+    int unused_helper(int x){
+        return x;
+    }
+    void main(){
+        print(used(1));
+    }
+    """
+    program = parse_program(input_code)
+    eliminate_dead_code(program)
+    assert set(program.functions) == {"main", "used", "helper", "describe"}
+
+
+def test_should_hoist_loop_invariant_expressions(make_executor):
+    input_code = """
+    int count(int limit, string s){
+        i = 0;
+        total = 0;
+        while(i < limit * 2){
+            total = total + s to int + i;
+            i = i + 1;
+        }
+        return total;
+    }
+    void main(){
+        print(count(3, "10"));
+        print(count(2, "1"));
+    }
+    """
+    program = parse_program(input_code)
+    hoist_loop_invariants(program)
+    loop = program.functions["count"].statement_block.statements[2]
+    assert isinstance(loop.condition.right, InvariantExpression)
+    assert isinstance(loop.block.statements[0].expression.left.right, InvariantExpression)
+    assert isinstance(loop.block.statements[1].expression, PlusExpression)
+    assert len(loop.invariant_slots) == 2
+    assert execute_program(program, make_executor()) == "75\n10"
+
+
+def test_should_not_hoist_calls_or_assigned_variables(make_executor):
+    input_code = """
+    int twice(int x){
+        return x * 2;
+    }
+    void main(){
+        i = 0;
+        step = 1;
+        while(i < 4){
+            print(twice(step) + 1);
+            if(i == 1){
+                step = step + 1;
+            }
+            i = i + step;
+        }
+    }
+    """
+    program = parse_program(input_code)
+    hoist_loop_invariants(program)
+    loop = main_statements(program)[2]
+    assert loop.invariant_slots == []
+    assert execute_program(program, make_executor()) == "3\n3\n5"
+
+
+@pytest.mark.parametrize("body, expected", [
+    ("while(len(a) < 3 and i < 5){ append(a, 1); i = i + 1; }", "2 3"),
+    ("while(a[0] < 2 and i < 5){ a[0] = a[0] + 1; i = i + 1; }", "2 1"),
+    ("while(len(m) < 1 and i < 5){ alias[i] = i; i = i + 1; }", "1 2"),
+    ("while(m != target and i < 5){ alias[1] = 1; i = i + 1; }", "1 2"),
+])
+def test_should_not_hoist_reads_of_mutated_collections(make_executor, body, expected):
+    input_code = f"""
+    void main(){{
+        a = array(1, 0);
+        m = map<int, int>{{}};
+        alias = m;
+        target = map<int, int>{{1: 1}};
+        i = 0;
+        {body}
+        print(i, len(a) + len(m));
+    }}
+    """
+    program = parse_program(input_code)
+    hoist_loop_invariants(program)
+    loop = main_statements(program)[5]
+    assert loop.invariant_slots == []
+    assert execute_program(program, make_executor()) == expected
+
+
+def test_should_reevaluate_invariants_on_each_loop_entry(make_executor):
+    input_code = """
+    void main(){
+        outer = 1;
+        while(outer <= 3){
+            inner = 0;
+            while(inner < outer * 2){
+                inner = inner + 1;
+            }
+            print(inner);
+            outer = outer + 1;
+        }
+    }
+    """
+    program = parse_program(input_code)
+    hoist_loop_invariants(program)
+    inner_loop = main_statements(program)[1].block.statements[1]
+    assert isinstance(inner_loop.condition.right, InvariantExpression)
+    assert execute_program(program, make_executor()) == "2\n4\n6"
+
+
+def test_hoisted_expression_keeps_error_in_place(make_executor):
+    input_code = """
+    void main(){
+        s = "not a number";
+        i = 0;
+        while(i < 2){
+            print(i);
+            if(i == 1){
+                print(s to int);
+            }
+            i = i + 1;
+        }
+    }
+    """
+    program = parse_program(input_code)
+    hoist_loop_invariants(program)
+    output = io.StringIO()
+    with pytest.raises(ValueError), contextlib.redirect_stdout(output):
+        make_executor().execute(program)
+    assert output.getvalue() == "0\n1\n"
+
+
+def test_hoisted_expression_is_not_evaluated_when_loop_is_skipped(make_executor):
+    input_code = """
+    void main(){
+        zero = 0;
+        i = 5;
+        while(i < 3){
+            print(10 / zero);
+        }
+        print("done");
+    }
+    """
+    program = parse_program(input_code)
+    hoist_loop_invariants(program)
+    assert execute_program(program, make_executor()) == "done"
+
+
+def test_should_inline_small_pure_functions(make_executor):
+    input_code = """
+    bool is_even(int number){
+        return number % 2 == 0;
+    }
+    int square(int x){
+        return x * x;
+    }
+    int square_plus(int x, int y){
+        return square(x) + y;
+    }
+    void main(){
+        number = 3;
+        while(number > 0){
+            print(is_even(number), square_plus(number, 1));
+            number = number - 1;
+        }
+    }
+    """
+    program = parse_program(input_code)
+    inlined = inline_functions(program)
+    assert inlined == {"is_even": 1, "square_plus": 1, "square": 1}
+    call = main_statements(program)[1].block.statements[0]
+    assert isinstance(call.arguments[0], InlinedCall)
+    assert isinstance(call.arguments[1].body.left, InlinedCall)
+    assert execute_program(program, make_executor()) == "false 10\ntrue 5\nfalse 2"
+
+
+def test_inlined_call_evaluates_arguments_once(make_executor):
+    input_code = """
+    int twice(int x){
+        return x + x;
+    }
+    int noisy(int x){
+        print("called");
+        return x;
+    }
+    void main(){
+        print(twice(noisy(2)));
+    }
+    """
+    program = parse_program(input_code)
+    assert inline_functions(program) == {"twice": 1}
+    assert execute_program(program, make_executor()) == "called\n4"
+
+
+@pytest.mark.parametrize(
+    "function", [
+        "int f(int x){ return f(x - 1); }",
+        "int f(int x){ print(x); return x; }",
+        "int f(int x){ y = x; return y; }",
+        "int f(int x){ return x + x + x + x + x + x + x + x + x + x; }",
+    ]
+)
+def test_should_not_inline_recursive_impure_or_large_functions(function):
+    input_code = f"""
+    {function}
+    void main(){{
+        print(f(1));
+    }}
+    """
+    program = parse_program(input_code)
+    assert inline_functions(program, threshold=16) == {}
+    assert isinstance(main_statements(program)[0].arguments[0], FunctionCall)
+
+
+def test_inlined_call_keeps_error_position(make_executor):
+    input_code = """
+    int half(int x){
+        return x / 0;
+    }
+    void main(){
+        print(half(4));
+    }
+    """
+    program = parse_program(input_code)
+    inline_functions(program)
+    with pytest.raises(DivisionByZeroError) as error:
+        execute_program(program, make_executor())
+    assert "Line 3" in str(error.value)
+
+
+def test_inlined_call_checks_return_type(make_executor):
+    input_code = """
+    int wrong(float x){
+        return x * 2.0;
+    }
+    void main(){
+        print(wrong(1.0));
+    }
+    """
+    program = parse_program(input_code)
+    inline_functions(program)
+    with pytest.raises(InvalidReturnedValueTypeException):
+        execute_program(program, make_executor())
+
+
+def test_optimize_should_remove_fully_inlined_functions():
+    input_code = """
+    int inc(int x){
+        return x + 1;
+    }
+    void main(){
+        print(inc(1));
+    }
+    """
+    report = Counter()
+    program = optimize(parse_program(input_code), inline_report=report)
+    assert report == {"inc": 1}
+    assert set(program.functions) == {"main"}
+
+
+def test_should_hoist_invariant_inlined_call(make_executor):
+    input_code = """
+    int scale(int x){
+        return x * 3;
+    }
+    void main(){
+        limit = 2;
+        i = 0;
+        while(i < scale(limit)){
+            print(scale(i));
+            i = i + 1;
+        }
+    }
+    """
+    program = optimize(parse_program(input_code))
+    loop = main_statements(program)[2]
+    assert isinstance(loop.condition.right, InvariantExpression)
+    assert isinstance(loop.block.statements[0].arguments[0], InlinedCall)
+    assert execute_program(program, make_executor()) == "0\n3\n6\n9\n12\n15"
+
+
+def test_should_mark_blocks_introducing_names():
+    input_code = """
+    void main(){
+        i = 0;
+        while(i < 3){
+            i = i + 1;
+            if(i == 2){
+                tmp = i;
+                print(tmp);
+            }else{
+                print(i);
+            }
+        }
+        try{
+            i = 5;
+        }catch(BasicException e){
+            message = "caught";
+        }
+    }
+    """
+    program = parse_program(input_code)
+    mark_scopes(program)
+    body = program.functions["main"].statement_block
+    loop, try_catch = body.statements[1], body.statements[2]
+    assert not body.needs_scope
+    assert not loop.block.needs_scope
+    assert loop.block.statements[1].if_block.needs_scope
+    assert not loop.block.statements[1].else_block.needs_scope
+    assert not try_catch.try_block.needs_scope
+    assert not try_catch.catch_statements[0].block.needs_scope
+
+
+def test_elided_scopes_keep_declarations_local(make_executor):
+    input_code = """
+    int count(int n){
+        total = 0;
+        while(n > 0){
+            step = n % 2;
+            total = total + step;
+            n = n - 1;
+        }
+        try{
+            throw BasicException("stop");
+        }catch(BasicException e){
+            step = "caught";
+            print(step);
+        }
+        step = 1.5;
+        return total;
+    }
+    void main(){
+        print(count(5));
+    }
+    """
+    captured_output = execute_program(parse_program(input_code), make_executor())
+    assert captured_output == "caught\n3"
+
+
+def test_should_resolve_casts_with_statically_known_source(make_executor):
+    input_code = """
+    int parse(string text){
+        return text to int;
+    }
+    void main(){
+        i = 0;
+        while(i < 3){
+            total = i to float + parse(i to string) to float;
+            print(total to string, (i == 1) to int);
+            i = i + 1;
+        }
+    }
+    """
+    program = parse_program(input_code)
+    assert resolve_casts(program) == 5
+    assert type(program.functions["parse"].statement_block.statements[0].expression) is CastedExpression
+    loop_body = main_statements(program)[1].block.statements
+    assert isinstance(loop_body[0].expression.left, ResolvedCastedExpression)
+    assert loop_body[0].expression.left.operation(2) == 2.0
+    assert execute_program(program, make_executor()) == "0.0 0\n2.0 1\n4.0 0"
+
+
+def test_should_not_resolve_casts_of_variables_with_unknown_type():
+    input_code = """
+    void show(int x){
+        print(x to string);
+    }
+    void main(){
+        value = input();
+        print(value to int);
+        if(true){
+            mixed = 1;
+        }else{
+            mixed = "one";
+        }
+        print(mixed to string);
+    }
+    """
+    program = parse_program(input_code)
+    assert resolve_casts(program) == 0
+
+
+def test_should_resolve_casts_in_exception_attributes():
+    input_code = """
+    exception ValueError(int value){
+        message: string = "Wrong value=" + value to string;
+    }
+    void main(){
+        print(1);
+    }
+    """
+    program = parse_program(input_code)
+    assert resolve_casts(program) == 1
+    assert isinstance(program.exceptions["ValueError"].attributes[0].expression.right, ResolvedCastedExpression)
+
+
+def test_should_build_catch_tables_in_source_order():
+    code = """
+    exception FirstError(int value) {
+        message: string = "first";
+    }
+    exception SecondError(int value) {
+        message: string = "second";
+    }
+    void main(){
+        try{
+            try{}
+            catch(SecondError e){}
+            catch(BasicException e){}
+            catch(FirstError e){}
+        }
+        catch(FirstError e){}
+    }
+    """
+    program = parse_program(code)
+    build_catch_tables(program, ["FirstError", "SecondError"])
+    outer = program.functions["main"].statement_block.statements[0]
+    inner = outer.try_block.statements[0]
+
+    assert {name: catch.exception for name, catch in inner.catch_table.items()} == {
+        "FirstError": "BasicException", "SecondError": "SecondError", "BasicException": "BasicException"}
+    assert {name: catch.exception for name, catch in outer.catch_table.items()} == {"FirstError": "FirstError"}
+
+
+def test_should_resolve_catch_tables_through_exception_lineage():
+    parents = {"ParseError": "InputError"}
+    assert exception_lineage("ParseError", parents) == ("ParseError", "InputError", "BasicException")
+    assert exception_lineage("BasicException", parents) == ("BasicException",)
+
+    program = parse_program("""
+    void main(){
+        try{}
+        catch(InputError e){}
+        catch(ParseError e){}
+    }
+    """)
+    build_catch_tables(program, ["InputError", "ParseError", "OtherError"], parents)
+    try_catch = program.functions["main"].statement_block.statements[0]
+    assert {name: catch.exception for name, catch in try_catch.catch_table.items()} == {
+        "InputError": "InputError", "ParseError": "InputError"}
+
+
+def test_should_unwind_throws_through_inlined_calls(make_executor):
+    code = """
+    int checked(int value){
+        if(value < 0){
+            throw BasicException("negative " + value to string);
+        }
+        return value;
+    }
+    int twice(int value){
+        return checked(value) * 2;
+    }
+    void main(){
+        values = array(4, 1);
+        values[2] = -3;
+        for (value in values){
+            try{
+                print(twice(value) + twice(1));
+            }catch(BasicException e){
+                print(e.message);
+            }
+        }
+    }
+    """
+    program = parse_program(code)
+    optimize(program)
+    assert execute_program(program, make_executor()) == "4\n4\nnegative -3\n4"
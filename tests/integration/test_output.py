@@ -0,0 +1,100 @@
+import contextlib
+import io
+import os
+
+import pytest
+
+from src.errors.interpreter_errors import *
+from src.interpreter.executor import ProgramExecutor
+from src.interpreter.output import StreamSink, FileDescriptorSink
+from tests.integration.helpers import parse_program
+
+
+PRINTS = """
+void main(){
+    i = 0;
+    while(i < 50){
+        print(i, i to float / 3.0, i % 2 == 0, "text", "");
+        i = i + 1;
+    }
+    print();
+    print("zażółć");
+}
+"""
+
+
+def execute_program(program, executor: ProgramExecutor) -> str:
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        executor.execute(program)
+
+    return output.getvalue()
+
+
+def expected_output() -> str:
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        for i in range(50):
+            print(i, round(float(i) / 3.0, 15), "true" if i % 2 == 0 else "false", "text", "")
+        print()
+        print("zażółć")
+    return output.getvalue()
+
+
+@pytest.mark.parametrize("buffer_size", [0, 10, 1 << 16])
+def test_should_write_same_output_as_print(make_executor, buffer_size):
+    output = execute_program(parse_program(PRINTS), make_executor(output=StreamSink(buffer_size=buffer_size)))
+    assert output == expected_output()
+
+
+def test_should_write_to_file_descriptor(make_executor):
+    read_fd, write_fd = os.pipe()
+    try:
+        make_executor(output=FileDescriptorSink(write_fd, buffer_size=100)).execute(parse_program(PRINTS))
+        os.close(write_fd)
+        with os.fdopen(read_fd, encoding="utf-8") as pipe:
+            assert pipe.read() == expected_output()
+    finally:
+        with contextlib.suppress(OSError):
+            os.close(write_fd)
+
+
+def test_should_flush_before_input(make_executor, monkeypatch):
+    code = """
+    void main(){
+        print("name?");
+        name = input();
+        print("hello", name);
+    }
+    """
+    output = io.StringIO()
+    monkeypatch.setattr("builtins.input", lambda: output.getvalue().strip() + "!")
+    with contextlib.redirect_stdout(output):
+        make_executor().execute(parse_program(code))
+
+    assert output.getvalue() == "name?\nhello name?!\n"
+
+
+def test_should_flush_before_uncaught_errors(make_executor):
+    code = """
+    void main(){
+        print("before");
+        a = 1 / 0;
+    }
+    """
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output), pytest.raises(DivisionByZeroError):
+        make_executor().execute(parse_program(code))
+
+    assert output.getvalue() == "before\n"
+
+
+def test_should_write_uncaught_exception_after_output(make_executor):
+    code = """
+    void main(){
+        print("before");
+        throw BasicException("boom");
+    }
+    """
+    output = execute_program(parse_program(code), make_executor())
+    assert output.startswith("before\n\033[31m") and output.endswith("\033[0m\n")
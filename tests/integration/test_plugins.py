@@ -0,0 +1,134 @@
+import zlib
+
+import pytest
+
+from src.ast.types import Type
+from src.errors.interpreter_errors import *
+from src.interpreter.builtins import BasicException
+from src.interpreter.executor import ProgramExecutor
+from src.interpreter.interpreter import Interpreter
+from src.interpreter.plugins import PluginRegistry, load_plugin, discover_plugins
+from tests.integration.helpers import execute_code, parse_program
+
+
+PLUGIN_MODULE = """
+import zlib
+
+from src.ast.types import Type
+
+
+def register(registry):
+    registry.add_function("crc32", lambda text: zlib.crc32(text.encode()), {(Type.StringType,): Type.IntType})
+"""
+
+
+class ChecksumError(BasicException):
+    def __init__(self, position, expected: int, actual: int):
+        super().__init__(position, "checksum mismatch")
+        self.name = "ChecksumError"
+        self.attributes.update(expected=expected, actual=actual)
+
+
+def checksum_registry() -> PluginRegistry:
+    registry = PluginRegistry()
+
+    @registry.function(signatures={(Type.StringType,): Type.IntType})
+    def crc32(text: str) -> int:
+        return zlib.crc32(text.encode())
+
+    registry.add_exception("ChecksumError", ChecksumError)
+    return registry
+
+
+def test_should_call_plugin_functions_and_throw_plugin_exceptions(make_executor):
+    code = """
+    void verify(string text, int expected){
+        actual = crc32(text);
+        if(actual != expected){
+            throw ChecksumError(expected, actual);
+        }
+        print("ok", actual);
+    }
+    void main(){
+        verify("abc", 891568578);
+        try {
+            verify("abd", 1);
+        } catch (ChecksumError e) {
+            print(e.message, e.expected, e.actual);
+        }
+    }
+    """
+    assert execute_code(code, make_executor(plugins=checksum_registry())) == (
+        f"ok 891568578\nchecksum mismatch 1 {zlib.crc32(b'abd')}")
+
+
+def test_should_check_plugin_signatures(make_executor):
+    code = """
+    void main(){
+        print(crc32(1));
+    }
+    """
+    with pytest.raises(WrongExpressionTypeError):
+        execute_code(code, make_executor(plugins=checksum_registry()))
+
+
+def test_should_pass_values_to_plugins_without_copying(make_executor):
+    received = []
+    registry = PluginRegistry()
+    registry.add_function("keep", lambda *values: received.extend(values))
+    program = parse_program("""
+    void main(){
+        text = "payload";
+        keep(text, 12345678901, 1.5, true);
+    }
+    """)
+    literal = program.functions["main"].statement_block.statements[0].expression.value
+
+    make_executor(plugins=registry).execute(program)
+    assert received[0] is literal and received[1:] == [12345678901, 1.5, True]
+
+
+@pytest.mark.parametrize("name", ["len", "pow", "print", "input", "open"])
+def test_should_reject_plugins_replacing_builtins(name):
+    registry = PluginRegistry()
+    with pytest.raises(ValueError):
+        registry.add_function(name, lambda *values: 0)
+    assert registry.functions == {}
+
+
+def test_cli_should_report_plugins_replacing_builtins(tmp_path, monkeypatch, capsys):
+    (tmp_path / "len_plugin.py").write_text("def register(registry):\n    registry.add_function('len', lambda text: 0)\n")
+    (tmp_path / "program.xD").write_text('void main(){ print(len("abc")); }')
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    with pytest.raises(SystemExit):
+        Interpreter().run([str(tmp_path / "program.xD"), "--plugin", "len_plugin", "--optimize"])
+    assert "Cannot load plugin len_plugin" in capsys.readouterr().err
+
+
+def test_should_load_plugin_module(tmp_path, monkeypatch):
+    (tmp_path / "checksum_plugin.py").write_text(PLUGIN_MODULE)
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    registry = load_plugin("checksum_plugin")
+    assert execute_code('void main(){ print(crc32("abc")); }', ProgramExecutor(plugins=registry)) == "891568578"
+
+
+def test_should_discover_entry_point_plugins(monkeypatch):
+    class EntryPoint:
+        @staticmethod
+        def load():
+            return lambda registry: registry.update(checksum_registry())
+
+    monkeypatch.setattr("src.interpreter.plugins.entry_points", lambda group: [EntryPoint()])
+    registry = discover_plugins()
+    assert set(registry.functions) == {"crc32"} and set(registry.exceptions) == {"ChecksumError"}
+
+
+def test_cli_should_load_plugins(tmp_path, monkeypatch, capsys):
+    (tmp_path / "checksum_plugin.py").write_text(PLUGIN_MODULE)
+    (tmp_path / "program.xD").write_text('void main(){ print(crc32("abc")); }')
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    Interpreter().run([str(tmp_path / "program.xD"), "--plugin", "checksum_plugin"])
+    assert capsys.readouterr().out == "891568578\n"
@@ -0,0 +1,89 @@
+import pytest
+
+from src.ast.expressions import *
+from src.ast.quickened import *
+from src.errors.interpreter_errors import *
+from src.interpreter.executor import ProgramExecutor
+from tests.integration.helpers import execute_program, parse_program
+
+
+SHOW = """
+void show(int a, int b){{
+    print(a + b, a < b, a to string);
+}}
+void main(){{
+    {calls}
+}}
+"""
+
+
+def show_arguments(program):
+    return program.functions["show"].statement_block.statements[0].arguments
+
+
+def test_should_quicken_nodes_after_first_execution(make_executor):
+    program = parse_program(SHOW.format(calls="show(1, 2); show(3, 2);"))
+    assert execute_program(program, make_executor()) == "3 true 1\n5 false 3"
+
+    plus, less_than, cast = show_arguments(program)
+    assert type(plus) is QuickPlusExpression and plus.guard is int
+    assert type(less_than) is QuickLessThanExpression and less_than.guard is int
+    assert type(cast) is QuickenedCastedExpression and cast.guard is int
+    assert isinstance(plus, PlusExpression)
+
+
+def test_should_deoptimize_when_guard_fails(make_executor):
+    program = parse_program(SHOW.format(calls="show(1, 2); show(1.5, 2.5); show(\"a\", \"b\"); show(1, 2);"))
+    captured_output = execute_program(program, make_executor())
+    assert captured_output == "3 true 1\n4.0 true 1.5\nab true a\n3 true 1"
+
+    for node in show_arguments(program):
+        assert type(node) in (PlusExpression, LessThanExpression, CastedExpression)
+        assert node.deoptimized
+
+
+def test_quickened_node_keeps_type_errors(make_executor):
+    program = parse_program(SHOW.format(calls="show(1, 2); show(1, 2.5);"))
+    with pytest.raises(NotMatchingTypesInBinaryExpression):
+        execute_program(program, make_executor())
+
+
+def test_quickened_node_keeps_overflow_check(make_executor):
+    program = parse_program(SHOW.format(calls="show(1, 2); show(9223372036854775800, 100);"))
+    with pytest.raises(ValueOverflowError):
+        execute_program(program, make_executor())
+
+
+def test_quickened_float_arithmetic_is_rounded(make_executor):
+    input_code = """
+    float add(float a, float b){
+        return a + b;
+    }
+    void main(){
+        print(add(1.0, 2.0), add(0.1, 0.2));
+    }
+    """
+    assert execute_program(parse_program(input_code), make_executor()) == "3.0 0.3"
+
+
+def test_quickened_node_with_calls(make_executor):
+    input_code = """
+    int fibonacci(int n){
+        if(n < 3){
+            return 1;
+        }
+        return fibonacci(n - 2) + fibonacci(n - 1);
+    }
+    void main(){
+        print(fibonacci(15));
+    }
+    """
+    program = parse_program(input_code)
+    assert execute_program(program, make_executor()) == "610"
+    assert execute_program(program, make_executor()) == "610"
+
+
+def test_should_not_quicken_when_disabled():
+    program = parse_program(SHOW.format(calls="show(1, 2);"))
+    execute_program(program, ProgramExecutor(quicken=False))
+    assert [type(node) for node in show_arguments(program)] == [PlusExpression, LessThanExpression, CastedExpression]
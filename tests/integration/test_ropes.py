@@ -0,0 +1,102 @@
+import pytest
+
+from src.errors.interpreter_errors import *
+from tests.integration.helpers import execute_code
+
+
+@pytest.mark.parametrize("ropes", [True, False])
+def test_should_accumulate_strings(make_executor, ropes):
+    code = """
+    string digit(int i){
+        return (i % 10) to string;
+    }
+    void main(){
+        i = 0;
+        s = "";
+        while(i < 12){
+            s = s + digit(i) + ",";
+            if(i % 4 == 3){
+                copy = s;
+                s = s + s to string + "|";
+                copy = copy + "!";
+                print(copy == s, copy);
+            }
+            i = i + 1;
+        }
+        print(s, s == "0,1,2,3,0,1,2,3,|4,5,6,7,0,1,2,3,0,1,2,3,|4,5,6,7,|8,9,0,1,", s to bool);
+    }
+    """
+    assert execute_code(code, make_executor(ropes=ropes)).splitlines() == [
+        "false 0,1,2,3,!",
+        "false 0,1,2,3,0,1,2,3,|4,5,6,7,!",
+        "false 0,1,2,3,0,1,2,3,|4,5,6,7,0,1,2,3,0,1,2,3,|4,5,6,7,|8,9,0,1,!",
+        "0,1,2,3,0,1,2,3,|4,5,6,7,0,1,2,3,0,1,2,3,|4,5,6,7,|8,9,0,1,0,1,2,3,0,1,2,3,|4,5,6,7,0,1,2,3,0,1,2,3,|4,5,6,7,|8,9,0,1,| false true",
+    ]
+
+
+def test_should_pass_accumulated_string_to_functions_and_exceptions(make_executor):
+    code = """
+    exception TooLong(string text) {
+        message: string = "too long: " + text;
+    }
+    int length(string text){
+        return text to int;
+    }
+    void main(){
+        s = "1";
+        s = s + "2";
+        print(length(s));
+        try {
+            s = s + "3";
+            throw TooLong(s);
+        } catch (TooLong e) {
+            print(e.message);
+        }
+    }
+    """
+    assert execute_code(code, make_executor(ropes=True)) == "12\ntoo long: 123"
+
+
+def test_should_keep_string_when_appended_expression_throws(make_executor):
+    code = """
+    string fail(){
+        throw BasicException("boom");
+        return "";
+    }
+    void main(){
+        s = "a";
+        s = s + "b";
+        try {
+            s = s + "c" + fail();
+        } catch (BasicException e) {
+            print(s);
+        }
+    }
+    """
+    assert execute_code(code, make_executor(ropes=True)) == "ab"
+
+
+@pytest.mark.parametrize("value, error", [("1", NotMatchingTypesInBinaryExpression),
+                                          ("true", WrongExpressionTypeError)])
+def test_should_reject_appending_non_strings(make_executor, value, error):
+    code = f"""
+    void main(){{
+        s = "a";
+        s = s + "b";
+        s = s + {value};
+    }}
+    """
+    with pytest.raises(error):
+        execute_code(code, make_executor(ropes=True))
+
+
+def test_should_reject_assigning_other_type_to_accumulated_string(make_executor):
+    code = """
+    void main(){
+        s = "a";
+        s = s + "b";
+        s = 1;
+    }
+    """
+    with pytest.raises(WrongExpressionTypeError):
+        execute_code(code, make_executor(ropes=True))
@@ -0,0 +1,74 @@
+import pytest
+
+from src.errors.interpreter_errors import *
+from src.interpreter.stack_executor import StackExecutor
+from tests.integration.helpers import execute_code
+
+
+COUNTDOWN = """
+int countdown(int n){{
+    if (n == 0){{
+        return 0;
+    }}
+    return countdown(n - 1) + 1;
+}}
+void main(){{
+    print(countdown({depth}));
+}}
+"""
+
+
+def test_should_execute_recursion_deeper_than_python_stack():
+    captured_output = execute_code(COUNTDOWN.format(depth=20000), StackExecutor())
+    assert captured_output == "20000"
+
+
+def test_should_raise_when_recursion_exceeds_limit():
+    with pytest.raises(RecursionTooDeepError):
+        execute_code(COUNTDOWN.format(depth=200), StackExecutor(recursion_limit=100))
+
+
+def test_should_raise_when_evaluation_stack_exceeds_limit():
+    with pytest.raises(EvaluationStackOverflowError):
+        execute_code(COUNTDOWN.format(depth=200), StackExecutor(stack_limit=100))
+
+
+def test_should_track_evaluation_stack_depth():
+    executor = StackExecutor()
+    execute_code(COUNTDOWN.format(depth=100), executor)
+    assert executor.max_stack_depth > 100
+
+
+def test_should_execute_try_block_inside_call_free_function(make_executor):
+    input_code = """
+    int func1(){
+        x = 1;
+        try{
+            x = 2;
+        }catch(BasicException e){
+            x = 3;
+        }
+        return x;
+    }
+    void main(){
+        print(func1());
+    }
+    """
+    captured_output = execute_code(input_code, make_executor())
+    assert captured_output == "2"
+
+
+def test_should_raise_inside_call_free_try_block(make_executor):
+    input_code = """
+    void main(){
+        while(true){
+            try{
+                x = 1 / 0;
+            }catch(BasicException e){
+                print("caught");
+            }
+        }
+    }
+    """
+    with pytest.raises(DivisionByZeroError):
+        execute_code(input_code, make_executor())
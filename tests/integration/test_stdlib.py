@@ -0,0 +1,150 @@
+import pytest
+
+from src.ast.expressions import *
+from src.ast.quickened import ResolvedCastedExpression
+from src.ast.statemens import *
+from src.errors.interpreter_errors import *
+from src.interpreter.input_source import LineInput
+from src.interpreter.stdlib import STDLIB
+from src.optimizer.cast_resolution import resolve_casts
+from src.optimizer.constant_folding import fold_constants
+from src.optimizer.purity import find_pure_functions
+from tests.integration.helpers import execute_program, parse_program
+
+
+def print_expression(expression: str) -> str:
+    return f"""
+    void main(){{
+        print({expression});
+    }}
+    """
+
+
+@pytest.mark.parametrize("expression, expected", [
+    ('len("zażółć")', "6"),
+    ('substr("interpreter", 5, 3)', "pre"),
+    ('substr("abc", 1, 10)', "bc"),
+    ('find("interpreter", "pre")', "5"),
+    ('find("interpreter", "x")', "-1"),
+    ('replace("a-b-c", "-", "+")', "a+b+c"),
+    ('upper("Abc")', "ABC"),
+    ('lower("AbC")', "abc"),
+    ("pow(2, 10)", "1024"),
+    ("pow(2.0, 0.5)", "1.414213562373095"),
+    ("pow(-8.0, 3.0)", "-512.0"),
+    ("sqrt(16)", "4.0"),
+    ("sqrt(2.25)", "1.5"),
+    ("abs(-3)", "3"),
+    ("abs(-2.5)", "2.5"),
+    ("min(3, -4)", "-4"),
+    ("max(1.5, 0.5)", "1.5"),
+    ("floor(-2.5)", "-3"),
+    ("round(2.675)", "3"),
+    ("round(2.4567, 2)", "2.46"),
+    ('len(upper("ab") + lower("CD"))', "4"),
+])
+def test_should_call_stdlib_functions(make_executor, expression, expected):
+    program = parse_program(print_expression(expression))
+    assert execute_program(program, make_executor()) == expected
+
+
+@pytest.mark.parametrize("expression, error", [
+    ("len(1)", WrongExpressionTypeError),
+    ('len("a", "b")', WrongNumberOfArguments),
+    ("pow(2, 1.0)", WrongExpressionTypeError),
+    ("floor(1)", WrongExpressionTypeError),
+    ('substr("abc", -1, 2)', InvalidArgumentError),
+    ("sqrt(-1.0)", InvalidArgumentError),
+    ("pow(2, -1)", InvalidArgumentError),
+    ("pow(3, 64)", InvalidArgumentError),
+    ("pow(2, 63)", ValueOverflowError),
+    ("pow(-8.0, 0.5)", InvalidArgumentError),
+    ("pow(10.0, 400.0)", InvalidArgumentError),
+])
+def test_should_reject_invalid_stdlib_calls(make_executor, expression, error):
+    program = parse_program(print_expression(expression))
+    with pytest.raises(error):
+        execute_program(program, make_executor())
+
+
+def test_program_functions_shadow_stdlib(make_executor):
+    code = """
+    int len(string text){
+        return 42;
+    }
+    void main(){
+        print(len("abc"));
+    }
+    """
+    program = parse_program(code)
+    fold_constants(program)
+    assert execute_program(program, make_executor()) == "42"
+
+
+def test_input_should_ignore_prompt_argument(make_executor):
+    program = parse_program(print_expression('input("name: "), input()'))
+    executor = make_executor(input_provider=LineInput(["ada", "lovelace"]))
+    assert execute_program(program, executor) == "ada lovelace"
+
+
+def test_should_fold_stdlib_calls_with_constant_arguments():
+    code = """
+    void main(){
+        a = len("abc") + pow(2, 3);
+        b = sqrt(-1.0);
+    }
+    """
+    program = parse_program(code)
+    fold_constants(program)
+    first, second = program.functions["main"].statement_block.statements
+    assert isinstance(first.expression, IntLiteral) and first.expression.value == 11
+    assert isinstance(second.expression, FunctionCall)
+
+
+def test_should_not_fold_stdlib_calls_returning_arrays(monkeypatch):
+    def new_array(length, value):
+        raise AssertionError("array() evaluated while folding")
+
+    monkeypatch.setitem(STDLIB, "array", (new_array, STDLIB["array"][1]))
+    code = """
+    void main(){
+        if(false){
+            a = array(50000000, 0);
+            print(len(copy(array(2, 1.5))));
+        }
+    }
+    """
+    program = parse_program(code)
+    fold_constants(program)
+    first, second = program.functions["main"].statement_block.statements[0].if_block.statements
+    assert isinstance(first.expression, FunctionCall)
+    assert isinstance(second.arguments[0], FunctionCall)
+
+
+def test_functions_calling_stdlib_are_pure():
+    code = """
+    int width(string text){
+        return max(len(text), 4);
+    }
+    int ask(){
+        return len(input());
+    }
+    void main(){
+        print(width("abc"), ask());
+    }
+    """
+    assert find_pure_functions(parse_program(code)) == {"width"}
+
+
+def test_should_resolve_casts_of_stdlib_results():
+    code = """
+    void main(){
+        print(len("abc") to string, sqrt(2) to int, min(1, 2.0) to string);
+    }
+    """
+    program = parse_program(code)
+    assert resolve_casts(program) == 2
+    first, second, third = program.functions["main"].statement_block.statements[0].arguments
+    assert type(first) is ResolvedCastedExpression and first.guard is int
+    assert type(second) is ResolvedCastedExpression and second.guard is float
+    assert type(third) is CastedExpression
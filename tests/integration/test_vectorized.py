@@ -0,0 +1,166 @@
+import os
+
+import pytest
+
+from src.errors.interpreter_errors import *
+from src.interpreter import vectorized
+from src.optimizer.cast_resolution import resolve_casts
+from src.optimizer.optimizer import optimize
+from tests.integration.helpers import execute_program, parse_program
+
+
+@pytest.fixture(params=["numpy", "python"])
+def backend(request, monkeypatch):
+    if request.param == "numpy":
+        if not os.environ.get("XD_REQUIRE_NUMPY"):
+            pytest.importorskip("numpy")
+        assert vectorized.numpy is not None, "numpy backend required by XD_REQUIRE_NUMPY"
+    else:
+        monkeypatch.setattr(vectorized, "numpy", None)
+    return request.param
+
+
+def with_arrays(body: str) -> str:
+    return f"""
+    int[] ints(int first, int second, int third){{
+        result = array(0, 0);
+        append(result, first);
+        append(result, second);
+        append(result, third);
+        return result;
+    }}
+    float[] floats(float first, float second){{
+        result = array(0, 0.0);
+        append(result, first);
+        append(result, second);
+        return result;
+    }}
+    void main(){{
+        a = ints(-7, 1, 4);
+        b = ints(2, 2, 3);
+        f = floats(0.1, 2.5);
+        {body}
+    }}
+    """
+
+
+@pytest.mark.parametrize("expression, expected", [
+    ("a + b", "[-5, 3, 7]"),
+    ("a * 2 + b", "[-12, 4, 11]"),
+    ("10 - a", "[17, 9, 6]"),
+    ("a / b", "[-4, 0, 1]"),
+    ("a % b", "[1, 1, 1]"),
+    ("-a", "[7, -1, -4]"),
+    ("f + 0.2", "[0.3, 2.7]"),
+    ("f * f", "[0.01, 6.25]"),
+    ("1.0 / f", "[10.0, 0.4]"),
+    ("f / 3.0", "[0.033333333333333, 0.833333333333333]"),
+    ("f * 1.1", "[0.11, 2.75]"),
+    ("a > 0", "[0, 1, 1]"),
+    ("a == b", "[0, 0, 0]"),
+    ("0.1 <= f", "[1, 1]"),
+    ("sum(a >= b)", "1"),
+    ("array(0, 0) * array(0, 0)", "[]"),
+])
+def test_should_evaluate_elementwise_expressions(make_executor, backend, expression, expected):
+    program = parse_program(with_arrays(f"print({expression});"))
+    assert execute_program(program, make_executor(numeric_mode="strict")) == expected
+
+
+@pytest.mark.parametrize("expression, error", [
+    ("a + f", NotMatchingTypesInBinaryExpression),
+    ("a * 2.0", NotMatchingTypesInBinaryExpression),
+    ('a + "x"', NotMatchingTypesInBinaryExpression),
+    ("a > 0.5", NotMatchingTypesInBinaryExpression),
+    ("a + array(2, 1)", ArrayLengthMismatchError),
+    ("b / (a - a)", DivisionByZeroError),
+    ("a % 0", DivisionByZeroError),
+    ("true + a", WrongExpressionTypeError),
+    ("array(2, 3037000500) * 3037000500", ValueOverflowError),
+    ("array(1, 4611686018427387904) + array(1, 4611686018427387904)", ValueOverflowError),
+    ("array(1, 1000000000000000000.0) * 10.0", ValueOverflowError),
+])
+def test_should_keep_scalar_type_rules(make_executor, backend, expression, error):
+    program = parse_program(with_arrays(f"print({expression});"))
+    with pytest.raises(error):
+        execute_program(program, make_executor(numeric_mode="strict"))
+
+
+@pytest.mark.parametrize("number_precision", [1, 2, 15])
+def test_strict_array_rounding_matches_scalar_rounding(make_executor, backend, number_precision):
+    code = """
+    void main(){
+        values = array(0, 0.0);
+        for (i in -300..300){
+            append(values, i to float * 0.005);
+        }
+        scaled = values * 1.1;
+        for (i in 0..len(values)){
+            print(scaled[i], values[i] * 1.1);
+        }
+    }
+    """
+    executor = make_executor(numeric_mode="strict", number_precision=number_precision)
+    output = execute_program(parse_program(code), executor)
+    for line in output.splitlines():
+        vector_result, scalar_result = line.split()
+        assert vector_result == scalar_result
+
+
+def test_should_round_floats_only_in_strict_mode(make_executor, backend):
+    program = parse_program(with_arrays("print(f + 0.2);"))
+    assert execute_program(program, make_executor(numeric_mode="fast")) == "[0.30000000000000004, 2.7]"
+
+
+@pytest.mark.parametrize("operator", ["==", "!=", "<", "<=", ">", ">="])
+@pytest.mark.parametrize("threshold, element", [("0.3", "0.3"), ("2.7", "2.7"), ("array(2, 0.3)", "0.3")])
+def test_fast_mode_array_comparisons_match_scalar_comparisons(make_executor, backend, operator, threshold, element):
+    code = with_arrays(f"""
+        g = f + 0.2;
+        c = g {operator} {threshold};
+        i = 0;
+        while(i < len(g)){{
+            print(c[i], (g[i] {operator} {element}) to int);
+            i = i + 1;
+        }}
+    """)
+    output = execute_program(parse_program(code), make_executor(numeric_mode="fast"))
+    for line in output.splitlines():
+        vector_result, scalar_result = line.split()
+        assert vector_result == scalar_result
+
+
+@pytest.mark.parametrize("expression", [
+    "array(1, 1000000000000000000.0) * 10.0",
+    "(f * 1000000000000000000.0) * (f * 10.0)",
+    "array(2, 9000000000000000000.0) + array(2, 9000000000000000000.0)",
+])
+def test_should_reject_overflowing_float_arrays_in_fast_mode(make_executor, backend, expression):
+    program = parse_program(with_arrays(f"print({expression});"))
+    with pytest.raises(ValueOverflowError):
+        execute_program(program, make_executor(numeric_mode="fast"))
+
+
+def test_should_not_reuse_hoisted_array_results(make_executor, backend):
+    code = with_arrays("""
+        i = 0;
+        while(i < 3){
+            print(a * 2);
+            a[i] = 0;
+            i = i + 1;
+        }
+    """)
+    program = parse_program(code)
+    optimize(program)
+    assert execute_program(program, make_executor(numeric_mode="strict")) == "[-14, 2, 8]\n[0, 2, 8]\n[0, 0, 8]"
+
+
+def test_array_comparisons_are_not_resolved_as_bool_casts():
+    code = """
+    void main(){
+        a = array(2, 1);
+        i = 1;
+        print((a > 0) to string, (i > 0) to string);
+    }
+    """
+    assert resolve_casts(parse_program(code)) == 1